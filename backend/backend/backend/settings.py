@@ -89,6 +89,20 @@ DATABASES = {
 }
 
 
+# Cache
+# Backs the catalog response cache (core/catalog_cache.py). The version counter
+# that invalidates it lives here too, so multi-worker deployments should point
+# this at a shared backend (Redis/Memcached) instead of per-process memory.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+CATALOG_CACHE_TIMEOUT = 60 * 60
+
+
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
 
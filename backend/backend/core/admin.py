@@ -1,9 +1,11 @@
-from .models import Trip, Profile, Enquiry, SiteStat, InternationalSectionConfig, IndiaSectionConfig, NorthIndiaSectionConfig, HoneymoonSectionConfig, HimalayanSectionConfig, BackpackingSectionConfig, SummerSectionConfig, MonsoonSectionConfig, CommunitySectionConfig, FestivalSectionConfig, AdventureSectionConfig, BikingSectionConfig, LongWeekendSectionConfig, HimachalSectionConfig, UttarakhandSectionConfig, GirlsSectionConfig, Category, Coupon
+from .models import Trip, TripBatch, TripPriceOption, TripSection, Profile, Enquiry, SiteStat, SectionConfig, Category, Coupon
+from .inventory import batches_in_use
+from .sections import SECTION_CHOICES
+from django import forms
 from django.contrib import admin
 # Register your models here.
 
 
-
 @admin.register(Category)
 class CategoryAdmin(admin.ModelAdmin):
     list_display = ("name", "slug", "emoji")
@@ -11,45 +13,77 @@ class CategoryAdmin(admin.ModelAdmin):
     prepopulated_fields = {"slug": ("name",)}
 
 
+class TripSectionForm(forms.ModelForm):
+    section = forms.ChoiceField(choices=SECTION_CHOICES)
+
+    class Meta:
+        model = TripSection
+        fields = "__all__"
+
+
+class TripSectionInline(admin.TabularInline):
+    model = TripSection
+    form = TripSectionForm
+    fields = ("section", "visible", "display_order", "featured_priority")
+    extra = 0
+
+
+class TripBatchInlineFormSet(forms.BaseInlineFormSet):
+    """Refuses to delete batches with seats sold or held, as the API does (check_batches_removable)."""
+
+    def clean(self):
+        super().clean()
+        removed = [form.instance.pk for form in self.forms if form.instance.pk and self._should_delete_form(form)]
+        in_use = batches_in_use(TripBatch.objects.filter(pk__in=removed))
+        dates = [str(start_date) for start_date in in_use.values_list("start_date", flat=True)]
+        if dates:
+            raise forms.ValidationError(
+                f"The batches departing {', '.join(dates)} have bookings or held seats and cannot be removed; "
+                "set them to Full instead."
+            )
+
+
+class TripBatchInline(admin.TabularInline):
+    model = TripBatch
+    formset = TripBatchInlineFormSet
+    fields = ("start_date", "end_date", "status", "capacity", "seats_booked")
+    readonly_fields = ("seats_booked",)
+    extra = 0
+
+
+class TripPriceOptionInline(admin.TabularInline):
+    model = TripPriceOption
+    fields = ("occupancy", "price", "position")
+    extra = 0
+
+
+class SectionListFilter(admin.SimpleListFilter):
+    title = "section"
+    parameter_name = "section"
+
+    def lookups(self, request, model_admin):
+        return SECTION_CHOICES
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(section_memberships__section=self.value())
+        return queryset
+
+
 @admin.register(Trip)
 class TripAdmin(admin.ModelAdmin):
     #inlines = [TripGalleryImageInline]
+    inlines = [TripSectionInline, TripBatchInline, TripPriceOptionInline]
     list_display = (
         "title", "location", "country", "state", "category", "price", "is_active", "is_featured",
-        "is_international", "show_in_international_section", "display_order",
-        "is_india_trip", "show_in_india_section", "india_display_order",
-        "is_north_india_trip", "show_in_north_india_section", "north_india_display_order",
-        "is_honeymoon", "show_in_honeymoon_section", "honeymoon_display_order", "honeymoon_featured_priority",
-        "is_himalayan_trek", "show_in_himalayan_section", "himalayan_display_order",
-        "is_backpacking_trip", "show_in_backpacking_section", "backpacking_display_order", "backpacking_featured_priority",
-        "is_summer_trek", "show_in_summer_section", "summer_display_order", "summer_featured_priority",
-        "is_monsoon_trek", "show_in_monsoon_section", "monsoon_display_order", "monsoon_featured_priority",
-        "is_community_trip", "show_in_community_section", "community_display_order",
-        "is_festival_trip", "show_in_festival_section", "festival_display_order",
-        "is_adventure_trip", "show_in_adventure_section", "adventure_display_order",
-        "is_biking_trip", "show_in_biking_section", "biking_display_order",
         "is_good_friday_trip", "show_in_good_friday_section", "good_friday_display_order",
-        "is_girls_trip", "show_in_girls_section", "girls_display_order",
     )
-    list_filter = ("is_active", "is_featured", "category", "is_international", "show_in_international_section", "is_india_trip", "show_in_india_section", "is_north_india_trip", "show_in_north_india_section")
+    list_filter = ("is_active", "is_featured", "category", SectionListFilter)
     list_editable = (
-        "is_international", "show_in_international_section", "display_order",
-        "is_india_trip", "show_in_india_section", "india_display_order",
-        "is_north_india_trip", "show_in_north_india_section", "north_india_display_order",
-        "is_honeymoon", "show_in_honeymoon_section", "honeymoon_display_order", "honeymoon_featured_priority",
-        "is_himalayan_trek", "show_in_himalayan_section", "himalayan_display_order",
-        "is_backpacking_trip", "show_in_backpacking_section", "backpacking_display_order", "backpacking_featured_priority",
-        "is_summer_trek", "show_in_summer_section", "summer_display_order", "summer_featured_priority",
-        "is_monsoon_trek", "show_in_monsoon_section", "monsoon_display_order",
-        "is_community_trip", "show_in_community_section", "community_display_order",
-        "is_festival_trip", "show_in_festival_section", "festival_display_order",
-        "is_adventure_trip", "show_in_adventure_section", "adventure_display_order",
-        "is_biking_trip", "show_in_biking_section", "biking_display_order",
         "is_good_friday_trip", "show_in_good_friday_section", "good_friday_display_order",
-        "is_girls_trip", "show_in_girls_section", "girls_display_order",
     )
     search_fields = ("title", "location", "country", "state")
-    ordering = ("display_order", "-id")
+    ordering = ("-id",)
     fieldsets = (
         (None, {
             "fields": ("title", "location", "country", "state", "category", "price", "duration_days", "image"),
@@ -57,65 +91,9 @@ class TripAdmin(admin.ModelAdmin):
         ("Details", {
             "fields": ("description", "short_description", "itinerary", "highlights", "inclusions", "exclusions"),
         }),
-        ("International Showcase", {
-            "fields": ("is_international", "show_in_international_section", "display_order"),
-            "description": "Control how this trip appears in the International Trips scrolling section.",
-        }),
-        ("India Showcase", {
-            "fields": ("is_india_trip", "show_in_india_section", "india_display_order", "india_featured_priority"),
-            "description": "Control how this trip appears in the India Trips scrolling section.",
-        }),
-        ("North India Showcase", {
-            "fields": ("is_north_india_trip", "show_in_north_india_section", "north_india_display_order", "north_india_featured_priority"),
-            "description": "Control how this trip appears in the North India Trips scrolling section.",
-        }),
-        ("Honeymoon Showcase", {
-            "fields": ("is_honeymoon", "show_in_honeymoon_section", "honeymoon_display_order", "honeymoon_featured_priority"),
-            "description": "Control how this trip appears in the Honeymoon Trips scrolling section.",
-        }),
-        ("Himalayan Showcase", {
-            "fields": ("is_himalayan_trek", "show_in_himalayan_section", "himalayan_display_order"),
-            "description": "Control how this trip appears in the Himalayan Treks scrolling section.",
-        }),
-        ("Backpacking Showcase", {
-            "fields": ("is_backpacking_trip", "show_in_backpacking_section", "backpacking_display_order", "backpacking_featured_priority"),
-            "description": "Control how this trip appears in the Backpacking Trips scrolling section.",
-        }),
-        ("Summer Showcase", {
-            "fields": ("is_summer_trek", "show_in_summer_section", "summer_display_order", "summer_featured_priority"),
-            "description": "Control how this trip appears in the Summer Getaways scrolling section.",
-        }),
-        ("Monsoon Showcase", {
-            "fields": ("is_monsoon_trek", "show_in_monsoon_section", "monsoon_display_order", "monsoon_featured_priority"),
-            "description": "Control how this trip appears in the Monsoon Getaways scrolling section.",
-        }),
-        ("Community Showcase", {
-            "fields": ("is_community_trip", "show_in_community_section", "community_display_order"),
-            "description": "Control how this trip appears in the Community Trips scrolling section.",
-        }),
-        ("Festival Showcase", {
-            "fields": ("is_festival_trip", "show_in_festival_section", "festival_display_order", "festival_featured_priority"),
-            "description": "Control how this trip appears in the Festival Trips scrolling section.",
-        }),
-        ("Adventure Showcase", {
-            "fields": ("is_adventure_trip", "show_in_adventure_section", "adventure_display_order"),
-            "description": "Control how this trip appears in the Adventure Trips scrolling section.",
-        }),
-        ("Biking Showcase", {
-            "fields": ("is_biking_trip", "show_in_biking_section", "biking_display_order", "biking_featured_priority"),
-            "description": "Control how this trip appears in the Biking Trips scrolling section.",
-        }),
         ("Good Friday Showcase", {
             "fields": ("is_good_friday_trip", "show_in_good_friday_section", "good_friday_display_order"),
-            "description": "Control how this trip appears in the Good Friday Trips scrolling section.",
-        }),
-        ("Long Weekend Showcase", {
-            "fields": ("is_long_weekend_trip", "show_in_long_weekend_section", "long_weekend_display_order", "long_weekend_featured_priority"),
-            "description": "Control how this trip appears in the Long Weekend Trips scrolling section.",
-        }),
-        ("All Girls Group Showcase", {
-            "fields": ("is_girls_trip", "show_in_girls_section", "girls_display_order", "girls_featured_priority"),
-            "description": "Control how this trip appears in the All Girls Group Tours scrolling section.",
+            "description": "Control how this trip appears in the Good Friday Trips scrolling section. The other showcase sections are managed in the Trip sections table below.",
         }),
         ("Featured Showcase", {
             "fields": ("is_featured", "featured_highlights"),
@@ -128,167 +106,20 @@ class TripAdmin(admin.ModelAdmin):
     )
 
 
-@admin.register(InternationalSectionConfig)
-class InternationalSectionConfigAdmin(admin.ModelAdmin):
-    list_display = ("title", "is_enabled", "scroll_speed")
-    list_editable = ("is_enabled", "scroll_speed")
-
-    def has_add_permission(self, request):
-        # Only allow one instance (singleton)
-        return not InternationalSectionConfig.objects.exists()
-
-    def has_delete_permission(self, request, obj=None):
-        return False
-
-
-@admin.register(IndiaSectionConfig)
-class IndiaSectionConfigAdmin(admin.ModelAdmin):
-    list_display = ("title", "is_enabled", "scroll_speed")
-    list_editable = ("is_enabled", "scroll_speed")
-
-    def has_add_permission(self, request):
-        # Only allow one instance (singleton)
-        return not IndiaSectionConfig.objects.exists()
-
-    def has_delete_permission(self, request, obj=None):
-        return False
-        
-@admin.register(NorthIndiaSectionConfig)
-class NorthIndiaSectionConfigAdmin(admin.ModelAdmin):
-    list_display = ("title", "is_enabled", "scroll_speed")
-    list_editable = ("is_enabled", "scroll_speed")
-
-    def has_add_permission(self, request):
-        return not NorthIndiaSectionConfig.objects.exists()
-
-    def has_delete_permission(self, request, obj=None):
-        return False
-
-@admin.register(HoneymoonSectionConfig)
-class HoneymoonSectionConfigAdmin(admin.ModelAdmin):
-    list_display = ("title", "is_enabled", "scroll_speed")
-    list_editable = ("is_enabled", "scroll_speed")
-
-    def has_add_permission(self, request):
-        return not HoneymoonSectionConfig.objects.exists()
-
-    def has_delete_permission(self, request, obj=None):
-        return False
-
-@admin.register(HimalayanSectionConfig)
-class HimalayanSectionConfigAdmin(admin.ModelAdmin):
-    list_display = ("title", "is_enabled", "scroll_speed")
-    list_editable = ("is_enabled", "scroll_speed")
-
-    def has_add_permission(self, request):
-        return not HimalayanSectionConfig.objects.exists()
-
-    def has_delete_permission(self, request, obj=None):
-        return False
-
-
-@admin.register(BackpackingSectionConfig)
-class BackpackingSectionConfigAdmin(admin.ModelAdmin):
-    list_display = ("title", "is_enabled", "scroll_speed")
-    list_editable = ("is_enabled", "scroll_speed")
-
-    def has_add_permission(self, request):
-        return not BackpackingSectionConfig.objects.exists()
+class SectionConfigForm(forms.ModelForm):
+    section = forms.ChoiceField(choices=SECTION_CHOICES)
 
-    def has_delete_permission(self, request, obj=None):
-        return False
-
-@admin.register(SummerSectionConfig)
-class SummerSectionConfigAdmin(admin.ModelAdmin):
-    list_display = ("title", "is_enabled", "scroll_speed")
-    list_editable = ("is_enabled", "scroll_speed")
-
-    def has_add_permission(self, request):
-        return not SummerSectionConfig.objects.exists()
-
-    def has_delete_permission(self, request, obj=None):
-        return False
+    class Meta:
+        model = SectionConfig
+        fields = "__all__"
 
 
-@admin.register(MonsoonSectionConfig)
-class MonsoonSectionConfigAdmin(admin.ModelAdmin):
-    list_display = ("title", "is_enabled", "scroll_speed")
+@admin.register(SectionConfig)
+class SectionConfigAdmin(admin.ModelAdmin):
+    form = SectionConfigForm
+    list_display = ("section", "title", "is_enabled", "scroll_speed")
     list_editable = ("is_enabled", "scroll_speed")
 
-    def has_add_permission(self, request):
-        return not MonsoonSectionConfig.objects.exists()
-
-    def has_delete_permission(self, request, obj=None):
-        return False
-
-@admin.register(CommunitySectionConfig)
-class CommunitySectionConfigAdmin(admin.ModelAdmin):
-    list_display = ("title", "is_enabled", "scroll_speed")
-    list_editable = ("is_enabled", "scroll_speed")
-
-    def has_add_permission(self, request):
-        return not CommunitySectionConfig.objects.exists()
-
-    def has_delete_permission(self, request, obj=None):
-        return False
-
-
-@admin.register(FestivalSectionConfig)
-class FestivalSectionConfigAdmin(admin.ModelAdmin):
-    list_display = ("title", "is_enabled", "scroll_speed")
-    list_editable = ("is_enabled", "scroll_speed")
-
-    def has_add_permission(self, request):
-        return not FestivalSectionConfig.objects.exists()
-
-    def has_delete_permission(self, request, obj=None):
-        return False
-
-
-@admin.register(AdventureSectionConfig)
-class AdventureSectionConfigAdmin(admin.ModelAdmin):
-    list_display = ("title", "is_enabled", "scroll_speed")
-    list_editable = ("is_enabled", "scroll_speed")
-
-    def has_add_permission(self, request):
-        return not AdventureSectionConfig.objects.exists()
-
-    def has_delete_permission(self, request, obj=None):
-        return False
-
-
-@admin.register(BikingSectionConfig)
-class BikingSectionConfigAdmin(admin.ModelAdmin):
-    list_display = ("title", "is_enabled", "scroll_speed")
-    list_editable = ("is_enabled", "scroll_speed")
-
-    def has_add_permission(self, request):
-        return not BikingSectionConfig.objects.exists()
-
-    def has_delete_permission(self, request, obj=None):
-        return False
-
-
-@admin.register(LongWeekendSectionConfig)
-class LongWeekendSectionConfigAdmin(admin.ModelAdmin):
-    list_display = ("title", "is_enabled", "scroll_speed")
-    list_editable = ("is_enabled", "scroll_speed")
-
-    def has_add_permission(self, request):
-        return not LongWeekendSectionConfig.objects.exists()
-
-    def has_delete_permission(self, request, obj=None):
-        return False
-
-
-@admin.register(GirlsSectionConfig)
-class GirlsSectionConfigAdmin(admin.ModelAdmin):
-    list_display = ("title", "is_enabled", "scroll_speed")
-    list_editable = ("is_enabled", "scroll_speed")
-
-    def has_add_permission(self, request):
-        return not GirlsSectionConfig.objects.exists()
-
     def has_delete_permission(self, request, obj=None):
         return False
 
@@ -0,0 +1,188 @@
+import threading
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.http import parse_etags, quote_etag
+from rest_framework.response import Response
+
+
+CATALOG_VERSION_KEY = "core:catalog-version"
+
+# Reviews and site stats change independently of the catalog (anyone can post
+# a review), so they get their own counters rather than busting the catalog.
+REVIEWS_VERSION_KEY = "core:reviews-version"
+SITE_STATS_VERSION_KEY = "core:site-stats-version"
+
+# Coupons are read by checkout rather than the catalog (see coupon_index.py)
+COUPONS_VERSION_KEY = "core:coupons-version"
+
+# Seconds a rendered section is kept in the shared cache. The version in the
+# key is what actually invalidates entries; the timeout only reclaims memory.
+CATALOG_CACHE_TIMEOUT = getattr(settings, "CATALOG_CACHE_TIMEOUT", 60 * 60)
+
+# In-process layer: { name: (version, data) }. Avoids even the unpickling
+# cost of the shared cache while the catalog is unchanged.
+_local_entries = {}
+_local_lock = threading.Lock()
+
+
+def get_catalog_version(key=CATALOG_VERSION_KEY):
+    """
+    Returns the current catalog version (or the counter stored at `key`)
+    from the shared cache.
+
+    A missing counter (first boot, eviction, cache flush) is seeded from the
+    wall clock rather than 1, so a restarted counter can never collide with a
+    version some process still holds entries for.
+    """
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, int(time.time() * 1000), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def bump_catalog_version(key=CATALOG_VERSION_KEY):
+    """
+    Invalidates every cached catalog response. Called from the post_save /
+    post_delete receivers in signals.py whenever a Trip, Category or section
+    config changes (and with REVIEWS_VERSION_KEY / SITE_STATS_VERSION_KEY
+    for reviews and site stats).
+
+    Inside a transaction the bump waits for the commit: a read between a
+    bump and the commit would otherwise cache the old rows under the new
+    version, to be served until the next write.
+    """
+    transaction.on_commit(lambda: _bump(key))
+
+
+def _bump(key):
+    try:
+        return cache.incr(key)
+    except ValueError:
+        # Counter was evicted — reseeding also moves past every old version.
+        cache.set(key, int(time.time() * 1000), timeout=None)
+        return cache.get(key)
+
+
+def _version(key=CATALOG_VERSION_KEY, max_age=None):
+    """
+    The counter at `key`; with `max_age`, also moved on every `max_age`
+    seconds, for payloads that read data which bumps no counter.
+    """
+    version = get_catalog_version(key)
+    if max_age:
+        version = f"{version}.{int(time.time() // max_age)}"
+    return version
+
+
+def get_or_build(name, builder, max_age=None):
+    """
+    Returns the cached payload for `name` at the current catalog version,
+    calling builder() only when neither the in-process nor the shared cache
+    has it. A builder returning None is treated as "don't cache". With
+    `max_age`, the payload is also rebuilt once it is that many seconds old
+    (at most).
+    """
+    version = _version(max_age=max_age)
+
+    entry = _local_entries.get(name)
+    if entry is not None and entry[0] == version:
+        return entry[1]
+
+    shared_key = f"core:catalog:{name}:{version}"
+    data = cache.get(shared_key)
+    if data is None:
+        data = builder()
+        if data is None:
+            return None
+        cache.set(shared_key, data, CATALOG_CACHE_TIMEOUT)
+
+    with _local_lock:
+        _local_entries[name] = (version, data)
+    return data
+
+
+def clear_local_cache():
+    """Drops the in-process layer (used by tests and after a manual cache flush)."""
+    with _local_lock:
+        _local_entries.clear()
+
+
+def catalog_cached(name, max_age=None):
+    """
+    View decorator for public catalog endpoints whose response depends only
+    on catalog data. Successful responses are cached per catalog version;
+    anything else (404, 400, ...) is passed through uncached. `name` may
+    reference URL kwargs, e.g. "section:{section}". `max_age` is for
+    responses that also read something else (see get_or_build).
+
+    Place it below @api_view so DRF still handles auth and content negotiation:
+
+        @api_view(["GET"])
+        @permission_classes([AllowAny])
+        @catalog_cached("himalayan")
+        def himalayan_trips(request): ...
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            passthrough = {}
+
+            def build():
+                response = view_func(request, *args, **kwargs)
+                if response.status_code != 200:
+                    passthrough["response"] = response
+                    return None
+                return response.data
+
+            data = get_or_build(name.format(**kwargs), build, max_age)
+            if "response" in passthrough:
+                return passthrough["response"]
+            return Response(data)
+
+        return wrapper
+
+    return decorator
+
+
+def versioned_etag(version_key=CATALOG_VERSION_KEY, max_age=None):
+    """
+    View decorator for public GET endpoints whose response depends only on
+    the data behind `version_key`. Responses carry a strong ETag built from
+    that version (and the rendered format); a request whose If-None-Match
+    matches gets an empty 304 before the view, its queries or serializers run.
+    With `max_age`, the ETag also changes every `max_age` seconds; give the
+    same value as to catalog_cached.
+
+    Place it below @api_view and above @catalog_cached:
+
+        @api_view(["GET"])
+        @permission_classes([AllowAny])
+        @versioned_etag()
+        @catalog_cached("featured")
+        def featured_trips(request): ...
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            etag = quote_etag(f"{_version(version_key, max_age)}-{request.accepted_renderer.format}")
+
+            if_none_match = request.headers.get("If-None-Match")
+            if if_none_match:
+                tags = parse_etags(if_none_match)
+                # If-None-Match uses the weak comparison, so W/"x" matches "x"
+                if "*" in tags or etag in (tag.removeprefix("W/") for tag in tags):
+                    return Response(status=304, headers={"ETag": etag})
+
+            response = view_func(request, *args, **kwargs)
+            if response.status_code == 200:
+                response["ETag"] = etag
+            return response
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,212 @@
+"""
+Coupons by the thousand: generated campaign codes and CSV imports.
+
+Both insert with bulk_create, BATCH_SIZE rows at a time, inside one
+transaction, so an import either lands whole or not at all and never holds
+more than a batch of Coupons in memory. The codes in use are read once, up
+front (checkout matches codes ignoring case, so they are compared upper
+cased), and a batch then costs its INSERT plus a check of its users and
+trips, rather than the save() and unique-code check per coupon of
+admin_coupons.
+
+bulk_create sends no post_save, so both bump the coupons version
+themselves, which rebuilds the coupon index (coupon_index.py).
+"""
+
+import csv
+import secrets
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from .catalog_cache import COUPONS_VERSION_KEY, bump_catalog_version
+from .models import Coupon, Trip
+
+
+BATCH_SIZE = getattr(settings, "COUPON_BULK_BATCH_SIZE", 1000)
+
+# Upper case without 0/O and 1/I, which get mixed up when codes are typed
+CODE_ALPHABET = "ABCDEFGHJKLMNPQRSTUVWXYZ23456789"
+DEFAULT_CODE_LENGTH = 8
+
+_random = secrets.SystemRandom()
+
+# Tries at inserting a batch of generated codes that clash with codes
+# created meanwhile (after _taken_codes() was read)
+MAX_INSERT_ATTEMPTS = 3
+
+# Columns an import may have; "user" and "trip" are ids
+IMPORT_COLUMNS = (
+    "code", "discount_type", "discount_value", "max_discount", "min_booking_amount",
+    "is_active", "expiry_date", "usage_limit", "user", "trip",
+)
+REQUIRED_COLUMNS = ("code", "discount_value")
+
+
+def _taken_codes():
+    """The codes in use, upper cased."""
+    return {code.upper() for code in Coupon.objects.values_list("code", flat=True).iterator(chunk_size=5000)}
+
+
+def _missing_ids(model, ids):
+    ids = set(ids) - {None}
+    if not ids:
+        return set()
+    return ids - set(model.objects.filter(pk__in=ids).values_list("id", flat=True))
+
+
+# ─── Generation ──────────────────────────────────────────────────────────────
+
+def _fresh_codes(prefix, length, count, taken):
+    """`count` new codes not in `taken`; adds them to it."""
+    codes = []
+    while len(codes) < count:
+        code = prefix + "".join(_random.choices(CODE_ALPHABET, k=length))
+        if code not in taken:
+            taken.add(code)
+            codes.append(code)
+    return codes
+
+
+def _insert_generated(codes, user_ids, fields, prefix, code_length, taken):
+    """
+    Inserts a batch of generated coupons; returns their codes, with any
+    that another request took in the meantime replaced. Raises
+    IntegrityError if some still clash after MAX_INSERT_ATTEMPTS tries.
+    """
+    for attempt in range(1, MAX_INSERT_ATTEMPTS + 1):
+        try:
+            with transaction.atomic():
+                Coupon.objects.bulk_create(
+                    Coupon(code=code, user_id=user_id, **fields) for code, user_id in zip(codes, user_ids)
+                )
+            return codes
+        except IntegrityError:
+            clashes = set(Coupon.objects.filter(code__in=codes).values_list("code", flat=True))
+            if not clashes or attempt == MAX_INSERT_ATTEMPTS:
+                raise
+            codes = [_fresh_codes(prefix, code_length, 1, taken)[0] if code in clashes else code for code in codes]
+
+
+def generate_coupons(count=None, prefix="", code_length=DEFAULT_CODE_LENGTH, user_ids=None, **fields):
+    """
+    Creates `count` coupons with new random codes (`prefix` + `code_length`
+    characters of CODE_ALPHABET), or one personal coupon for each of
+    `user_ids`; `fields` (discount_type, discount_value, trip, ...) are
+    those of every coupon. Returns the codes, in creation order.
+
+    Raises ValueError for an unknown user, or when `code_length` leaves too
+    few codes to pick `count` of them at random, and IntegrityError if
+    other writers keep taking the codes picked (see _insert_generated).
+    """
+    if user_ids is not None:
+        count = len(user_ids)
+    prefix = prefix.strip().upper()
+    # Keeps retries rare: at most 1 in 1000 picks is taken even when full
+    if len(CODE_ALPHABET) ** code_length < count * 1000:
+        raise ValueError(f"{code_length} characters are too few for {count} unique codes")
+
+    codes, taken = [], _taken_codes()
+    with transaction.atomic():
+        for start in range(0, count, BATCH_SIZE):
+            size = min(BATCH_SIZE, count - start)
+            batch_users = user_ids[start:start + size] if user_ids is not None else [None] * size
+            missing = _missing_ids(User, batch_users)
+            if missing:
+                raise ValueError(f"Unknown user ids: {', '.join(map(str, sorted(missing)))}")
+
+            batch_codes = _fresh_codes(prefix, code_length, size, taken)
+            codes.extend(_insert_generated(batch_codes, batch_users, fields, prefix, code_length, taken))
+
+    bump_catalog_version(COUPONS_VERSION_KEY)
+    return codes
+
+
+# ─── CSV import ──────────────────────────────────────────────────────────────
+
+def _coupon_from_row(row):
+    values = {}
+    for name, raw in row.items():
+        raw = (raw or "").strip()
+        if not raw:
+            continue  # The model default
+        field = Coupon._meta.get_field(name)
+        if field.is_relation:
+            try:
+                values[field.attname] = int(raw)
+            except ValueError:
+                raise ValueError(f"{name} must be an id") from None
+            continue
+        try:
+            value = field.clean(raw, None)
+        except ValidationError as e:
+            raise ValueError(f"{name}: {' '.join(e.messages)}") from None
+        if name == "expiry_date" and timezone.is_naive(value):
+            value = timezone.make_aware(value)
+        values[name] = value
+
+    for name in REQUIRED_COLUMNS:
+        if name not in values:
+            raise ValueError(f"{name} is required")
+    return Coupon(**values)
+
+
+def _insert_rows(rows):
+    """rows: [(line number, Coupon)]"""
+    for model, attname in ((User, "user_id"), (Trip, "trip_id")):
+        missing = _missing_ids(model, (getattr(coupon, attname) for _, coupon in rows))
+        if missing:
+            line, coupon = next((line, coupon) for line, coupon in rows if getattr(coupon, attname) in missing)
+            raise ValueError(f"Line {line}: no {model._meta.model_name} with id {getattr(coupon, attname)}")
+    Coupon.objects.bulk_create([coupon for _, coupon in rows])
+
+
+def import_coupons_csv(lines):
+    """
+    Creates a coupon for every row of a CSV with a header of IMPORT_COLUMNS
+    (code and discount_value required; empty cells take the model defaults),
+    reading `lines` (an open text file, say) as it goes. Returns how many.
+
+    Nothing is created if any row is invalid: raises ValueError naming the
+    first bad line.
+    """
+    reader = csv.DictReader(lines)
+    columns = reader.fieldnames or []
+    unknown = [column for column in columns if column not in IMPORT_COLUMNS]
+    if unknown:
+        raise ValueError(f"Unknown columns: {', '.join(unknown)}")
+    missing = [column for column in REQUIRED_COLUMNS if column not in columns]
+    if missing:
+        raise ValueError(f"Missing columns: {', '.join(missing)}")
+
+    created, taken, rows = 0, _taken_codes(), []
+    try:
+        with transaction.atomic():
+            for row in reader:
+                if None in row:
+                    raise ValueError(f"Line {reader.line_num}: more cells than columns")
+                try:
+                    coupon = _coupon_from_row(row)
+                except ValueError as e:
+                    raise ValueError(f"Line {reader.line_num}: {e}") from None
+                if coupon.code.upper() in taken:
+                    raise ValueError(f"Line {reader.line_num}: coupon {coupon.code} already exists")
+                taken.add(coupon.code.upper())
+
+                rows.append((reader.line_num, coupon))
+                if len(rows) == BATCH_SIZE:
+                    _insert_rows(rows)
+                    created, rows = created + len(rows), []
+            if rows:
+                _insert_rows(rows)
+                created += len(rows)
+    except IntegrityError as e:
+        # A coupon created meanwhile with one of the codes
+        raise ValueError(f"Import failed: {e}") from None
+
+    if created:
+        bump_catalog_version(COUPONS_VERSION_KEY)
+    return created
@@ -0,0 +1,143 @@
+"""
+In-process index of the coupons a checkout can offer (get_applicable_coupons).
+
+Every active coupon that has not expired or run out is a CouponRule in one
+of three buckets:
+
+    global      coupons for anyone on any trip
+    by trip     coupons for anyone on one trip
+    by user     coupons for one user (on any trip, or on one)
+
+each sorted by min_booking_amount, so the coupons a booking amount reaches
+are a bisect away. A lookup reads the global bucket, the trip's bucket and
+the user's bucket — not every coupon — which keeps checkouts cheap with
+tens of thousands of personal codes issued.
+
+The index is built on first use and rebuilt when the coupons version
+changes (a Coupon saved or deleted, see signals.py). times_used is counted
+by an UPDATE that sends no signal, so the index cannot know a limited
+coupon has run out: lookups leave those to the caller to check live.
+"""
+
+import threading
+from bisect import bisect_right
+
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .catalog_cache import COUPONS_VERSION_KEY, get_catalog_version
+from .models import Coupon
+
+
+class CouponRule:
+    """What the index keeps of a coupon; enough for _calculate_discount()."""
+
+    __slots__ = (
+        "id", "code", "discount_type", "discount_value", "max_discount",
+        "min_booking_amount", "expiry_date", "usage_limit", "user_id", "trip_id",
+    )
+
+    def __init__(self, id, code, discount_type, discount_value, max_discount,
+                 min_booking_amount, expiry_date, usage_limit, user_id, trip_id):
+        self.id = id
+        self.code = code
+        self.discount_type = discount_type
+        self.discount_value = discount_value
+        self.max_discount = max_discount
+        self.min_booking_amount = min_booking_amount
+        self.expiry_date = expiry_date
+        self.usage_limit = usage_limit
+        self.user_id = user_id
+        self.trip_id = trip_id
+
+
+class _Bucket:
+    def __init__(self, rules):
+        rules.sort(key=lambda rule: rule.min_booking_amount)
+        self.rules = rules
+        self._mins = [rule.min_booking_amount for rule in rules]
+
+    def reached_by(self, amount):
+        """The rules whose minimum booking amount is at most `amount`."""
+        return self.rules[:bisect_right(self._mins, amount)]
+
+
+_EMPTY = _Bucket([])
+
+
+class CouponIndex:
+    def __init__(self, rules):
+        """`rules`: CouponRules of the coupons to offer, in any order."""
+        everyone, by_trip, by_user = [], {}, {}
+        for rule in rules:
+            if rule.user_id is not None:
+                by_user.setdefault(rule.user_id, []).append(rule)
+            elif rule.trip_id is not None:
+                by_trip.setdefault(rule.trip_id, []).append(rule)
+            else:
+                everyone.append(rule)
+        self._global = _Bucket(everyone)
+        self._by_trip = {trip_id: _Bucket(bucket) for trip_id, bucket in by_trip.items()}
+        self._by_user = {user_id: _Bucket(bucket) for user_id, bucket in by_user.items()}
+        self._size = len(rules)
+
+    def __len__(self):
+        return self._size
+
+    def candidates(self, user_id, trip_id, amount, now=None):
+        """
+        The unexpired rules open to `user_id` on `trip_id` at `amount`.
+        Usage limits are not checked (see the module docstring).
+        """
+        try:
+            trip_id = int(trip_id)
+        except (TypeError, ValueError):
+            trip_id = None
+        now = now or timezone.now()
+
+        rules = self._global.reached_by(amount)
+        if trip_id is not None:
+            rules = rules + self._by_trip.get(trip_id, _EMPTY).reached_by(amount)
+        if user_id is not None:
+            rules = rules + [
+                rule for rule in self._by_user.get(user_id, _EMPTY).reached_by(amount)
+                if rule.trip_id is None or rule.trip_id == trip_id
+            ]
+        return [rule for rule in rules if rule.expiry_date is None or rule.expiry_date >= now]
+
+
+def build_coupon_index():
+    """Reads the active, unexpired, unexhausted coupons into a new CouponIndex."""
+    coupons = Coupon.objects.filter(
+        is_active=True,
+    ).filter(
+        Q(expiry_date__isnull=True) | Q(expiry_date__gte=timezone.now())
+    ).filter(
+        Q(usage_limit=0) | Q(times_used__lt=F("usage_limit"))
+    ).values_list(*CouponRule.__slots__)
+    return CouponIndex([CouponRule(*row) for row in coupons.iterator(chunk_size=2000)])
+
+
+# In-process index: (coupons version, CouponIndex)
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_coupon_index():
+    global _index
+    version = get_catalog_version(COUPONS_VERSION_KEY)
+    entry = _index
+    if entry is None or entry[0] != version:
+        with _index_lock:
+            # Another thread may have rebuilt it while this one waited
+            entry = _index
+            if entry is None or entry[0] != version:
+                entry = _index = (version, build_coupon_index())
+    return entry[1]
+
+
+def clear_coupon_index():
+    """Drops the in-process index (used by tests)."""
+    global _index
+    with _index_lock:
+        _index = None
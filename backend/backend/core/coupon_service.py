@@ -1,9 +1,13 @@
 from decimal import Decimal
 from django.utils import timezone
-from django.db.models import Q, F
+from django.db.models import F
+from .coupon_index import get_coupon_index
 from .models import Coupon
 
 
+USAGE_CHECK_CHUNK = 900
+
+
 def _calculate_discount(coupon, booking_amount):
     """
     Pure calculation helper — given a Coupon instance and a booking amount,
@@ -127,8 +131,12 @@ def get_applicable_coupons(user_id, trip_id, booking_amount):
     sorted by discount (highest first). The first item is the "best coupon".
 
     Algorithm:
-      1. Single DB query pulls all active, non-expired, non-exhausted coupons.
-      2. Python-side loop filters by user/trip eligibility and min-amount.
+      1. The coupon index (coupon_index.py) picks the unexpired coupons open
+         to this user on this trip whose minimum amount the booking reaches,
+         from the global, trip and user buckets only — no query while the
+         coupons are unchanged.
+      2. Of those with a usage limit, the ones used up since the index was
+         built are dropped (one query, only when there are any).
       3. _calculate_discount() computes the savings for each.
       4. Results are sorted descending by discount_amount.
       5. The top item is flagged as "best_coupon" in the response.
@@ -139,40 +147,28 @@ def get_applicable_coupons(user_id, trip_id, booking_amount):
         "all_coupons": [ { code, discount_type, discount_value, discount_amount, description }, ... ]
       }
     """
-    now = timezone.now()
     booking_amt = Decimal(str(booking_amount))
 
-    # ── Step 1: Efficient DB query ──────────────────────────────────────────
-    # Pull only active coupons that haven't expired and haven't hit their usage cap.
-    # We use Q objects for the expiry/usage conditions to handle nullable fields.
-    coupons = Coupon.objects.filter(
-        is_active=True,
-    ).filter(
-        Q(expiry_date__isnull=True) | Q(expiry_date__gte=now)       # not expired
-    ).filter(
-        Q(usage_limit=0) | Q(times_used__lt=F("usage_limit"))       # usage not exhausted
-    )
-
-    # ── Step 2: Python-side eligibility filter ──────────────────────────────
-    # We can't perfectly express "user is None OR user == X" in one query
-    # without extra complexity, so we filter in Python (coupon count is small).
-    applicable = []
-
-    for coupon in coupons:
-        # User restriction: coupon is for a specific user — skip if not this user
-        if coupon.user_id and coupon.user_id != user_id:
-            continue
+    # ── Step 1: Index lookup ────────────────────────────────────────────────
+    candidates = get_coupon_index().candidates(user_id, trip_id, booking_amt)
+
+    # ── Step 2: Usage limits ────────────────────────────────────────────────
+    # times_used is bumped by an UPDATE (record_coupon_usage) the index never hears of
+    limited = [coupon.id for coupon in candidates if coupon.usage_limit > 0]
+    if limited:
+        available = set()
+        # In chunks, within the database's limit on query parameters
+        for start in range(0, len(limited), USAGE_CHECK_CHUNK):
+            available.update(Coupon.objects.filter(
+                pk__in=limited[start:start + USAGE_CHECK_CHUNK], times_used__lt=F("usage_limit"),
+            ).values_list("id", flat=True))
+        candidates = [coupon for coupon in candidates if coupon.usage_limit == 0 or coupon.id in available]
 
-        # Trip restriction: coupon is for a specific trip — skip if not this trip
-        if coupon.trip_id and str(coupon.trip_id) != str(trip_id):
-            continue
-
-        # Min booking amount: skip if the booking total is below the threshold
-        if booking_amt < coupon.min_booking_amount:
-            continue
+    applicable = []
 
+    for coupon in candidates:
         # ── Step 3: Calculate the discount ──────────────────────────────────
-        discount = _calculate_discount(coupon, booking_amount)
+        discount = _calculate_discount(coupon, booking_amt)
 
         # Skip coupons that yield zero discount (edge case safeguard)
         if discount <= 0:
@@ -0,0 +1,242 @@
+"""
+Faceted filtering of the trip catalog.
+
+The filter sidebar narrows trips by price bucket, duration bucket,
+category, state, country, departure month and showcase section, showing
+how many trips each choice would leave. FacetIndex answers both from
+memory: active trips are numbered 0..n-1 (by id) and every facet value
+holds a bitmap — a Python int — of the trips that have it, so
+
+  - a filter is OR within a facet and AND across facets of those ints,
+  - a facet's counts are bit_count()s of each value's bitmap ANDed with
+    the filters on every *other* facet (picking a second state widens the
+    result, so the state counts ignore the state filter).
+
+The index is built from four queries and cached per catalog version
+(catalog_cache.get_or_build), so counts cost no queries at all while the
+catalog is unchanged. trip_list filters in SQL instead (facet_query): the
+ids the index matches could number more than a query takes parameters.
+
+Filters come from the query string, comma-separated values OR'ed:
+?price=under-10k,10k-25k&duration=4-6&state=Goa&month=2026-12 plus the
+existing ?category=<slug> and ?is_<flag>=true section params. State and
+country are free text on the trip, so they match ignoring case, as the
+state__iexact filter they replaced did: the index keys them casefolded
+and counts() lists them in the spelling of the lowest trip id.
+"""
+
+from datetime import date
+
+from django.db.models import Q
+
+from .catalog_cache import get_or_build
+from .models import Category, Trip, TripBatch, TripSection
+from .sections import SECTIONS
+
+
+# (value, label, lowest, highest excluded); None = unbounded
+PRICE_BUCKETS = [
+    ("under-10k", "Under ₹10,000", None, 10000),
+    ("10k-25k", "₹10,000 – ₹25,000", 10000, 25000),
+    ("25k-50k", "₹25,000 – ₹50,000", 25000, 50000),
+    ("50k-plus", "₹50,000+", 50000, None),
+]
+
+DURATION_BUCKETS = [
+    ("1-3", "1–3 days", None, 4),
+    ("4-6", "4–6 days", 4, 7),
+    ("7-9", "7–9 days", 7, 10),
+    ("10-plus", "10+ days", 10, None),
+]
+
+FACETS = ["price", "duration", "category", "state", "country", "month", "section"]
+
+# Facets trip_list did not filter on before; it applies these with facet_query()
+NEW_FACETS = ["price", "duration", "state", "country", "month"]
+
+# Facets whose values match ignoring case
+CASELESS_FACETS = ("state", "country")
+
+
+def _bucket(value, buckets):
+    for key, _, low, high in buckets:
+        if (low is None or value >= low) and (high is None or value < high):
+            return key
+    return None
+
+
+def parse_facet_filters(query_params):
+    """{ facet: {values} } of the facet filters in a request's query string."""
+    filters = {}
+    for facet in FACETS:
+        if facet == "section":
+            values = {
+                section.key for section in SECTIONS
+                if any(query_params.get(param, "").lower() == "true" for param in section.filter_params)
+            }
+        else:
+            values = {value.strip() for value in query_params.get(facet, "").split(",") if value.strip()}
+            if facet in CASELESS_FACETS:
+                values = {value.casefold() for value in values}
+        if values:
+            filters[facet] = values
+    return filters
+
+
+def _month_range(value):
+    """(first day, first day of the next month) of a YYYY-MM value, or None."""
+    try:
+        year, month = map(int, value.split("-"))
+        start = date(year, month, 1)
+    except ValueError:
+        return None
+    return start, date(year + month // 12, month % 12 + 1, 1)
+
+
+def facet_query(filters):
+    """
+    A Q for the trips passing `filters` on NEW_FACETS, matching what the
+    index would: OR within a facet, AND across facets, and nothing for a
+    value the facet does not have.
+    """
+    query = Q()
+    for facet, values in filters.items():
+        matches = Q(pk__in=[])
+        if facet in ("price", "duration"):
+            field, buckets = ("price", PRICE_BUCKETS) if facet == "price" else ("duration_days", DURATION_BUCKETS)
+            for key, _, low, high in buckets:
+                if key in values:
+                    bounds = {}
+                    if low is not None:
+                        bounds[f"{field}__gte"] = low
+                    if high is not None:
+                        bounds[f"{field}__lt"] = high
+                    matches |= Q(**bounds)
+        elif facet in CASELESS_FACETS:
+            for value in values:
+                matches |= Q(**{f"{facet}__iexact": value})
+        elif facet == "month":
+            months = Q(pk__in=[])
+            for start, end in filter(None, map(_month_range, values)):
+                months |= Q(start_date__gte=start, start_date__lt=end)
+            matches = Q(pk__in=TripBatch.objects.filter(months).values("trip_id"))
+        query &= matches
+    return query
+
+
+class FacetIndex:
+    def __init__(self, trip_ids, values_by_trip, labels):
+        """
+        trip_ids:       active trip ids, in bit order
+        values_by_trip: [{ facet: {values} }] parallel to trip_ids
+        labels:         { facet: { value: label } } for values with a display name
+        """
+        self.trip_ids = trip_ids
+        self.labels = labels
+        self.all = (1 << len(trip_ids)) - 1
+
+        # Bits are set in bytearrays and turned into ints once: OR-ing one
+        # bit at a time into an int would copy it for every trip.
+        size = (len(trip_ids) + 7) // 8
+        buffers = {facet: {} for facet in FACETS}
+        for position, values in enumerate(values_by_trip):
+            byte, bit = position >> 3, 1 << (position & 7)
+            for facet, facet_values in values.items():
+                for value in facet_values:
+                    buffer = buffers[facet].get(value)
+                    if buffer is None:
+                        buffer = buffers[facet][value] = bytearray(size)
+                    buffer[byte] |= bit
+        self.bitmaps = {
+            facet: {value: int.from_bytes(buffer, "little") for value, buffer in values.items()}
+            for facet, values in buffers.items()
+        }
+
+    def _facet_mask(self, facet, values):
+        bitmaps = self.bitmaps[facet]
+        mask = 0
+        for value in values:
+            mask |= bitmaps.get(value, 0)
+        return mask
+
+    def match(self, filters, skip=None):
+        """Bitmap of the trips passing every filter (except the one on `skip`)."""
+        mask = self.all
+        for facet, values in filters.items():
+            if facet != skip:
+                mask &= self._facet_mask(facet, values)
+        return mask
+
+    def counts(self, filters):
+        """
+        { "total": trips matching `filters`, "facets": { facet: [{value, label, count}] } }.
+        Bucket and section values keep their defined order, months run
+        chronologically, the rest go most trips first.
+        """
+        facets = {}
+        for facet in FACETS:
+            base = self.match(filters, skip=facet)
+            counts = {value: (base & bitmap).bit_count() for value, bitmap in self.bitmaps[facet].items()}
+            if facet in ("price", "duration", "section"):
+                order = list(self.labels[facet])
+                values = sorted(counts, key=order.index)
+            elif facet == "month":
+                values = sorted(counts)
+            else:
+                values = sorted(counts, key=lambda value: (-counts[value], str(self.labels[facet].get(value, value))))
+            labels = self.labels[facet]
+            facets[facet] = [
+                {
+                    "value": labels[value] if facet in CASELESS_FACETS else value,
+                    "label": labels.get(value, value),
+                    "count": counts[value],
+                }
+                for value in values
+            ]
+        return {"total": self.match(filters).bit_count(), "facets": facets}
+
+
+def build_facet_index():
+    trips = list(
+        Trip.objects.filter(is_active=True).order_by("id")
+        .values_list("id", "price", "duration_days", "category__slug", "state", "country")
+    )
+    sections = {}
+    for trip_id, section in TripSection.objects.filter(trip__is_active=True).values_list("trip_id", "section"):
+        sections.setdefault(trip_id, set()).add(section)
+    months = {}
+    for trip_id, start_date in TripBatch.objects.filter(trip__is_active=True).values_list("trip_id", "start_date"):
+        months.setdefault(trip_id, set()).add(start_date.strftime("%Y-%m"))
+
+    values_by_trip, spellings = [], {facet: {} for facet in CASELESS_FACETS}
+    for trip_id, price, days, category, state, country in trips:
+        if state:
+            spellings["state"].setdefault(state.casefold(), state)
+        if country:
+            spellings["country"].setdefault(country.casefold(), country)
+        price_bucket = _bucket(price, PRICE_BUCKETS)
+        duration_bucket = _bucket(days, DURATION_BUCKETS)
+        values_by_trip.append({
+            "price": {price_bucket} if price_bucket else set(),
+            "duration": {duration_bucket} if duration_bucket else set(),
+            "category": {category} if category else set(),
+            "state": {state.casefold()} if state else set(),
+            "country": {country.casefold()} if country else set(),
+            "month": months.get(trip_id, set()),
+            "section": sections.get(trip_id, set()),
+        })
+
+    labels = {
+        "price": {key: label for key, label, _, _ in PRICE_BUCKETS},
+        "duration": {key: label for key, label, _, _ in DURATION_BUCKETS},
+        "category": dict(Category.objects.values_list("slug", "name")),
+        "state": spellings["state"],
+        "country": spellings["country"],
+        "month": {},
+        "section": {section.key: section.label for section in SECTIONS},
+    }
+    return FacetIndex([trip_id for trip_id, *_ in trips], values_by_trip, labels)
+
+
+def get_facet_index():
+    return get_or_build("facet-index", build_facet_index)
@@ -0,0 +1,190 @@
+"""
+Seat inventory of trip departures.
+
+A TripBatch with a capacity has capacity - seats_booked seats left (one
+without a capacity is not limited, but still counts what it sells).
+Taking seats is a single conditional UPDATE,
+
+    UPDATE core_tripbatch SET seats_booked = seats_booked + n
+    WHERE id = ... AND (capacity IS NULL OR seats_booked <= capacity - n)
+
+so no other checkout can get between the check and the increment: a
+batch is never oversold, and a reservation locks just that row for just
+that statement — no SELECT ... FOR UPDATE, no table lock.
+
+Checkout can set seats aside with a SeatHold for HOLD_MINUTES. Held seats
+are in seats_booked already; booking with the hold keeps them, and a hold
+that expires first gives them back. Expired holds are released lazily,
+when a reservation on their batch comes up short, and in bulk by the
+release_seat_holds command.
+
+Seats only go back after the row that owned them (the hold, or the
+booking's status) was changed by a conditional write that matched, so a
+hold released by two requests at once is returned once.
+
+Cached catalog responses are not refreshed on every booking, so the seat
+counts they show can lag; the catalog version is bumped when a batch
+sells out or comes back on sale, which is what ?has_seats=true filters on.
+"""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import DatabaseError
+from django.db.models import Exists, F, OuterRef, Q
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from .catalog_cache import bump_catalog_version
+from .models import Booking, SeatHold, TripBatch
+
+
+HOLD_MINUTES = getattr(settings, "SEAT_HOLD_MINUTES", 10)
+
+
+def _take_seats(batch_id, seats):
+    batches = TripBatch.objects.filter(pk=batch_id)
+    add = {"seats_booked": F("seats_booked") + seats}
+    if batches.filter(Q(capacity__isnull=True) | Q(seats_booked__lt=F("capacity") - seats)).update(**add):
+        return True
+    # Only by selling out, if at all
+    if batches.filter(seats_booked__lte=F("capacity") - seats).update(**add):
+        bump_catalog_version()
+        return True
+    return False
+
+
+def reserve_seats(batch_id, seats):
+    """Takes `seats` seats of the batch if it has that many left; returns whether it did."""
+    if _take_seats(batch_id, seats):
+        return True
+    # Some of them may be sitting in holds nobody is coming back for
+    return release_expired_holds(batch_id) > 0 and _take_seats(batch_id, seats)
+
+
+def release_seats(batch_id, seats):
+    """Gives back `seats` seats taken by reserve_seats."""
+    batches = TripBatch.objects.filter(pk=batch_id)
+    subtract = {"seats_booked": Greatest(F("seats_booked") - seats, 0)}
+    if batches.filter(Q(capacity__isnull=True) | Q(seats_booked__lt=F("capacity"))).update(**subtract):
+        return
+    if batches.update(**subtract):
+        # Back on sale
+        bump_catalog_version()
+
+
+# ─── Holds ───────────────────────────────────────────────────────────────────
+
+def place_hold(user, batch_id, seats):
+    """A new SeatHold of `seats` seats for `user`, or None if the batch has not that many left."""
+    if not reserve_seats(batch_id, seats):
+        return None
+    # Not one transaction with the reservation, which would keep the batch
+    # row locked until the insert commits
+    try:
+        return SeatHold.objects.create(
+            batch_id=batch_id, user=user, seats=seats,
+            expires_at=timezone.now() + timedelta(minutes=HOLD_MINUTES),
+        )
+    except DatabaseError:
+        release_seats(batch_id, seats)
+        raise
+
+
+def _release_holds(holds):
+    released = 0
+    for hold in holds:
+        deleted, _ = SeatHold.objects.filter(pk=hold.pk).delete()
+        if deleted:
+            release_seats(hold.batch_id, hold.seats)
+            released += 1
+    return released
+
+
+def release_hold(hold):
+    """Deletes the hold and gives its seats back; False if it was already gone."""
+    return _release_holds([hold]) == 1
+
+
+def release_expired_holds(batch_id=None):
+    """Releases the expired holds (of one batch); returns how many."""
+    holds = SeatHold.objects.filter(expires_at__lte=timezone.now())
+    if batch_id is not None:
+        holds = holds.filter(batch_id=batch_id)
+    return _release_holds(holds.only("id", "batch_id", "seats"))
+
+
+# ─── Bookings ────────────────────────────────────────────────────────────────
+
+def book_seats(user, batch_id, seats, hold_id=None):
+    """
+    Takes the seats of a new booking: those of the user's unexpired hold
+    `hold_id` on the batch first, topped up or trimmed to `seats`, or fresh
+    ones when there is no such hold. Returns whether the booking has its
+    seats. A claimed hold is gone either way.
+    """
+    hold = None
+    if hold_id is not None:
+        hold = SeatHold.objects.filter(
+            pk=hold_id, user=user, batch_id=batch_id, expires_at__gt=timezone.now(),
+        ).first()
+    if hold is None or not SeatHold.objects.filter(pk=hold.pk).delete()[0]:
+        return reserve_seats(batch_id, seats)
+
+    if seats > hold.seats and not reserve_seats(batch_id, seats - hold.seats):
+        release_seats(batch_id, hold.seats)
+        return False
+    if seats < hold.seats:
+        release_seats(batch_id, hold.seats - seats)
+    return True
+
+
+def change_booking_status(booking, status):
+    """
+    Sets booking.status (the caller saves it), giving the booking's seats
+    back when it is declined and taking them again when a declined booking
+    is reinstated. Returns False, changing nothing, if the batch has no
+    seats left for the reinstated booking.
+    """
+    declining = status == "DECLINED"
+    if booking.batch_id is None or declining == (booking.status == "DECLINED"):
+        booking.status = status
+        return True
+
+    if declining:
+        if Booking.objects.filter(pk=booking.pk).exclude(status="DECLINED").update(status=status):
+            release_seats(booking.batch_id, booking.persons)
+    else:
+        if not reserve_seats(booking.batch_id, booking.persons):
+            return False
+        if not Booking.objects.filter(pk=booking.pk, status="DECLINED").update(status=status):
+            # Reinstated by someone else meanwhile, with their own seats
+            release_seats(booking.batch_id, booking.persons)
+    booking.status = status
+    return True
+
+
+def release_user_seats(user):
+    """
+    Gives back the seats of the user's holds and undeclined bookings, before
+    they are deleted along with the user.
+    """
+    _release_holds(user.seat_holds.only("id", "batch_id", "seats"))
+    bookings = user.bookings.filter(batch__isnull=False).exclude(status="DECLINED")
+    for booking in bookings.only("id", "batch_id", "persons", "status"):
+        change_booking_status(booking, "DECLINED")
+
+
+# ─── Batches ─────────────────────────────────────────────────────────────────
+
+def batches_in_use(batches):
+    """
+    Those of `batches` (a TripBatch queryset) with undeclined bookings or
+    unexpired holds. Deleting one would unlink the bookings and drop the
+    holds, and with them the count of seats sold; it can be set to Full
+    instead.
+    """
+    return batches.filter(
+        Exists(Booking.objects.filter(batch=OuterRef("pk")).exclude(status="DECLINED"))
+        | Exists(SeatHold.objects.filter(batch=OuterRef("pk"), expires_at__gt=timezone.now()))
+    )
@@ -0,0 +1,218 @@
+"""
+Latency / throughput benchmark for the public API.
+
+    python manage.py benchmark_api --trips 500 --bookings 5000 --requests 200 --concurrency 8 --output bench.json
+
+Creates a throwaway test database, seeds it with seeding.seed_catalog(),
+starts Django's live test server on a free port and hits each endpoint with
+a pool of concurrent clients. Prints p50/p95/p99 latency and throughput per
+endpoint and, with --output, writes them as JSON (tagged with the current git
+commit) so runs can be compared across commits. The real database is never
+touched.
+"""
+
+import json
+import statistics
+import subprocess
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.core.servers.basehttp import WSGIRequestHandler
+from django.db import connections
+from django.test.testcases import LiveServerThread
+from django.test.utils import setup_test_environment, teardown_test_environment
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from ...catalog_cache import clear_local_cache
+from ...models import Coupon, Trip, TripSection, TripView
+from ...seeding import seed_catalog
+
+
+class QuietRequestHandler(WSGIRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+class PassThroughStaticHandler:
+    """The API serves no static files; LiveServerThread still wants a handler."""
+
+    def __init__(self, application):
+        self.application = application
+
+    def __call__(self, environ, start_response):
+        return self.application(environ, start_response)
+
+
+class BenchmarkServerThread(LiveServerThread):
+    def _create_server(self, connections_override=None):
+        return self.server_class(
+            (self.host, self.port),
+            QuietRequestHandler,
+            allow_reuse_address=False,
+            connections_override=connections_override,
+        )
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted, non-empty list."""
+    rank = max(1, round(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def current_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class Command(BaseCommand):
+    help = "Seeds a synthetic catalog in a test database and benchmarks the public API against the live test server."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--trips", type=int, default=300)
+        parser.add_argument("--users", type=int, default=200)
+        parser.add_argument("--bookings", type=int, default=3000)
+        parser.add_argument("--views", type=int, default=3000)
+        parser.add_argument("--reviews", type=int, default=1000)
+        parser.add_argument("--requests", type=int, default=100, help="Requests per endpoint")
+        parser.add_argument("--concurrency", type=int, default=4, help="Concurrent clients")
+        parser.add_argument("--warmup", type=int, default=5, help="Unmeasured requests per endpoint")
+        parser.add_argument("--output", help="Write results as JSON to this path")
+
+    def handle(self, *args, **options):
+        if options["requests"] < 1 or options["concurrency"] < 1:
+            raise CommandError("--requests and --concurrency must be at least 1.")
+
+        setup_test_environment()
+        connection = connections["default"]
+        old_name = connection.settings_dict["NAME"]
+        connection.creation.create_test_db(verbosity=0, autoclobber=True)
+        server = None
+
+        try:
+            self.stdout.write("Seeding catalog...")
+            seed_catalog(
+                trips=options["trips"], users=options["users"], bookings=options["bookings"],
+                views=options["views"], reviews=options["reviews"],
+            )
+            clear_local_cache()
+
+            server = self.start_server(connection)
+            base_url = f"http://{server.host}:{server.port}"
+            results = {}
+            for name, method, path, body, token in self.endpoints():
+                results[name] = self.run_endpoint(base_url, method, path, body, token, options)
+                self.report(name, results[name])
+
+            if options["output"]:
+                payload = {
+                    "commit": current_commit(),
+                    "created_at": datetime.now(timezone.utc).isoformat(),
+                    "database": connection.vendor,
+                    "options": {key: options[key] for key in (
+                        "trips", "users", "bookings", "views", "reviews", "requests", "concurrency", "warmup",
+                    )},
+                    "endpoints": results,
+                }
+                with open(options["output"], "w") as f:
+                    json.dump(payload, f, indent=2)
+                self.stdout.write(self.style.SUCCESS(f"Results written to {options['output']}"))
+        finally:
+            if server is not None:
+                server.terminate()
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+
+    def start_server(self, connection):
+        # Same arrangement as LiveServerTestCase: an in-memory SQLite test
+        # database only exists on this thread's connection, so share it.
+        connections_override = {}
+        if connection.vendor == "sqlite" and connection.is_in_memory_db():
+            connection.inc_thread_sharing()
+            connections_override[connection.alias] = connection
+
+        server = BenchmarkServerThread("localhost", PassThroughStaticHandler, connections_override=connections_override)
+        server.daemon = True
+        server.start()
+        server.is_ready.wait()
+        if server.error:
+            raise server.error
+        return server
+
+    def endpoints(self):
+        """(name, method, path, json body, bearer token) for each benchmarked endpoint."""
+        trip = Trip.objects.filter(is_active=True).order_by("id").first()
+        section = TripSection.objects.filter(trip__is_active=True).values_list("section", flat=True).first()
+        traveller = TripView.objects.values_list("user", flat=True).first()
+        traveller_token = str(RefreshToken.for_user(User.objects.get(pk=traveller)).access_token)
+        coupon = Coupon.objects.filter(user=None, trip=None).first()
+        booking = {
+            "trip": trip.pk, "persons": 2, "full_name": "Bench Traveller", "email": "bench@example.com",
+            "phone": "9999999999", "coupon_code": coupon.code,
+        }
+
+        return [
+            ("trip_list", "GET", "/v1/trips/", None, None),
+            ("trip_detail", "GET", f"/v1/trips/{trip.pk}/", None, None),
+            ("home_page", "GET", "/v1/home/", None, None),
+            ("section_trips", "GET", f"/v1/trips/{section.replace('_', '-')}/", None, None),
+            ("featured_trips", "GET", "/v1/trips/featured/", None, None),
+            ("good_friday_trips", "GET", "/v1/trips/good-friday/", None, None),
+            ("journey_in_frames_trips", "GET", "/v1/gallery/journey-frames/", None, None),
+            ("recommended_trips", "GET", "/v1/trips/recommended/", None, traveller_token),
+            ("applicable_coupons_view", "GET", f"/v1/coupons/applicable/?trip_id={trip.pk}&booking_amount={trip.price}", None, traveller_token),
+            ("create_booking", "POST", "/v1/bookings/create/", booking, traveller_token),
+        ]
+
+    def run_endpoint(self, base_url, method, path, body, token, options):
+        headers = {"Content-Type": "application/json"}
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+        data = json.dumps(body).encode() if body is not None else None
+
+        def call(_):
+            request = urllib.request.Request(base_url + path, data=data, headers=headers, method=method)
+            started = time.perf_counter()
+            try:
+                with urllib.request.urlopen(request) as response:
+                    response.read()
+                    ok = response.status < 400
+            except urllib.error.HTTPError:
+                ok = False
+            return (time.perf_counter() - started) * 1000, ok
+
+        with ThreadPoolExecutor(max_workers=options["concurrency"]) as pool:
+            list(pool.map(call, range(options["warmup"])))
+            started = time.perf_counter()
+            samples = list(pool.map(call, range(options["requests"])))
+            elapsed = time.perf_counter() - started
+
+        latencies = sorted(ms for ms, _ in samples)
+        return {
+            "method": method,
+            "path": path,
+            "requests": len(samples),
+            "errors": sum(1 for _, ok in samples if not ok),
+            "mean_ms": round(statistics.fmean(latencies), 2),
+            "p50_ms": round(percentile(latencies, 50), 2),
+            "p95_ms": round(percentile(latencies, 95), 2),
+            "p99_ms": round(percentile(latencies, 99), 2),
+            "throughput_rps": round(len(samples) / elapsed, 1),
+        }
+
+    def report(self, name, result):
+        line = (
+            f"{name:<26} p50 {result['p50_ms']:>8} ms  p95 {result['p95_ms']:>8} ms  "
+            f"p99 {result['p99_ms']:>8} ms  {result['throughput_rps']:>7} req/s"
+        )
+        if result["errors"]:
+            line += self.style.ERROR(f"  {result['errors']} errors")
+        self.stdout.write(line)
@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from ...recommendations import build_recommendations, build_trip_similarities, prune_view_counts
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuilds the precomputed trip recommendations (TripRecommendation) and similar trips "
+        "(TripSimilarity) from trip views, and prunes old hourly view counts (TripViewCount)."
+    )
+
+    def handle(self, *args, **options):
+        users = build_recommendations()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt recommendations for {users} users."))
+        trips = build_trip_similarities()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt similar trips for {trips} trips."))
+        buckets = prune_view_counts()
+        self.stdout.write(self.style.SUCCESS(f"Pruned {buckets} old hourly view counts."))
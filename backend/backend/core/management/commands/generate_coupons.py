@@ -0,0 +1,48 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError
+
+from ...coupon_bulk import DEFAULT_CODE_LENGTH, generate_coupons
+from ...serializers import CouponBulkCreateSerializer
+
+
+class Command(BaseCommand):
+    help = "Creates a batch of coupons with new random codes (e.g. for a campaign) and prints the codes."
+
+    def add_arguments(self, parser):
+        parser.add_argument("count", type=int)
+        parser.add_argument("--discount-value", required=True)
+        parser.add_argument("--discount-type", choices=["PERCENTAGE", "FLAT"], default="PERCENTAGE")
+        parser.add_argument("--max-discount")
+        parser.add_argument("--min-booking-amount")
+        parser.add_argument("--expiry-date", help="ISO 8601, e.g. 2027-03-31T23:59:59+05:30")
+        parser.add_argument("--usage-limit", type=int, help="Uses per code (default: unlimited)")
+        parser.add_argument("--trip", type=int, help="Only valid for this trip id")
+        parser.add_argument("--prefix", default="")
+        parser.add_argument("--code-length", type=int, default=DEFAULT_CODE_LENGTH)
+        parser.add_argument("--output", help="Write the codes to this file instead of stdout")
+
+    def handle(self, *args, **options):
+        data = {
+            name: options[name]
+            for name in (
+                "count", "discount_value", "discount_type", "max_discount", "min_booking_amount",
+                "expiry_date", "usage_limit", "trip", "prefix", "code_length",
+            )
+            if options[name] is not None
+        }
+        serializer = CouponBulkCreateSerializer(data=data)
+        if not serializer.is_valid():
+            raise CommandError("; ".join(
+                f"{field}: {' '.join(map(str, errors))}" for field, errors in serializer.errors.items()
+            ))
+        try:
+            codes = generate_coupons(**serializer.validated_data)
+        except (ValueError, IntegrityError) as e:
+            raise CommandError(e)
+
+        if options["output"]:
+            with open(options["output"], "w") as output:
+                output.writelines(f"{code}\n" for code in codes)
+        else:
+            self.stdout.write("\n".join(codes))
+        self.stderr.write(self.style.SUCCESS(f"Created {len(codes)} coupons."))
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from ...coupon_bulk import IMPORT_COLUMNS, import_coupons_csv
+
+
+class Command(BaseCommand):
+    help = (
+        "Creates the coupons of a CSV file with a header row of "
+        f"{', '.join(IMPORT_COLUMNS)} (code and discount_value required). All or nothing."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path")
+
+    def handle(self, *args, **options):
+        try:
+            with open(options["path"], encoding="utf-8-sig", newline="") as lines:
+                created = import_coupons_csv(lines)
+        except (OSError, ValueError) as e:
+            raise CommandError(e)
+        self.stdout.write(self.style.SUCCESS(f"Imported {created} coupons."))
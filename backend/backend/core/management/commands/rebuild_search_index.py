@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from ...search import rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the full-text trip search index (core_trip_search) from scratch, e.g. after bulk imports."
+
+    def handle(self, *args, **options):
+        trips = rebuild_search_index()
+        self.stdout.write(self.style.SUCCESS(f"Indexed {trips} trips."))
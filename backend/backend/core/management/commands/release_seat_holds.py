@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from ...inventory import release_expired_holds
+
+
+class Command(BaseCommand):
+    help = "Gives the seats of expired checkout holds back to their batches. Run it every few minutes (cron)."
+
+    def handle(self, *args, **options):
+        released = release_expired_holds()
+        self.stdout.write(self.style.SUCCESS(f"Released {released} expired seat holds."))
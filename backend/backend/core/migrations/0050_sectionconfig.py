@@ -0,0 +1,129 @@
+# Generated by Django 6.0.1 on 2026-10-17 18:18
+
+from django.db import migrations, models
+
+
+# Old singleton config model -> section key in core/sections.py
+LEGACY_CONFIG_MODELS = {
+    'InternationalSectionConfig': 'international',
+    'IndiaSectionConfig': 'india',
+    'NorthIndiaSectionConfig': 'north_india',
+    'HimachalSectionConfig': 'himachal',
+    'UttarakhandSectionConfig': 'uttarakhand',
+    'HoneymoonSectionConfig': 'honeymoon',
+    'HimalayanSectionConfig': 'himalayan',
+    'BackpackingSectionConfig': 'backpacking',
+    'SummerSectionConfig': 'summer',
+    'MonsoonSectionConfig': 'monsoon',
+    'CommunitySectionConfig': 'community',
+    'FestivalSectionConfig': 'festival',
+    'AdventureSectionConfig': 'adventure',
+    'BikingSectionConfig': 'biking',
+    'LongWeekendSectionConfig': 'long_weekend',
+    'GirlsSectionConfig': 'girls',
+}
+
+
+def copy_legacy_configs(apps, schema_editor):
+    SectionConfig = apps.get_model('core', 'SectionConfig')
+    for model_name, section in LEGACY_CONFIG_MODELS.items():
+        legacy = apps.get_model('core', model_name).objects.filter(pk=1).first()
+        if legacy is None:
+            continue
+        SectionConfig.objects.create(
+            section=section,
+            is_enabled=legacy.is_enabled,
+            title=legacy.title,
+            subtitle=legacy.subtitle,
+            scroll_speed=legacy.scroll_speed,
+        )
+
+
+def restore_legacy_configs(apps, schema_editor):
+    SectionConfig = apps.get_model('core', 'SectionConfig')
+    for model_name, section in LEGACY_CONFIG_MODELS.items():
+        config = SectionConfig.objects.filter(section=section).first()
+        if config is None:
+            continue
+        apps.get_model('core', model_name).objects.create(
+            pk=1,
+            is_enabled=config.is_enabled,
+            title=config.title,
+            subtitle=config.subtitle,
+            scroll_speed=config.scroll_speed,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0049_girlssectionconfig_trip_girls_display_order_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SectionConfig',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('section', models.CharField(help_text='Section key, e.g. north_india', max_length=50, unique=True)),
+                ('is_enabled', models.BooleanField(default=True, help_text="Enable the section's scrolling showcase")),
+                ('title', models.CharField(blank=True, default='', max_length=200)),
+                ('subtitle', models.CharField(blank=True, default='', help_text='Optional subtitle below the heading', max_length=300)),
+                ('scroll_speed', models.PositiveIntegerField(default=60, help_text='Animation duration in seconds (higher = slower)')),
+            ],
+            options={
+                'verbose_name': 'Section Config',
+                'verbose_name_plural': 'Section Configs',
+                'ordering': ['id'],
+            },
+        ),
+        migrations.RunPython(copy_legacy_configs, restore_legacy_configs),
+        migrations.DeleteModel(
+            name='AdventureSectionConfig',
+        ),
+        migrations.DeleteModel(
+            name='BackpackingSectionConfig',
+        ),
+        migrations.DeleteModel(
+            name='BikingSectionConfig',
+        ),
+        migrations.DeleteModel(
+            name='CommunitySectionConfig',
+        ),
+        migrations.DeleteModel(
+            name='FestivalSectionConfig',
+        ),
+        migrations.DeleteModel(
+            name='GirlsSectionConfig',
+        ),
+        migrations.DeleteModel(
+            name='HimachalSectionConfig',
+        ),
+        migrations.DeleteModel(
+            name='HimalayanSectionConfig',
+        ),
+        migrations.DeleteModel(
+            name='HoneymoonSectionConfig',
+        ),
+        migrations.DeleteModel(
+            name='IndiaSectionConfig',
+        ),
+        migrations.DeleteModel(
+            name='InternationalSectionConfig',
+        ),
+        migrations.DeleteModel(
+            name='LongWeekendSectionConfig',
+        ),
+        migrations.DeleteModel(
+            name='MonsoonSectionConfig',
+        ),
+        migrations.DeleteModel(
+            name='NorthIndiaSectionConfig',
+        ),
+        migrations.DeleteModel(
+            name='SummerSectionConfig',
+        ),
+        migrations.DeleteModel(
+            name='UttarakhandSectionConfig',
+        ),
+    ]
@@ -0,0 +1,328 @@
+# Generated by Django 6.0.1 on 2026-10-17 18:23
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+# Section key -> (member flag, visible flag, order column, priority column)
+# as they were on Trip before this migration.
+LEGACY_SECTION_COLUMNS = {
+    "international": ("is_international", "show_in_international_section", "display_order", None),
+    "india": ("is_india_trip", "show_in_india_section", "india_display_order", "india_featured_priority"),
+    "north_india": ("is_north_india_trip", "show_in_north_india_section", "north_india_display_order", "north_india_featured_priority"),
+    "himachal": ("is_himachal_trip", "show_in_himachal_section", "himachal_display_order", "himachal_featured_priority"),
+    "uttarakhand": ("is_uttarakhand_trip", "show_in_uttarakhand_section", "uttarakhand_display_order", "uttarakhand_featured_priority"),
+    "honeymoon": ("is_honeymoon", "show_in_honeymoon_section", "honeymoon_display_order", "honeymoon_featured_priority"),
+    "himalayan": ("is_himalayan_trek", "show_in_himalayan_section", "himalayan_display_order", None),
+    "backpacking": ("is_backpacking_trip", "show_in_backpacking_section", "backpacking_display_order", "backpacking_featured_priority"),
+    "summer": ("is_summer_trek", "show_in_summer_section", "summer_display_order", "summer_featured_priority"),
+    "monsoon": ("is_monsoon_trek", "show_in_monsoon_section", "monsoon_display_order", "monsoon_featured_priority"),
+    "community": ("is_community_trip", "show_in_community_section", "community_display_order", None),
+    "festival": ("is_festival_trip", "show_in_festival_section", "festival_display_order", "festival_featured_priority"),
+    "adventure": ("is_adventure_trip", "show_in_adventure_section", "adventure_display_order", None),
+    "biking": ("is_biking_trip", "show_in_biking_section", "biking_display_order", "biking_featured_priority"),
+    "long_weekend": ("is_long_weekend_trip", "show_in_long_weekend_section", "long_weekend_display_order", "long_weekend_featured_priority"),
+    "girls": ("is_girls_trip", "show_in_girls_section", "girls_display_order", "girls_featured_priority"),
+}
+
+
+def copy_section_columns(apps, schema_editor):
+    """Creates a TripSection row for every section a trip was flagged into."""
+    Trip = apps.get_model("core", "Trip")
+    TripSection = apps.get_model("core", "TripSection")
+
+    memberships = []
+    for trip in Trip.objects.iterator():
+        for section, (member, visible, order, priority) in LEGACY_SECTION_COLUMNS.items():
+            if not getattr(trip, member):
+                continue
+            memberships.append(TripSection(
+                trip_id=trip.pk,
+                section=section,
+                visible=getattr(trip, visible),
+                display_order=getattr(trip, order),
+                featured_priority=getattr(trip, priority) if priority else 0,
+            ))
+    TripSection.objects.bulk_create(memberships, batch_size=500)
+
+
+def restore_section_columns(apps, schema_editor):
+    """Writes TripSection rows back onto the re-added Trip columns."""
+    Trip = apps.get_model("core", "Trip")
+    TripSection = apps.get_model("core", "TripSection")
+
+    for membership in TripSection.objects.all():
+        if membership.section not in LEGACY_SECTION_COLUMNS:
+            continue
+        member, visible, order, priority = LEGACY_SECTION_COLUMNS[membership.section]
+        values = {member: True, visible: membership.visible, order: membership.display_order}
+        if priority:
+            values[priority] = membership.featured_priority
+        Trip.objects.filter(pk=membership.trip_id).update(**values)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0050_sectionconfig'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TripSection',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('section', models.CharField(help_text='Section key from sections.py, e.g. north_india', max_length=50)),
+                ('visible', models.BooleanField(default=True, help_text="Show in the section's scrolling showcase")),
+                ('display_order', models.IntegerField(default=0, help_text='Order in the section (lower = first)')),
+                ('featured_priority', models.IntegerField(default=0, help_text='Featured priority (higher = more prominent)')),
+                ('trip', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='section_memberships', to='core.trip')),
+            ],
+            options={
+                'ordering': ['section', 'display_order', '-trip_id'],
+                'indexes': [models.Index(fields=['section', 'visible', 'display_order'], name='tripsection_listing_idx')],
+                'constraints': [models.UniqueConstraint(fields=('trip', 'section'), name='unique_trip_section')],
+            },
+        ),
+        migrations.RunPython(copy_section_columns, restore_section_columns),
+        migrations.RemoveField(
+            model_name='trip',
+            name='adventure_display_order',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='backpacking_display_order',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='backpacking_featured_priority',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='biking_display_order',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='biking_featured_priority',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='community_display_order',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='display_order',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='festival_display_order',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='festival_featured_priority',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='girls_display_order',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='girls_featured_priority',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='himachal_display_order',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='himachal_featured_priority',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='himalayan_display_order',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='honeymoon_display_order',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='honeymoon_featured_priority',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='india_display_order',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='india_featured_priority',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='is_adventure_trip',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='is_backpacking_trip',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='is_biking_trip',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='is_community_trip',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='is_festival_trip',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='is_girls_trip',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='is_himachal_trip',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='is_himalayan_trek',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='is_honeymoon',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='is_india_trip',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='is_international',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='is_long_weekend_trip',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='is_monsoon_trek',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='is_north_india_trip',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='is_summer_trek',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='is_uttarakhand_trip',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='long_weekend_display_order',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='long_weekend_featured_priority',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='monsoon_display_order',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='monsoon_featured_priority',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='north_india_display_order',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='north_india_featured_priority',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='show_in_adventure_section',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='show_in_backpacking_section',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='show_in_biking_section',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='show_in_community_section',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='show_in_festival_section',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='show_in_girls_section',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='show_in_himachal_section',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='show_in_himalayan_section',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='show_in_honeymoon_section',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='show_in_india_section',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='show_in_international_section',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='show_in_long_weekend_section',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='show_in_monsoon_section',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='show_in_north_india_section',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='show_in_summer_section',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='show_in_uttarakhand_section',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='summer_display_order',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='summer_featured_priority',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='uttarakhand_display_order',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='uttarakhand_featured_priority',
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 6.0.1 on 2026-10-17 18:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0051_tripsection'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='trip',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['id'], name='trip_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='trip',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['category', 'id'], name='trip_active_category_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='trip',
+            index=models.Index(condition=models.Q(('is_active', True), ('is_featured', True)), fields=['-id'], name='trip_featured_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='trip',
+            index=models.Index(condition=models.Q(('is_active', True), ('show_in_journey_in_frames', True)), fields=['journey_in_frames_order', '-id'], name='trip_journey_in_frames_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='trip',
+            index=models.Index(condition=models.Q(('is_active', True), ('show_in_good_friday_section', True)), fields=['good_friday_display_order'], name='trip_good_friday_section_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='trip',
+            index=models.Index(condition=models.Q(('is_active', True), ('is_good_friday_trip', True)), fields=['id'], name='trip_good_friday_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tripsection',
+            index=models.Index(condition=models.Q(('visible', True)), fields=['section', '-featured_priority', 'display_order', '-trip'], name='tripsection_priority_idx'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 6.0.1 on 2026-10-17 18:52
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0054_updated_at'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TripRecommendation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('rank', models.PositiveSmallIntegerField(help_text="Position in the user's list (0 = best)")),
+                ('score', models.FloatField()),
+                ('trip', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='recommendations', to='core.trip')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='trip_recommendations', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['user', 'rank'],
+                'constraints': [models.UniqueConstraint(fields=('user', 'rank'), name='unique_user_recommendation_rank')],
+            },
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 6.0.1 on 2026-10-17 19:04
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0055_triprecommendation'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TripSimilarity',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('rank', models.PositiveSmallIntegerField(help_text="Position among the trip's neighbours (0 = most similar)")),
+                ('score', models.FloatField(help_text="Cosine similarity of the two trips' viewers")),
+                ('similar_trip', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='similar_to', to='core.trip')),
+                ('trip', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='similarities', to='core.trip')),
+            ],
+            options={
+                'ordering': ['trip', 'rank'],
+                'constraints': [models.UniqueConstraint(fields=('trip', 'rank'), name='unique_trip_similarity_rank')],
+            },
+        ),
+    ]
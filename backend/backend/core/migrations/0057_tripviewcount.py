@@ -0,0 +1,28 @@
+# Generated by Django 6.0.1 on 2026-10-17 19:21
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0056_tripsimilarity'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TripViewCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('hour', models.DateTimeField(help_text='Start of the hour the views fall in')),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('trip', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='view_counts', to='core.trip')),
+            ],
+            options={
+                'ordering': ['-hour'],
+                'indexes': [models.Index(fields=['hour'], name='tripviewcount_hour_idx')],
+                'constraints': [models.UniqueConstraint(fields=('trip', 'hour'), name='unique_trip_view_count_hour')],
+            },
+        ),
+    ]
@@ -0,0 +1,87 @@
+# Generated by Django 6.0.1 on 2026-10-17 20:05
+
+from django.db import migrations
+
+
+# Full-text index over trips (see core/search.py). Not a model: an FTS5
+# virtual table on SQLite, a tsvector + GIN table on PostgreSQL, nothing
+# elsewhere (search falls back to icontains filters there).
+
+SQLITE_SQL = (
+    "CREATE VIRTUAL TABLE core_trip_search USING fts5("
+    "title, location, state, country, short_description, highlights, itinerary, "
+    "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+)
+
+POSTGRES_SQL = [
+    "CREATE TABLE core_trip_search ("
+    "trip_id bigint PRIMARY KEY REFERENCES core_trip (id) ON DELETE CASCADE DEFERRABLE INITIALLY DEFERRED, "
+    "document tsvector NOT NULL)",
+    "CREATE INDEX core_trip_search_document_idx ON core_trip_search USING GIN (document)",
+]
+
+
+# Frozen copy of search.trip_document() as of this migration, so later
+# changes to search.py or Trip cannot change what it does
+SEARCH_FIELDS = ["title", "location", "state", "country", "short_description", "highlights", "itinerary"]
+POSTGRES_WEIGHTS = ["A", "B", "B", "B", "C", "C", "D"]
+
+
+def _document(title, location, state, country, short_description, highlights, itinerary):
+    texts = []
+    for item in highlights if isinstance(highlights, list) else ():
+        if isinstance(item, dict):
+            texts.extend(str(item[key]) for key in ("title", "description") if item.get(key))
+        elif item:
+            texts.append(str(item))
+    days = []
+    for day in itinerary or ():
+        if isinstance(day, str):
+            days.append(day)
+        elif isinstance(day, dict) and day.get("title"):
+            days.append(str(day["title"]))
+    return [
+        title, location, state, country, short_description,
+        " ".join(texts),
+        " ".join(days),
+    ]
+
+
+def create_search_table(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor == "sqlite":
+        schema_editor.execute(SQLITE_SQL)
+        placeholders = ", ".join(["%s"] * (len(SEARCH_FIELDS) + 1))
+        insert = f"INSERT INTO core_trip_search (rowid, {', '.join(SEARCH_FIELDS)}) VALUES ({placeholders})"
+    elif connection.vendor == "postgresql":
+        for sql in POSTGRES_SQL:
+            schema_editor.execute(sql)
+        document = " || ".join(f"setweight(to_tsvector('simple', %s), '{weight}')" for weight in POSTGRES_WEIGHTS)
+        insert = f"INSERT INTO core_trip_search (trip_id, document) VALUES (%s, {document})"
+    else:
+        return
+
+    Trip = apps.get_model("core", "Trip")
+    rows = [
+        (trip_id, *_document(*fields))
+        for trip_id, *fields in Trip.objects.values_list("id", *SEARCH_FIELDS).iterator()
+    ]
+    with connection.cursor() as cursor:
+        for start in range(0, len(rows), 500):
+            cursor.executemany(insert, rows[start:start + 500])
+
+
+def drop_search_table(apps, schema_editor):
+    if schema_editor.connection.vendor in ("sqlite", "postgresql"):
+        schema_editor.execute("DROP TABLE IF EXISTS core_trip_search")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0057_tripviewcount'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_table, drop_search_table),
+    ]
@@ -0,0 +1,88 @@
+# Generated by Django 6.0.1 on 2026-10-17 20:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.utils.dateparse import parse_date
+
+
+STATUSES = {"available": "Available", "filling fast": "Filling Fast", "full": "Full"}
+
+
+def _date(value):
+    """A JSON batch date ("2026-12-04", "2026-12-04T00:00:00Z", ...) or None."""
+    try:
+        return parse_date(str(value or "")[:10])
+    except ValueError:
+        return None
+
+
+def copy_batches_json(apps, schema_editor):
+    """Creates a TripBatch row for every entry of a trip's batches JSON with a readable start date."""
+    Trip = apps.get_model("core", "Trip")
+    TripBatch = apps.get_model("core", "TripBatch")
+
+    rows = []
+    for trip_id, batches in Trip.objects.values_list("id", "legacy_batches").iterator():
+        for batch in batches if isinstance(batches, list) else ():
+            if not isinstance(batch, dict) or _date(batch.get("startDate")) is None:
+                continue
+            rows.append(TripBatch(
+                trip_id=trip_id,
+                start_date=_date(batch["startDate"]),
+                end_date=_date(batch.get("endDate")),
+                status=STATUSES.get(str(batch.get("status", "")).strip().lower(), "Available"),
+            ))
+    TripBatch.objects.bulk_create(rows, batch_size=500)
+
+
+def restore_batches_json(apps, schema_editor):
+    """Writes TripBatch rows back into the re-added JSON column."""
+    Trip = apps.get_model("core", "Trip")
+    TripBatch = apps.get_model("core", "TripBatch")
+
+    batches = {}
+    for batch in TripBatch.objects.order_by("start_date", "id"):
+        batches.setdefault(batch.trip_id, []).append({
+            "startDate": batch.start_date.isoformat(),
+            "endDate": batch.end_date.isoformat() if batch.end_date else "",
+            "status": batch.status,
+        })
+    for trip_id, trip_batches in batches.items():
+        Trip.objects.filter(pk=trip_id).update(legacy_batches=trip_batches)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0058_trip_search'),
+    ]
+
+    operations = [
+        # Out of the way of the new trip.batches reverse relation while the rows are copied
+        migrations.RenameField(
+            model_name='trip',
+            old_name='batches',
+            new_name='legacy_batches',
+        ),
+        migrations.CreateModel(
+            name='TripBatch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('start_date', models.DateField()),
+                ('end_date', models.DateField(blank=True, null=True)),
+                ('capacity', models.PositiveIntegerField(blank=True, help_text='Seats on offer (empty = not limited)', null=True)),
+                ('seats_booked', models.PositiveIntegerField(default=0)),
+                ('status', models.CharField(choices=[('Available', 'Available'), ('Filling Fast', 'Filling Fast'), ('Full', 'Full')], default='Available', max_length=20)),
+                ('trip', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='batches', to='core.trip')),
+            ],
+            options={
+                'ordering': ['start_date', 'id'],
+                'indexes': [models.Index(fields=['start_date', 'status'], name='tripbatch_departure_idx'), models.Index(fields=['trip', 'start_date'], name='tripbatch_trip_idx')],
+            },
+        ),
+        migrations.RunPython(copy_batches_json, restore_batches_json),
+        migrations.RemoveField(
+            model_name='trip',
+            name='legacy_batches',
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 6.0.1 on 2026-10-17 21:15
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0059_tripbatch'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='booking',
+            name='batch',
+            field=models.ForeignKey(blank=True, help_text='Departure whose seats this booking holds', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='bookings', to='core.tripbatch'),
+        ),
+        migrations.CreateModel(
+            name='SeatHold',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('seats', models.PositiveIntegerField()),
+                ('expires_at', models.DateTimeField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('batch', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='holds', to='core.tripbatch')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='seat_holds', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['expires_at'], name='seathold_expires_idx'), models.Index(fields=['batch', 'expires_at'], name='seathold_batch_expires_idx')],
+            },
+        ),
+    ]
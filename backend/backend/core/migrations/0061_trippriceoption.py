@@ -0,0 +1,80 @@
+# Generated by Django 6.0.1 on 2026-10-17 22:05
+
+from decimal import Decimal, InvalidOperation
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def _price(value):
+    """A JSON option price (12000, "12000", "12,000.00", ...) as an int, or None."""
+    try:
+        return int(Decimal(str(value).replace(",", "").strip()))
+    except (InvalidOperation, ValueError, OverflowError):
+        return None
+
+
+def copy_price_options_json(apps, schema_editor):
+    """Creates a TripPriceOption row for every entry of a trip's price_options JSON with an occupancy and a price."""
+    Trip = apps.get_model("core", "Trip")
+    TripPriceOption = apps.get_model("core", "TripPriceOption")
+
+    rows = []
+    for trip_id, options in Trip.objects.values_list("id", "legacy_price_options").iterator():
+        position = 0
+        for option in options if isinstance(options, list) else ():
+            if not isinstance(option, dict):
+                continue
+            occupancy = str(option.get("occupancy") or "").strip()[:50]
+            price = _price(option.get("price"))
+            if not occupancy or price is None:
+                continue
+            rows.append(TripPriceOption(trip_id=trip_id, occupancy=occupancy, price=price, position=position))
+            position += 1
+    TripPriceOption.objects.bulk_create(rows, batch_size=500)
+
+
+def restore_price_options_json(apps, schema_editor):
+    """Writes TripPriceOption rows back into the re-added JSON column."""
+    Trip = apps.get_model("core", "Trip")
+    TripPriceOption = apps.get_model("core", "TripPriceOption")
+
+    options = {}
+    for option in TripPriceOption.objects.order_by("position", "id"):
+        options.setdefault(option.trip_id, []).append({"occupancy": option.occupancy, "price": option.price})
+    for trip_id, trip_options in options.items():
+        Trip.objects.filter(pk=trip_id).update(legacy_price_options=trip_options)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0060_seat_inventory'),
+    ]
+
+    operations = [
+        # Out of the way of the new trip.price_options reverse relation while the rows are copied
+        migrations.RenameField(
+            model_name='trip',
+            old_name='price_options',
+            new_name='legacy_price_options',
+        ),
+        migrations.CreateModel(
+            name='TripPriceOption',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('occupancy', models.CharField(max_length=50)),
+                ('price', models.IntegerField()),
+                ('position', models.PositiveSmallIntegerField(default=0, help_text='Order on the trip page')),
+                ('trip', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='price_options', to='core.trip')),
+            ],
+            options={
+                'ordering': ['position', 'id'],
+            },
+        ),
+        migrations.RunPython(copy_price_options_json, restore_price_options_json),
+        migrations.RemoveField(
+            model_name='trip',
+            name='legacy_price_options',
+        ),
+    ]
@@ -1,6 +1,9 @@
+from django.core.exceptions import ValidationError
 from django.db import models
 from django.contrib.auth.models import User
 
+from .sections import SECTIONS
+
 # Create your models here.
 
 
@@ -12,6 +15,7 @@ class Category(models.Model):
     emoji = models.CharField(max_length=10, blank=True, default="")
     grad_start = models.CharField(max_length=20, blank=True, default="#3f9e8f", help_text="Gradient start colour hex")
     grad_end = models.CharField(max_length=20, blank=True, default="#2ecc71", help_text="Gradient end colour hex")
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name_plural = "Categories"
@@ -36,102 +40,17 @@ class Trip(models.Model):
     is_active = models.BooleanField(default=True)
     category = models.ForeignKey(Category, on_delete=models.SET_NULL, null=True, blank=True, related_name="trips")
 
-    # International showcase fields
+    # Card fields shown in the showcase sections. Section membership itself
+    # lives in TripSection (see sections.py).
     country = models.CharField(max_length=100, blank=True, default="", help_text="Country name for international trips")
     short_description = models.CharField(max_length=300, blank=True, default="", help_text="Short tagline for card overlay")
-    is_international = models.BooleanField(default=False, help_text="Mark as international trip")
-    show_in_international_section = models.BooleanField(default=False, help_text="Show in the scrolling international section")
-    display_order = models.IntegerField(default=0, help_text="Order in the international section (lower = first)")
-
-    # India showcase fields
     state = models.CharField(max_length=100, blank=True, default="", help_text="State/Region for India trips")
-    is_india_trip = models.BooleanField(default=False, help_text="Mark as India trip")
-    show_in_india_section = models.BooleanField(default=False, help_text="Show in the scrolling India section")
-    india_display_order = models.IntegerField(default=0, help_text="Order in the India section (lower = first)")
-    india_featured_priority = models.IntegerField(default=0, help_text="Featured priority (higher = more prominent)")
-
-    # Himachal showcase fields
-    is_himachal_trip = models.BooleanField(default=False, help_text="Mark as Himachal trip")
-    show_in_himachal_section = models.BooleanField(default=False, help_text="Show in the scrolling Himachal section")
-    himachal_display_order = models.IntegerField(default=0, help_text="Order in the Himachal section (lower = first)")
-    himachal_featured_priority = models.IntegerField(default=0, help_text="Featured priority (higher = more prominent)")
-
-    # Uttarakhand showcase fields
-    is_uttarakhand_trip = models.BooleanField(default=False, help_text="Mark as Uttarakhand trip")
-    show_in_uttarakhand_section = models.BooleanField(default=False, help_text="Show in the scrolling Uttarakhand section")
-    uttarakhand_display_order = models.IntegerField(default=0, help_text="Order in the Uttarakhand section (lower = first)")
-    uttarakhand_featured_priority = models.IntegerField(default=0, help_text="Featured priority (higher = more prominent)")
-
-    # North India showcase fields
-    is_north_india_trip = models.BooleanField(default=False, help_text="Mark as North India trip")
-    show_in_north_india_section = models.BooleanField(default=False, help_text="Show in the scrolling North India section")
-    north_india_display_order = models.IntegerField(default=0, help_text="Order in the North India section (lower = first)")
-    north_india_featured_priority = models.IntegerField(default=0, help_text="Featured priority (higher = more prominent)")
-
-    # Honeymoon showcase fields
-    is_honeymoon = models.BooleanField(default=False, help_text="Mark as honeymoon trip")
-    show_in_honeymoon_section = models.BooleanField(default=False, help_text="Show in the scrolling honeymoon section")
-    honeymoon_display_order = models.IntegerField(default=0, help_text="Order in the honeymoon section (lower = first)")
-    honeymoon_featured_priority = models.IntegerField(default=0, help_text="Featured priority (higher = more prominent)")
-
-    # Himalayan showcase fields
-    is_himalayan_trek = models.BooleanField(default=False, help_text="Mark as Himalayan trek")
-    show_in_himalayan_section = models.BooleanField(default=False, help_text="Show in the scrolling Himalayan section")
-    himalayan_display_order = models.IntegerField(default=0, help_text="Order in the Himalayan section (lower = first)")
-
-    # Backpacking showcase fields
-    is_backpacking_trip = models.BooleanField(default=False, help_text="Mark as Backpacking trip")
-    show_in_backpacking_section = models.BooleanField(default=False, help_text="Show in the scrolling Backpacking section")
-    backpacking_display_order = models.IntegerField(default=0, help_text="Order in the Backpacking section (lower = first)")
-    backpacking_featured_priority = models.IntegerField(default=0, help_text="Featured priority (higher = more prominent)")
-
-    is_summer_trek = models.BooleanField(default=False, help_text="Mark as Summer trek")
-    show_in_summer_section = models.BooleanField(default=False, help_text="Show in the scrolling Summer section")
-    summer_display_order = models.IntegerField(default=0, help_text="Order in the Summer section (lower = first)")
-    summer_featured_priority = models.IntegerField(default=0, help_text="Featured priority (higher = more prominent)")
-
-    is_monsoon_trek = models.BooleanField(default=False, help_text="Mark as Monsoon trek")
-    show_in_monsoon_section = models.BooleanField(default=False, help_text="Show in the scrolling Monsoon section")
-    monsoon_display_order = models.IntegerField(default=0, help_text="Order in the Monsoon section (lower = first)")
-    monsoon_featured_priority = models.IntegerField(default=0, help_text="Featured priority (higher = more prominent)")
-
-    is_community_trip = models.BooleanField(default=False, help_text="Mark as Community trip")
-    show_in_community_section = models.BooleanField(default=False, help_text="Show in the scrolling Community section")
-    community_display_order = models.IntegerField(default=0, help_text="Order in the Community section (lower = first)")
-
-    is_festival_trip = models.BooleanField(default=False, help_text="Mark as Festival trip")
-    show_in_festival_section = models.BooleanField(default=False, help_text="Show in the scrolling Festival section")
-    festival_display_order = models.IntegerField(default=0, help_text="Order in the Festival section (lower = first)")
-    festival_featured_priority = models.IntegerField(default=0, help_text="Featured priority (higher = more prominent)")
-
-    # Biking showcase fields
-    is_biking_trip = models.BooleanField(default=False, help_text="Mark as Biking trip")
-    show_in_biking_section = models.BooleanField(default=False, help_text="Show in the scrolling Biking section")
-    biking_display_order = models.IntegerField(default=0, help_text="Order in the Biking section (lower = first)")
-    biking_featured_priority = models.IntegerField(default=0, help_text="Featured priority (higher = more prominent)")
-
-    # Adventure showcase fields
-    is_adventure_trip = models.BooleanField(default=False, help_text="Mark as Adventure trip")
-    show_in_adventure_section = models.BooleanField(default=False, help_text="Show in the scrolling Adventure section")
-    adventure_display_order = models.IntegerField(default=0, help_text="Order in the Adventure section (lower = first)")
 
     # Good Friday showcase fields
     is_good_friday_trip = models.BooleanField(default=False, help_text="Mark as Good Friday trip")
     show_in_good_friday_section = models.BooleanField(default=False, help_text="Show in the scrolling Good Friday section")
     good_friday_display_order = models.IntegerField(default=0, help_text="Order in the Good Friday section (lower = first)")
 
-    # All Girls Group Showcase fields
-    is_girls_trip = models.BooleanField(default=False, help_text="Mark as All Girls Group trip")
-    show_in_girls_section = models.BooleanField(default=False, help_text="Show in the scrolling Girls Trips section")
-    girls_display_order = models.IntegerField(default=0, help_text="Order in the Girls Trips section (lower = first)")
-    girls_featured_priority = models.IntegerField(default=0, help_text="Featured priority (higher = more prominent)")
-
-    # Long Weekend showcase fields
-    is_long_weekend_trip = models.BooleanField(default=False, help_text="Mark as Long Weekend trip")
-    show_in_long_weekend_section = models.BooleanField(default=False, help_text="Show in the scrolling Long Weekend section")
-    long_weekend_display_order = models.IntegerField(default=0, help_text="Order in the Long Weekend section (lower = first)")
-    long_weekend_featured_priority = models.IntegerField(default=0, help_text="Featured priority (higher = more prominent)")
-
     # Featured trip showcase
     is_featured = models.BooleanField(default=False, help_text="Mark as featured trip (shows in Featured Destination section)")
     featured_highlights = models.JSONField(blank=True, null=True, help_text="List of highlight labels for floating chips, e.g. [\"Ubud · Rice Terraces\", \"Tanah Lot · Temples\"]")
@@ -142,8 +61,8 @@ class Trip(models.Model):
 
     # ── Trip Detail Page (JustWravel-style) ──
     gallery_image_urls = models.JSONField(blank=True, null=True, help_text="List of Cloudinary image URLs for the photo gallery")
-    batches = models.JSONField(blank=True, null=True, help_text='List of batch objects, e.g. [{"startDate": "...", "endDate": "...", "status": "Available/Filling Fast/Full"}]')
-    price_options = models.JSONField(blank=True, null=True, help_text='List of pricing options, e.g. [{"occupancy": "Triple", "price": 10000}, {"occupancy": "Double", "price": 12000}]')
+    # Departure batches are TripBatch rows (trip.batches)
+    # Occupancy prices are TripPriceOption rows (trip.price_options)
     overview = models.TextField(blank=True, default="", help_text="Rich overview / about text for the trip detail page")
     cancellation_policy = models.TextField(blank=True, default="", help_text="Cancellation policy text")
     things_to_pack = models.JSONField(blank=True, null=True, help_text='List of packing items, e.g. ["Warm jacket", "Trekking shoes"]')
@@ -151,12 +70,199 @@ class Trip(models.Model):
     pickup_location = models.CharField(max_length=100, blank=True, default="", help_text="Pickup city, e.g. Delhi")
     drop_location = models.CharField(max_length=100, blank=True, default="", help_text="Drop city, e.g. Delhi")
 
+    # Last modification (including deactivation) — drives /v1/trips/changes/
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        # One index per listing query. Django renders boolean filters as bare
+        # columns (WHERE "is_active"), which SQLite matches against a partial
+        # index condition but never against an index column, so the flags go
+        # in `condition` and the index keys are the ORDER BY columns.
+        indexes = [
+            models.Index(fields=["id"], condition=models.Q(is_active=True), name="trip_active_idx"),
+            models.Index(fields=["category", "id"], condition=models.Q(is_active=True), name="trip_active_category_idx"),
+            models.Index(
+                fields=["-id"], condition=models.Q(is_active=True, is_featured=True), name="trip_featured_idx",
+            ),
+            models.Index(
+                fields=["journey_in_frames_order", "-id"],
+                condition=models.Q(is_active=True, show_in_journey_in_frames=True),
+                name="trip_journey_in_frames_idx",
+            ),
+            models.Index(
+                fields=["good_friday_display_order"],
+                condition=models.Q(is_active=True, show_in_good_friday_section=True),
+                name="trip_good_friday_section_idx",
+            ),
+            models.Index(
+                fields=["id"], condition=models.Q(is_active=True, is_good_friday_trip=True), name="trip_good_friday_idx",
+            ),
+            models.Index(fields=["updated_at", "id"], name="trip_updated_idx"),
+        ]
 
     def __str__(self):
         return self.title
 
+    def get_section_membership(self, section_key):
+        """
+        Returns this trip's TripSection row for a section key, or None.
+        Memberships are read once per instance — from
+        prefetch_related("section_memberships") when the queryset has it.
+        """
+        memberships = self.__dict__.get("_section_memberships")
+        if memberships is None:
+            memberships = {membership.section: membership for membership in self.section_memberships.all()}
+            self._section_memberships = memberships
+        return memberships.get(section_key)
+
+    def clear_section_cache(self):
+        """Forgets memberships read by get_section_membership() after they were written."""
+        self.__dict__.pop("_section_memberships", None)
+        getattr(self, "_prefetched_objects_cache", {}).pop("section_memberships", None)
+
+
+class TripSection(models.Model):
+    """
+    A trip's membership in one showcase section (see sections.py). A row
+    exists only for sections the trip belongs to; the section listings are
+    range scans over (section, visible, display_order).
+    """
+    trip = models.ForeignKey(Trip, on_delete=models.CASCADE, related_name="section_memberships")
+    section = models.CharField(max_length=50, help_text="Section key from sections.py, e.g. north_india")
+    visible = models.BooleanField(default=True, help_text="Show in the section's scrolling showcase")
+    display_order = models.IntegerField(default=0, help_text="Order in the section (lower = first)")
+    featured_priority = models.IntegerField(default=0, help_text="Featured priority (higher = more prominent)")
+
+    class Meta:
+        ordering = ["section", "display_order", "-trip_id"]
+        constraints = [
+            models.UniqueConstraint(fields=["trip", "section"], name="unique_trip_section"),
+        ]
+        indexes = [
+            models.Index(fields=["section", "visible", "display_order"], name="tripsection_listing_idx"),
+            # Ordered scan for sections ranked by featured priority (see Section.ordering)
+            models.Index(
+                fields=["section", "-featured_priority", "display_order", "-trip"],
+                condition=models.Q(visible=True),
+                name="tripsection_priority_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.trip} in {self.section}"
+
+
+class TripBatch(models.Model):
+    """
+    One departure of a trip. Used to be an entry of the Trip.batches JSON
+    list; the API still renders and accepts that shape (see
+    batch_serializer.py). Departure queries ("trips leaving in December
+    with seats left") are range scans over (start_date, status).
+    """
+    STATUS_CHOICES = [
+        ("Available", "Available"),
+        ("Filling Fast", "Filling Fast"),
+        ("Full", "Full"),
+    ]
+
+    trip = models.ForeignKey(Trip, on_delete=models.CASCADE, related_name="batches")
+    start_date = models.DateField()
+    end_date = models.DateField(null=True, blank=True)
+    capacity = models.PositiveIntegerField(null=True, blank=True, help_text="Seats on offer (empty = not limited)")
+    seats_booked = models.PositiveIntegerField(default=0)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="Available")
 
+    class Meta:
+        ordering = ["start_date", "id"]
+        indexes = [
+            models.Index(fields=["start_date", "status"], name="tripbatch_departure_idx"),
+            models.Index(fields=["trip", "start_date"], name="tripbatch_trip_idx"),
+        ]
 
+    def __str__(self):
+        return f"{self.trip} departing {self.start_date}"
+
+    def save(self, *args, **kwargs):
+        # seats_booked only changes through the conditional UPDATEs in
+        # inventory.py; saving a batch loaded before a booking came in must
+        # not write its stale count back.
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != "seats_booked"
+            ]
+        super().save(*args, **kwargs)
+
+    def clean(self):
+        if self.capacity is not None and self.capacity < self.seats_booked:
+            raise ValidationError({"capacity": f"{self.seats_booked} seats are already sold or held."})
+
+    @property
+    def seats_left(self):
+        """Seats still bookable; None when capacity is not limited."""
+        if self.capacity is None:
+            return None
+        return max(self.capacity - self.seats_booked, 0)
+
+
+class SeatHold(models.Model):
+    """
+    Seats of a batch set aside while someone is checking out. They count in
+    the batch's seats_booked from the moment the hold is placed until it is
+    turned into a booking or released; see inventory.py.
+    """
+    batch = models.ForeignKey(TripBatch, on_delete=models.CASCADE, related_name="holds")
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="seat_holds")
+    seats = models.PositiveIntegerField()
+    expires_at = models.DateTimeField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["expires_at"], name="seathold_expires_idx"),
+            models.Index(fields=["batch", "expires_at"], name="seathold_batch_expires_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.seats} seats on {self.batch} until {self.expires_at}"
+
+
+class TripPriceOption(models.Model):
+    """
+    Per-person price of a trip for one room arrangement ("Triple", "Double",
+    ...). Used to be an entry of the Trip.price_options JSON list; the API
+    still renders and accepts that shape. Trips without options are priced
+    at Trip.price (see pricing.py).
+    """
+    trip = models.ForeignKey(Trip, on_delete=models.CASCADE, related_name="price_options")
+    occupancy = models.CharField(max_length=50)
+    price = models.IntegerField()
+    position = models.PositiveSmallIntegerField(default=0, help_text="Order on the trip page")
+
+    class Meta:
+        ordering = ["position", "id"]
+
+    def __str__(self):
+        return f"{self.trip} ({self.occupancy}): {self.price}"
+
+
+def _legacy_section_property(section_key, attr):
+    def getter(trip):
+        membership = trip.get_section_membership(section_key)
+        if attr is None:
+            return membership is not None
+        if membership is None:
+            return False if attr == "visible" else 0
+        return getattr(membership, attr)
+    return property(getter)
+
+
+# Read-only Trip attributes under the old column names (trip.is_monsoon_trek,
+# trip.monsoon_display_order, ...) so templates, scripts and the API keep
+# working. Writes go through TripSection — see TripSectionFieldsMixin.
+for _section in SECTIONS:
+    for _name, _attr in _section.legacy_fields.items():
+        setattr(Trip, _name, _legacy_section_property(_section.key, _attr))
 
 
 class Profile(models.Model):
@@ -176,7 +282,6 @@ class Profile(models.Model):
         return f"{self.user.username} - {self.role}"
 
 
-
 class Enquiry(models.Model):
     trip = models.ForeignKey(Trip, on_delete=models.CASCADE, related_name="enquiries")
     user = models.ForeignKey(
@@ -191,11 +296,15 @@ class Enquiry(models.Model):
     message = models.TextField(blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["-created_at", "-id"], name="enquiry_created_idx"),
+        ]
+
     def __str__(self):
         return f"Enquiry for {self.trip.title} by {self.name}"
 
 
-
 class ContactMessage(models.Model):
     name = models.CharField(max_length=100)
     email = models.EmailField()
@@ -203,6 +312,11 @@ class ContactMessage(models.Model):
     message = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["-created_at", "-id"], name="contactmessage_created_idx"),
+        ]
+
     def __str__(self):
         return f"{self.name} - {self.email}"
     
@@ -221,6 +335,71 @@ class TripView(models.Model):
         return f"{self.user.username} viewed {self.trip.title}"
 
 
+class TripViewCount(models.Model):
+    """
+    Views of a trip per hour, anonymous visitors included. Counted in memory
+    and added in batches by view_buffer.py; trending_trip_ids() ranks trips
+    from these buckets instead of scanning view rows.
+    """
+    trip = models.ForeignKey(Trip, on_delete=models.CASCADE, related_name="view_counts")
+    hour = models.DateTimeField(help_text="Start of the hour the views fall in")
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ["-hour"]
+        constraints = [
+            models.UniqueConstraint(fields=["trip", "hour"], name="unique_trip_view_count_hour"),
+        ]
+        indexes = [
+            models.Index(fields=["hour"], name="tripviewcount_hour_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.trip.title}: {self.count} views at {self.hour:%Y-%m-%d %H:00}"
+
+
+class TripRecommendation(models.Model):
+    """
+    Precomputed recommendations for a user, best first (see recommendations.py).
+    Rebuilt by the build_recommendations command and whenever the user views a
+    trip, so recommended_trips is a single lookup on (user, rank).
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="trip_recommendations")
+    trip = models.ForeignKey(Trip, on_delete=models.CASCADE, related_name="recommendations")
+    rank = models.PositiveSmallIntegerField(help_text="Position in the user's list (0 = best)")
+    score = models.FloatField()
+
+    class Meta:
+        ordering = ["user", "rank"]
+        constraints = [
+            models.UniqueConstraint(fields=["user", "rank"], name="unique_user_recommendation_rank"),
+        ]
+
+    def __str__(self):
+        return f"#{self.rank} {self.trip.title} for {self.user.username}"
+
+
+class TripSimilarity(models.Model):
+    """
+    Top-K "people who viewed this also viewed" neighbours of a trip, best
+    first, from co-views in TripView (see recommendations.py). Rebuilt by the
+    build_recommendations command.
+    """
+    trip = models.ForeignKey(Trip, on_delete=models.CASCADE, related_name="similarities")
+    similar_trip = models.ForeignKey(Trip, on_delete=models.CASCADE, related_name="similar_to")
+    rank = models.PositiveSmallIntegerField(help_text="Position among the trip's neighbours (0 = most similar)")
+    score = models.FloatField(help_text="Cosine similarity of the two trips' viewers")
+
+    class Meta:
+        ordering = ["trip", "rank"]
+        constraints = [
+            models.UniqueConstraint(fields=["trip", "rank"], name="unique_trip_similarity_rank"),
+        ]
+
+    def __str__(self):
+        return f"{self.similar_trip.title} is #{self.rank} for {self.trip.title}"
+
+
 class Review(models.Model):
     name = models.CharField(max_length=100)
     country = models.CharField(max_length=100, default="India")
@@ -228,9 +407,13 @@ class Review(models.Model):
     rating = models.PositiveSmallIntegerField(default=5)
     review = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["-created_at", "-id"], name="review_created_idx"),
+        ]
 
     def __str__(self):
         return f"{self.name} — {self.trip} ({self.rating}★)"
@@ -242,6 +425,7 @@ class SiteStat(models.Model):
     label = models.CharField(max_length=120, help_text="Display label shown on frontend")
     value = models.PositiveIntegerField(default=0)
     icon = models.CharField(max_length=10, blank=True, default="📊", help_text="Emoji icon for display")
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name = "Site Stat"
@@ -286,6 +470,14 @@ class Booking(models.Model):
     admin_note = models.TextField(blank=True, null=True)
 
     itinerary = models.CharField(max_length=200, blank=True, default="")
+    batch = models.ForeignKey(
+        TripBatch,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="bookings",
+        help_text="Departure whose seats this booking holds",
+    )
     batch_details = models.CharField(max_length=200, blank=True, default="")
     occupancy_details = models.CharField(max_length=200, blank=True, default="")
 
@@ -294,310 +486,42 @@ class Booking(models.Model):
     discount_amount = models.DecimalField(max_digits=10, decimal_places=2, default=0, help_text="Discount amount applied")
     created_at = models.DateTimeField(auto_now_add=True)
 
-    def __str__(self):
-        return f"{self.full_name} - {self.trip.title} ({self.status})"
-
-
-class InternationalSectionConfig(models.Model):
-    """Singleton settings for the International Trips showcase section."""
-    is_enabled = models.BooleanField(default=True, help_text="Enable the international trips scrolling section")
-    title = models.CharField(max_length=200, default="Explore International Trips")
-    subtitle = models.CharField(max_length=300, blank=True, default="", help_text="Optional subtitle below the heading")
-    scroll_speed = models.PositiveIntegerField(default=60, help_text="Animation duration in seconds (higher = slower)")
-
     class Meta:
-        verbose_name = "International Section Config"
-        verbose_name_plural = "International Section Config"
+        # Keyset pagination of the admin and per-user booking lists
+        indexes = [
+            models.Index(fields=["-created_at", "-id"], name="booking_created_idx"),
+            models.Index(fields=["user", "-created_at", "-id"], name="booking_user_created_idx"),
+        ]
 
     def __str__(self):
-        return f"International Section ({'Enabled' if self.is_enabled else 'Disabled'})"
-
-    def save(self, *args, **kwargs):
-        # Enforce singleton: always use pk=1
-        self.pk = 1
-        super().save(*args, **kwargs)
-
-    @classmethod
-    def load(cls):
-        obj, _ = cls.objects.get_or_create(pk=1)
-        return obj
-
-
-class IndiaSectionConfig(models.Model):
-    """Singleton settings for the India Trips showcase section."""
-    is_enabled = models.BooleanField(default=True, help_text="Enable the India trips scrolling section")
-    title = models.CharField(max_length=200, default="Explore India Trips")
-    subtitle = models.CharField(max_length=300, blank=True, default="", help_text="Optional subtitle below the heading")
-    scroll_speed = models.PositiveIntegerField(default=60, help_text="Animation duration in seconds (higher = slower)")
-
-    class Meta:
-        verbose_name = "India Section Config"
-        verbose_name_plural = "India Section Config"
-
-    def __str__(self):
-        return f"India Section ({'Enabled' if self.is_enabled else 'Disabled'})"
-
-    def save(self, *args, **kwargs):
-        # Enforce singleton: always use pk=1
-        self.pk = 1
-        super().save(*args, **kwargs)
-
-    @classmethod
-    def load(cls):
-        obj, _ = cls.objects.get_or_create(pk=1)
-        return obj
-
-
-class NorthIndiaSectionConfig(models.Model):
-    """Singleton settings for the North India Trips showcase section."""
-    is_enabled = models.BooleanField(default=True, help_text="Enable the North India trips scrolling section")
-    title = models.CharField(max_length=200, default="Explore North India Trips")
-    subtitle = models.CharField(max_length=300, blank=True, default="", help_text="Optional subtitle below the heading")
-    scroll_speed = models.PositiveIntegerField(default=60, help_text="Animation duration in seconds (higher = slower)")
-
-    class Meta:
-        verbose_name = "North India Section Config"
-        verbose_name_plural = "North India Section Config"
-
-    def __str__(self):
-        return f"North India Section ({'Enabled' if self.is_enabled else 'Disabled'})"
-
-    def save(self, *args, **kwargs):
-        # Enforce singleton: always use pk=1
-        self.pk = 1
-        super().save(*args, **kwargs)
-
-    @classmethod
-    def load(cls):
-        obj, _ = cls.objects.get_or_create(pk=1)
-        return obj
-
-
-class HoneymoonSectionConfig(models.Model):
-    """Singleton settings for the Honeymoon Trips showcase section."""
-    is_enabled = models.BooleanField(default=True, help_text="Enable the honeymoon trips scrolling section")
-    title = models.CharField(max_length=200, default="Honeymoon Getaways")
-    subtitle = models.CharField(max_length=300, blank=True, default="", help_text="Optional subtitle below the heading")
-    scroll_speed = models.PositiveIntegerField(default=60, help_text="Animation duration in seconds (higher = slower)")
-
-    class Meta:
-        verbose_name = "Honeymoon Section Config"
-        verbose_name_plural = "Honeymoon Section Config"
-
-    def __str__(self):
-        return f"Honeymoon Section ({'Enabled' if self.is_enabled else 'Disabled'})"
-
-    def save(self, *args, **kwargs):
-        # Enforce singleton: always use pk=1
-        self.pk = 1
-        super().save(*args, **kwargs)
-
-    @classmethod
-    def load(cls):
-        obj, _ = cls.objects.get_or_create(pk=1)
-        return obj
-
-
-class HimalayanSectionConfig(models.Model):
-    """Singleton settings for the Himalayan Treks showcase section."""
-    is_enabled = models.BooleanField(default=True, help_text="Enable the Himalayan treks scrolling section")
-    title = models.CharField(max_length=200, default="Majestic Himalayan Treks")
-    subtitle = models.CharField(max_length=300, blank=True, default="", help_text="Optional subtitle below the heading")
-    scroll_speed = models.PositiveIntegerField(default=60, help_text="Animation duration in seconds (higher = slower)")
-
-    class Meta:
-        verbose_name = "Himalayan Section Config"
-        verbose_name_plural = "Himalayan Section Config"
-
-    def __str__(self):
-        return f"Himalayan Section ({'Enabled' if self.is_enabled else 'Disabled'})"
-
-    def save(self, *args, **kwargs):
-        # Enforce singleton: always use pk=1
-        self.pk = 1
-        super().save(*args, **kwargs)
-
-    @classmethod
-    def load(cls):
-        obj, _ = cls.objects.get_or_create(pk=1)
-        return obj
-
-
-class BackpackingSectionConfig(models.Model):
-    """Singleton settings for the Backpacking Trips showcase section."""
-    is_enabled = models.BooleanField(default=True, help_text="Enable the Backpacking trips scrolling section")
-    title = models.CharField(max_length=200, default="Adventure Backpacking")
-    subtitle = models.CharField(max_length=300, blank=True, default="", help_text="Optional subtitle below the heading")
-    scroll_speed = models.PositiveIntegerField(default=60, help_text="Animation duration in seconds (higher = slower)")
-
-    class Meta:
-        verbose_name = "Backpacking Section Config"
-        verbose_name_plural = "Backpacking Section Config"
-
-    def __str__(self):
-        return f"Backpacking Section ({'Enabled' if self.is_enabled else 'Disabled'})"
-
-    def save(self, *args, **kwargs):
-        # Enforce singleton: always use pk=1
-        self.pk = 1
-        super().save(*args, **kwargs)
-
-    @classmethod
-    def load(cls):
-        obj, _ = cls.objects.get_or_create(pk=1)
-        return obj
-
-
-class SummerSectionConfig(models.Model):
-    """Singleton settings for the Summer Treks showcase section."""
-    is_enabled = models.BooleanField(default=True, help_text="Enable the Summer treks scrolling section")
-    title = models.CharField(max_length=200, default="Summer Getaways")
-    subtitle = models.CharField(max_length=300, blank=True, default="", help_text="Optional subtitle below the heading")
-    scroll_speed = models.PositiveIntegerField(default=60, help_text="Animation duration in seconds (higher = slower)")
-
-    class Meta:
-        verbose_name = "Summer Section Config"
-        verbose_name_plural = "Summer Section Config"
-
-    def __str__(self):
-        return f"Summer Section ({'Enabled' if self.is_enabled else 'Disabled'})"
-
-    def save(self, *args, **kwargs):
-        # Enforce singleton: always use pk=1
-        self.pk = 1
-        super().save(*args, **kwargs)
-
-    @classmethod
-    def load(cls):
-        obj, _ = cls.objects.get_or_create(pk=1)
-        return obj
-
-
-class MonsoonSectionConfig(models.Model):
-    """Singleton settings for the Monsoon Treks showcase section."""
-    is_enabled = models.BooleanField(default=True, help_text="Enable the Monsoon treks scrolling section")
-    title = models.CharField(max_length=200, default="Misty Monsoon Treks")
-    subtitle = models.CharField(max_length=300, blank=True, default="", help_text="Optional subtitle below the heading")
-    scroll_speed = models.PositiveIntegerField(default=60, help_text="Animation duration in seconds (higher = slower)")
-
-    class Meta:
-        verbose_name = "Monsoon Section Config"
-        verbose_name_plural = "Monsoon Section Config"
-
-    def __str__(self):
-        return f"Monsoon Section ({'Enabled' if self.is_enabled else 'Disabled'})"
-
-    def save(self, *args, **kwargs):
-        # Enforce singleton: always use pk=1
-        self.pk = 1
-        super().save(*args, **kwargs)
-
-    @classmethod
-    def load(cls):
-        obj, _ = cls.objects.get_or_create(pk=1)
-        return obj
-
-
-class CommunitySectionConfig(models.Model):
-    """Singleton settings for the Community Trips showcase section."""
-    is_enabled = models.BooleanField(default=True, help_text="Enable the Community trips scrolling section")
-    title = models.CharField(max_length=200, default="Social Community Trips")
-    subtitle = models.CharField(max_length=300, blank=True, default="", help_text="Optional subtitle below the heading")
-    scroll_speed = models.PositiveIntegerField(default=60, help_text="Animation duration in seconds (higher = slower)")
-
-    class Meta:
-        verbose_name = "Community Section Config"
-        verbose_name_plural = "Community Section Config"
-
-    def __str__(self):
-        return f"Community Section ({'Enabled' if self.is_enabled else 'Disabled'})"
-
-    def save(self, *args, **kwargs):
-        # Enforce singleton: always use pk=1
-        self.pk = 1
-        super().save(*args, **kwargs)
-
-    @classmethod
-    def load(cls):
-        obj, _ = cls.objects.get_or_create(pk=1)
-        return obj
-
-
-
-
-
-class FestivalSectionConfig(models.Model):
-    """Singleton settings for the Festival Trips showcase section."""
-    is_enabled = models.BooleanField(default=True, help_text="Enable the Festival trips scrolling section")
-    title = models.CharField(max_length=200, default="Celebrate Festival Trips")
-    subtitle = models.CharField(max_length=300, blank=True, default="", help_text="Optional subtitle below the heading")
-    scroll_speed = models.PositiveIntegerField(default=60, help_text="Animation duration in seconds (higher = slower)")
-
-    class Meta:
-        verbose_name = "Festival Section Config"
-        verbose_name_plural = "Festival Section Config"
-
-    def __str__(self):
-        return f"Festival Section ({'Enabled' if self.is_enabled else 'Disabled'})"
-
-    def save(self, *args, **kwargs):
-        # Enforce singleton: always use pk=1
-        self.pk = 1
-        super().save(*args, **kwargs)
-
-    @classmethod
-    def load(cls):
-        obj, _ = cls.objects.get_or_create(pk=1)
-        return obj
-
-
-class BikingSectionConfig(models.Model):
-    """Singleton settings for the Biking Trips showcase section."""
-    is_enabled = models.BooleanField(default=True, help_text="Enable the Biking trips scrolling section")
-    title = models.CharField(max_length=200, default="Epic Biking Trips")
-    subtitle = models.CharField(max_length=300, blank=True, default="", help_text="Optional subtitle below the heading")
-    scroll_speed = models.PositiveIntegerField(default=60, help_text="Animation duration in seconds (higher = slower)")
-
-    class Meta:
-        verbose_name = "Biking Section Config"
-        verbose_name_plural = "Biking Section Config"
-
-    def __str__(self):
-        return f"Biking Section ({'Enabled' if self.is_enabled else 'Disabled'})"
-
-    def save(self, *args, **kwargs):
-        # Enforce singleton: always use pk=1
-        self.pk = 1
-        super().save(*args, **kwargs)
+        return f"{self.full_name} - {self.trip.title} ({self.status})"
 
-    @classmethod
-    def load(cls):
-        obj, _ = cls.objects.get_or_create(pk=1)
-        return obj
 
 
-class AdventureSectionConfig(models.Model):
-    """Singleton settings for the Adventure Trips showcase section."""
-    is_enabled = models.BooleanField(default=True, help_text="Enable the Adventure trips scrolling section")
-    title = models.CharField(max_length=200, default="Epic Adventure Trips")
+class SectionConfig(models.Model):
+    """
+    Display settings for one homepage showcase section. There is one row per
+    section key from sections.SECTIONS; load() creates it on first use.
+    """
+    section = models.CharField(max_length=50, unique=True, help_text="Section key, e.g. north_india")
+    is_enabled = models.BooleanField(default=True, help_text="Enable the section's scrolling showcase")
+    title = models.CharField(max_length=200, blank=True, default="")
     subtitle = models.CharField(max_length=300, blank=True, default="", help_text="Optional subtitle below the heading")
     scroll_speed = models.PositiveIntegerField(default=60, help_text="Animation duration in seconds (higher = slower)")
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
-        verbose_name = "Adventure Section Config"
-        verbose_name_plural = "Adventure Section Config"
+        verbose_name = "Section Config"
+        verbose_name_plural = "Section Configs"
+        ordering = ["id"]
 
     def __str__(self):
-        return f"Adventure Section ({'Enabled' if self.is_enabled else 'Disabled'})"
-
-    def save(self, *args, **kwargs):
-        # Enforce singleton: always use pk=1
-        self.pk = 1
-        super().save(*args, **kwargs)
+        return f"{self.section} Section ({'Enabled' if self.is_enabled else 'Disabled'})"
 
     @classmethod
-    def load(cls):
-        obj, _ = cls.objects.get_or_create(pk=1)
+    def load(cls, section):
+        """Returns the config row for a sections.Section, creating it with the section's default title."""
+        obj, _ = cls.objects.get_or_create(section=section.key, defaults={"title": section.default_title})
         return obj
 
 
@@ -633,106 +557,6 @@ class TripGalleryImage(models.Model):
         return f"{self.trip.title} — {self.get_image_type_display()} #{self.display_order}"
 
 
-class HimachalSectionConfig(models.Model):
-    """Singleton settings for the Himachal Trips showcase section."""
-    is_enabled = models.BooleanField(default=True, help_text="Enable the Himachal trips scrolling section")
-    title = models.CharField(max_length=200, default="Explore Himachal Pradesh")
-    subtitle = models.CharField(max_length=300, blank=True, default="", help_text="Optional subtitle below the heading")
-    scroll_speed = models.PositiveIntegerField(default=60, help_text="Animation duration in seconds (higher = slower)")
-
-    class Meta:
-        verbose_name = "Himachal Section Config"
-        verbose_name_plural = "Himachal Section Config"
-
-    def __str__(self):
-        return f"Himachal Section ({'Enabled' if self.is_enabled else 'Disabled'})"
-
-    def save(self, *args, **kwargs):
-        # Enforce singleton: always use pk=1
-        self.pk = 1
-        super().save(*args, **kwargs)
-
-    @classmethod
-    def load(cls):
-        obj, _ = cls.objects.get_or_create(pk=1)
-        return obj
-
-
-class UttarakhandSectionConfig(models.Model):
-    """Singleton settings for the Uttarakhand Trips showcase section."""
-    is_enabled = models.BooleanField(default=True, help_text="Enable the Uttarakhand trips scrolling section")
-    title = models.CharField(max_length=200, default="Explore Uttarakhand")
-    subtitle = models.CharField(max_length=300, blank=True, default="", help_text="Optional subtitle below the heading")
-    scroll_speed = models.PositiveIntegerField(default=60, help_text="Animation duration in seconds (higher = slower)")
-
-    class Meta:
-        verbose_name = "Uttarakhand Section Config"
-        verbose_name_plural = "Uttarakhand Section Config"
-
-    def __str__(self):
-        return f"Uttarakhand Section ({'Enabled' if self.is_enabled else 'Disabled'})"
-
-    def save(self, *args, **kwargs):
-        # Enforce singleton: always use pk=1
-        self.pk = 1
-        super().save(*args, **kwargs)
-
-    @classmethod
-    def load(cls):
-        obj, _ = cls.objects.get_or_create(pk=1)
-        return obj
-
-
-class LongWeekendSectionConfig(models.Model):
-    """Singleton settings for the Long Weekend Trips showcase section."""
-    is_enabled = models.BooleanField(default=True, help_text="Enable the Long Weekend trips scrolling section")
-    title = models.CharField(max_length=200, default="Long Weekend Gateways")
-    subtitle = models.CharField(max_length=300, blank=True, default="", help_text="Optional subtitle below the heading")
-    scroll_speed = models.PositiveIntegerField(default=60, help_text="Animation duration in seconds (higher = slower)")
-
-    class Meta:
-        verbose_name = "Long Weekend Section Config"
-        verbose_name_plural = "Long Weekend Section Config"
-
-    def __str__(self):
-        return f"Long Weekend Section ({'Enabled' if self.is_enabled else 'Disabled'})"
-
-    def save(self, *args, **kwargs):
-        # Enforce singleton: always use pk=1
-        self.pk = 1
-        super().save(*args, **kwargs)
-
-    @classmethod
-    def load(cls):
-        obj, _ = cls.objects.get_or_create(pk=1)
-        return obj
-
-
-class GirlsSectionConfig(models.Model):
-    """Singleton settings for the All Girls Group Tours showcase section."""
-    is_enabled = models.BooleanField(default=True, help_text="Enable the All Girls Group trips scrolling section")
-    title = models.CharField(max_length=200, default="All Girls Group Tours")
-    subtitle = models.CharField(max_length=300, blank=True, default="", help_text="Optional subtitle below the heading")
-    scroll_speed = models.PositiveIntegerField(default=60, help_text="Animation duration in seconds (higher = slower)")
-
-    class Meta:
-        verbose_name = "Girls Section Config"
-        verbose_name_plural = "Girls Section Config"
-
-    def __str__(self):
-        return f"Girls Section ({'Enabled' if self.is_enabled else 'Disabled'})"
-
-    def save(self, *args, **kwargs):
-        # Enforce singleton: always use pk=1
-        self.pk = 1
-        super().save(*args, **kwargs)
-
-    @classmethod
-    def load(cls):
-        obj, _ = cls.objects.get_or_create(pk=1)
-        return obj
-
-
 class Coupon(models.Model):
     DISCOUNT_TYPES = (
         ('PERCENTAGE', 'Percentage'),
@@ -0,0 +1,41 @@
+from rest_framework.pagination import CursorPagination
+from rest_framework.response import Response
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Cursor (keyset) pagination for the list endpoints. Each page is a
+    WHERE <first ordering column> </> <cursor position> ... LIMIT page_size
+    seek, so a page costs the same at row 100 as at row 100,000. Rows that
+    tie on the first column are told apart by a small offset in the cursor.
+
+    Responses are { "next": url|null, "previous": url|null, "results": [...] }.
+    """
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 200
+
+    def __init__(self, ordering):
+        self.ordering = ordering
+
+
+def wants_page(request):
+    """Pagination is opt-in so existing clients keep getting a plain list."""
+    return "cursor" in request.query_params or "page_size" in request.query_params
+
+
+def list_response(request, queryset, serializer_class, ordering, context=None):
+    """
+    Serializes `queryset` in `ordering` — one keyset page when the request
+    asks for one (?cursor= / ?page_size=), otherwise the whole list as before.
+    """
+    context = context or {}
+
+    if not wants_page(request):
+        serializer = serializer_class(queryset.order_by(*ordering), many=True, context=context)
+        return Response(serializer.data)
+
+    paginator = KeysetPagination(ordering)
+    page = paginator.paginate_queryset(queryset, request)
+    serializer = serializer_class(page, many=True, context=context)
+    return paginator.get_paginated_response(serializer.data)
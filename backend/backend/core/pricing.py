@@ -0,0 +1,147 @@
+"""
+Server-side booking prices.
+
+create_booking used to trust the total_amount the booking page sent
+(falling back to trip.price * persons), and the arithmetic lived in the
+booking page, the pricing sidebar and the coupon calls. quote() is now the
+one place a booking is priced:
+
+    unit price  the trip's TripPriceOption for the occupancy (the first
+                one when none is given), or trip.price if it has none
+    amount      unit price x persons
+    GST         GST_RATE of the amount
+    discount    the coupon's, on amount + GST (the amount the booking
+                page validates coupons against)
+    total       amount + GST - discount
+
+all in Decimal, rounded to the paisa. Each trip's prices and batch ids
+are read once per catalog version into a PriceTable (catalog_cache.
+get_or_build), so a quote costs no queries for the trip itself while the
+catalog is unchanged; only the batch's seats and the coupon are read live.
+"""
+
+from decimal import ROUND_HALF_UP, Decimal
+
+from django.conf import settings
+
+from .catalog_cache import get_or_build
+from .coupon_service import _calculate_discount, validate_coupon
+from .models import Trip, TripBatch, TripPriceOption
+
+
+GST_RATE = Decimal(str(getattr(settings, "BOOKING_GST_RATE", "0.05")))
+
+_PAISA = Decimal("0.01")
+
+
+def _money(value):
+    return Decimal(value).quantize(_PAISA, rounding=ROUND_HALF_UP)
+
+
+def _key(occupancy):
+    return " ".join(str(occupancy or "").casefold().split())
+
+
+class PriceTable:
+    def __init__(self, trip_id, base_price, is_active, options, batch_ids):
+        """
+        options:   [(occupancy, price)] in display order
+        batch_ids: ids of the trip's batches
+        """
+        self.trip_id = trip_id
+        self.base_price = Decimal(base_price)
+        self.is_active = is_active
+        self.options = [(occupancy, Decimal(price)) for occupancy, price in options]
+        self._by_occupancy = {}
+        for occupancy, price in self.options:
+            self._by_occupancy.setdefault(_key(occupancy), (occupancy, price))
+        self.batch_ids = frozenset(batch_ids)
+
+    def unit_price(self, occupancy=""):
+        """
+        (occupancy, per-person price) for `occupancy`, matched ignoring case
+        and spacing. Raises ValueError for one the trip does not offer.
+        """
+        if not self.options:
+            return "", self.base_price
+        if not _key(occupancy):
+            return self.options[0]
+        try:
+            return self._by_occupancy[_key(occupancy)]
+        except KeyError:
+            raise ValueError(f"'{occupancy}' is not an occupancy offered for this trip") from None
+
+
+def build_price_table(trip_id):
+    """The PriceTable of a trip, or None if there is no such trip."""
+    trip = Trip.objects.filter(pk=trip_id).values_list("price", "is_active").first()
+    if trip is None:
+        return None
+    options = TripPriceOption.objects.filter(trip_id=trip_id).values_list("occupancy", "price")
+    batch_ids = TripBatch.objects.filter(trip_id=trip_id).values_list("id", flat=True)
+    return PriceTable(trip_id, trip[0], trip[1], list(options), list(batch_ids))
+
+
+def get_price_table(trip_id):
+    return get_or_build(f"price-table:{trip_id}", lambda: build_price_table(trip_id))
+
+
+def quote(trip_id, persons=1, occupancy="", batch_id=None, coupon_code="", user_id=None):
+    """
+    Prices a booking of `persons` on an active trip. Returns
+
+      { trip, batch, seats_left, occupancy, persons, unit_price, amount,
+        gst, subtotal, coupon, discount_amount, total_amount }
+
+    with coupon None or { code, valid, message }. seats_left is None
+    without a batch or when the batch is not limited; a batch short of
+    seats still gets a quote. Raises LookupError for a missing or inactive
+    trip and ValueError for anything else that cannot be priced.
+    """
+    try:
+        trip_id, persons = int(trip_id), int(persons)
+        batch_id = int(batch_id) if batch_id not in (None, "") else None
+    except (TypeError, ValueError):
+        raise ValueError("trip, persons and batch must be numbers") from None
+    if persons <= 0:
+        raise ValueError("Invalid Number of persons")
+
+    table = get_price_table(trip_id)
+    if table is None or not table.is_active:
+        raise LookupError("Trip not found")
+
+    seats_left = None
+    if batch_id is not None:
+        if batch_id not in table.batch_ids:
+            raise ValueError("Batch not found for this trip")
+        capacity, seats_booked = TripBatch.objects.filter(pk=batch_id).values_list("capacity", "seats_booked").get()
+        if capacity is not None:
+            seats_left = max(capacity - seats_booked, 0)
+
+    occupancy, unit_price = table.unit_price(occupancy)
+    amount = _money(unit_price * persons)
+    gst = _money(amount * GST_RATE)
+    subtotal = amount + gst
+
+    coupon, discount = None, Decimal("0.00")
+    if coupon_code:
+        result = validate_coupon(coupon_code, user_id=user_id, trip_id=trip_id, booking_amount=subtotal)
+        coupon = {"code": coupon_code, "valid": result["valid"], "message": result["message"]}
+        if result["valid"]:
+            # Recomputed: validate_coupon reports the discount as a float
+            discount = _money(_calculate_discount(result["coupon"], subtotal))
+
+    return {
+        "trip": trip_id,
+        "batch": batch_id,
+        "seats_left": seats_left,
+        "occupancy": occupancy,
+        "persons": persons,
+        "unit_price": _money(unit_price),
+        "amount": amount,
+        "gst": gst,
+        "subtotal": subtotal,
+        "coupon": coupon,
+        "discount_amount": discount,
+        "total_amount": subtotal - discount,
+    }
@@ -0,0 +1,251 @@
+"""
+Precomputed trip recommendations.
+
+recommended_trips used to score candidates on every request. Instead,
+build_recommendations() ranks every active trip a user has not viewed and
+stores the best STORED_RECOMMENDATIONS in TripRecommendation, so the endpoint
+is one indexed lookup. It runs for everyone from the build_recommendations
+management command and for a single user whenever they view a trip
+(signals.py).
+
+build_trip_similarities() does the same for trips: the most co-viewed
+neighbours of each trip go into TripSimilarity for /v1/trips/<pk>/similar/.
+
+trending_trip_ids() ranks trips for anonymous visitors from the hourly
+TripViewCount buckets.
+"""
+
+import heapq
+import math
+from collections import Counter, defaultdict
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+from django.utils import timezone
+
+from .catalog_cache import bump_catalog_version, get_or_build
+from .models import Trip, TripRecommendation, TripSimilarity, TripView, TripViewCount
+
+
+# More than the endpoint shows, so trips deactivated after a build can be
+# skipped at read time without the list running short.
+STORED_RECOMMENDATIONS = 12
+
+COVIEW_WEIGHT = 0.5
+CATEGORY_WEIGHT = 0.3
+PRICE_WEIGHT = 0.2
+
+# Trips priced within 40% of the user's average viewed price get a price score
+PRICE_BAND = 0.4
+
+# A rebuild for a few users (on every view-buffer flush) reads the most
+# recent COVIEWERS_PER_TRIP viewers of each trip they viewed, and those
+# viewers' COVIEWER_VIEWS most recent views, so a popular trip does not pull
+# in most of TripView. The full build reads every view.
+COVIEWERS_PER_TRIP = 200
+COVIEWER_VIEWS = 50
+
+# Neighbours kept per trip in TripSimilarity
+SIMILAR_TRIPS = 12
+
+# Trending: views of the last 3 days, a view losing half its weight every day.
+# The ranking is cached for a few minutes — it is a popularity signal, not a counter.
+TRENDING_TRIPS = 12
+TRENDING_WINDOW_HOURS = 72
+TRENDING_HALF_LIFE_HOURS = 24
+TRENDING_CACHE_KEY = "core:trending-trips"
+TRENDING_CACHE_TIMEOUT = 5 * 60
+
+# Hourly view buckets older than this are deleted by prune_view_counts()
+VIEW_COUNT_RETENTION_DAYS = 30
+
+
+def _views_by_user(views):
+    by_user = defaultdict(set)
+    for user_id, trip_id in views:
+        by_user[user_id].add(trip_id)
+    return by_user
+
+
+def _latest_views(views, per, count):
+    """The `count` most recent of `views` (a TripView queryset) for each value of the field `per`."""
+    return views.annotate(
+        recency=Window(RowNumber(), partition_by=[F(per)], order_by=F("viewed_at").desc()),
+    ).filter(recency__lte=count).order_by()
+
+
+def _trip_facts():
+    """{ trip_id: (price, category_id, is_active) } of every trip, cached per catalog version."""
+    return get_or_build("recommendation-trips", lambda: {
+        trip_id: (price, category_id, is_active)
+        for trip_id, price, category_id, is_active in Trip.objects.values_list("id", "price", "category_id", "is_active")
+    })
+
+
+def score_trips(viewed, viewers_by_trip, views_by_user, trips, user_id):
+    """
+    Scores every active trip `user_id` has not viewed. Returns
+    [(score, trip_id)] best first.
+
+    Args:
+      viewed:          trip ids the user viewed
+      viewers_by_trip: { trip_id: {user_id, ...} } for (at least) the viewed trips
+      views_by_user:   { user_id: {trip_id, ...} } for (at least) those viewers
+      trips:           { trip_id: (price, category_id, is_active) }
+
+    The score mixes three signals, each in [0, 1]:
+      co-view   other users who viewed the same trips also viewed this one
+                (count of such (viewer, trip) pairs, scaled by the best count)
+      category  share of the user's viewed trips in this trip's category
+      price     closeness to the user's average viewed price, 0 outside PRICE_BAND
+    """
+    co_views = Counter()
+    for trip_id in viewed:
+        for viewer in viewers_by_trip.get(trip_id, ()):
+            if viewer != user_id:
+                co_views.update(views_by_user[viewer] - viewed)
+    top_co_views = max(co_views.values(), default=0)
+
+    viewed_trips = [trips[trip_id] for trip_id in viewed if trip_id in trips]
+    categories = Counter(category_id for _, category_id, _ in viewed_trips if category_id is not None)
+    avg_price = sum(price for price, _, _ in viewed_trips) / len(viewed_trips) if viewed_trips else 0
+
+    scored = []
+    for trip_id, (price, category_id, is_active) in trips.items():
+        if not is_active or trip_id in viewed:
+            continue
+        score = 0.0
+        if top_co_views:
+            score += COVIEW_WEIGHT * co_views[trip_id] / top_co_views
+        if category_id is not None and viewed_trips:
+            score += CATEGORY_WEIGHT * categories[category_id] / len(viewed_trips)
+        if avg_price:
+            score += PRICE_WEIGHT * max(0.0, 1 - abs(price - avg_price) / (PRICE_BAND * avg_price))
+        scored.append((score, trip_id))
+
+    # Ties go to the newest trip
+    scored.sort(key=lambda item: (-item[0], -item[1]))
+    return scored
+
+
+def build_recommendations(user_ids=None):
+    """
+    Recomputes TripRecommendation rows for `user_ids` (every user with views
+    when None) and returns the number of users processed. Users without
+    views end up with no rows; recommended_trips falls back to its
+    anonymous list for them.
+    """
+    viewers_by_trip = defaultdict(set)
+    if user_ids is None:
+        views_by_user = _views_by_user(TripView.objects.values_list("user_id", "trip_id"))
+        co_views_by_user = views_by_user
+        for user_id, trip_ids in co_views_by_user.items():
+            for trip_id in trip_ids:
+                viewers_by_trip[trip_id].add(user_id)
+    else:
+        views_by_user = _views_by_user(TripView.objects.filter(user_id__in=user_ids).values_list("user_id", "trip_id"))
+        viewed = set().union(*views_by_user.values())
+        co_viewers = _latest_views(TripView.objects.filter(trip_id__in=viewed), "trip_id", COVIEWERS_PER_TRIP)
+        for user_id, trip_id in co_viewers.values_list("user_id", "trip_id"):
+            viewers_by_trip[trip_id].add(user_id)
+        co_views_by_user = _views_by_user(
+            _latest_views(
+                TripView.objects.filter(user_id__in=co_viewers.values("user_id")),
+                "user_id", COVIEWER_VIEWS,
+            ).values_list("user_id", "trip_id")
+        )
+
+    trips = _trip_facts()
+
+    rows = []
+    for user_id, viewed in views_by_user.items():
+        scored = score_trips(viewed, viewers_by_trip, co_views_by_user, trips, user_id)
+        rows.extend(
+            TripRecommendation(user_id=user_id, trip_id=trip_id, rank=rank, score=score)
+            for rank, (score, trip_id) in enumerate(scored[:STORED_RECOMMENDATIONS])
+        )
+
+    with transaction.atomic():
+        if user_ids is None:
+            TripRecommendation.objects.all().delete()
+        else:
+            TripRecommendation.objects.filter(user_id__in=user_ids).delete()
+        TripRecommendation.objects.bulk_create(rows, batch_size=1000)
+
+    return len(views_by_user) if user_ids is None else len(user_ids)
+
+
+def build_trip_similarities(k=SIMILAR_TRIPS):
+    """
+    Rebuilds TripSimilarity from TripView and returns the number of trips
+    with neighbours.
+
+    Each trip is the set of users who viewed it; two trips are as similar as
+    the cosine of those sets, co_views(a, b) / sqrt(viewers(a) * viewers(b)).
+    The trip x trip matrix is sparse — only pairs some user viewed together
+    have an entry — so it is accumulated per user as a dict of Counters
+    rather than as a dense matrix, then cut to the top `k` per trip.
+    """
+    views_by_user = _views_by_user(TripView.objects.values_list("user_id", "trip_id"))
+
+    viewers = Counter()
+    co_views = defaultdict(Counter)
+    for trip_ids in views_by_user.values():
+        viewers.update(trip_ids)
+        for trip_id in trip_ids:
+            co_views[trip_id].update(trip_ids)
+
+    rows = []
+    for trip_id, counts in co_views.items():
+        del counts[trip_id]
+        scored = (
+            (count / math.sqrt(viewers[trip_id] * viewers[other_id]), other_id)
+            for other_id, count in counts.items()
+        )
+        # Ties go to the newest trip
+        top = heapq.nlargest(k, scored)
+        rows.extend(
+            TripSimilarity(trip_id=trip_id, similar_trip_id=other_id, rank=rank, score=score)
+            for rank, (score, other_id) in enumerate(top)
+        )
+
+    with transaction.atomic():
+        TripSimilarity.objects.all().delete()
+        TripSimilarity.objects.bulk_create(rows, batch_size=1000)
+
+    # bulk_create sends no post_save; cached /similar/ responses must go
+    bump_catalog_version()
+    return len({row.trip_id for row in rows})
+
+
+def trending_trip_ids():
+    """
+    Ids of the most viewed active trips lately, most trending first. Each
+    hourly TripViewCount bucket in the window adds its views, halved for
+    every TRENDING_HALF_LIFE_HOURS of age, so the ranking follows current
+    interest rather than all-time totals.
+    """
+    trip_ids = cache.get(TRENDING_CACHE_KEY)
+    if trip_ids is None:
+        now = timezone.now()
+        buckets = TripViewCount.objects.filter(
+            hour__gte=now - timedelta(hours=TRENDING_WINDOW_HOURS), trip__is_active=True,
+        ).values_list("trip_id", "hour", "count")
+
+        scores = Counter()
+        for trip_id, hour, count in buckets:
+            age_hours = (now - hour).total_seconds() / 3600
+            scores[trip_id] += count * 0.5 ** (age_hours / TRENDING_HALF_LIFE_HOURS)
+
+        trip_ids = [trip_id for trip_id, _ in scores.most_common(TRENDING_TRIPS)]
+        cache.set(TRENDING_CACHE_KEY, trip_ids, TRENDING_CACHE_TIMEOUT)
+    return trip_ids
+
+
+def prune_view_counts(days=VIEW_COUNT_RETENTION_DAYS):
+    """Deletes hourly view buckets older than `days`; returns how many went."""
+    deleted, _ = TripViewCount.objects.filter(hour__lt=timezone.now() - timedelta(days=days)).delete()
+    return deleted
@@ -0,0 +1,173 @@
+"""
+Full-text trip search.
+
+/v1/trips/search/?q= reads an inverted index over each trip's title,
+location, state, country, short description, highlights and itinerary day
+titles, kept in core_trip_search next to core_trip:
+
+  - SQLite: an FTS5 virtual table (rowid = trip id), ranked with bm25(),
+  - PostgreSQL: a weighted tsvector column with a GIN index, ranked with
+    ts_rank().
+
+Every query word matches as a prefix ("man" finds Manali) and all of them
+must match; single characters only match whole words, as a one-letter
+prefix would match most of the index. Trips are (re)indexed on save and dropped on delete
+(signals.py); rebuild_search_index() covers writes that send no signals,
+such as bulk_create or QuerySet.update(). Deactivated trips stay indexed
+and are filtered out at query time.
+
+On other databases search falls back to icontains filters on the same
+fields, without an index or ranking.
+"""
+
+import re
+
+from django.db import connection, transaction
+from django.db.models import Q
+
+from .models import Trip
+
+
+# Created by migration 0058_trip_search
+SEARCH_TABLE = "core_trip_search"
+
+# Indexed columns, most important first. Title matches rank highest, then
+# where the trip goes, then what it is about.
+SEARCH_FIELDS = ["title", "location", "state", "country", "short_description", "highlights", "itinerary"]
+SQLITE_WEIGHTS = [10.0, 6.0, 4.0, 4.0, 2.0, 2.0, 1.0]
+POSTGRES_WEIGHTS = ["A", "B", "B", "B", "C", "C", "D"]
+
+MAX_QUERY_TERMS = 8
+MIN_PREFIX_LENGTH = 2
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def _itinerary_titles(itinerary):
+    """Day titles of an itinerary, which is a list of strings or {"title": ...} objects."""
+    titles = []
+    for day in itinerary or ():
+        if isinstance(day, str):
+            titles.append(day)
+        elif isinstance(day, dict) and day.get("title"):
+            titles.append(str(day["title"]))
+    return titles
+
+
+def _highlight_texts(highlights):
+    """Text of highlights, which are strings or {"title": ..., "description": ...} objects."""
+    texts = []
+    for item in highlights if isinstance(highlights, list) else ():
+        if isinstance(item, dict):
+            texts.extend(str(item[key]) for key in ("title", "description") if item.get(key))
+        elif item:
+            texts.append(str(item))
+    return texts
+
+
+def trip_document(trip):
+    """The indexed text of `trip`, one string per SEARCH_FIELDS entry."""
+    return [
+        trip.title,
+        trip.location,
+        trip.state,
+        trip.country,
+        trip.short_description,
+        " ".join(_highlight_texts(trip.highlights)),
+        " ".join(_itinerary_titles(trip.itinerary)),
+    ]
+
+
+def query_terms(query):
+    """Words of a user query, lowercased; only the first MAX_QUERY_TERMS count."""
+    return [word.lower() for word in _WORD_RE.findall(query or "")][:MAX_QUERY_TERMS]
+
+
+# ─── Maintenance ─────────────────────────────────────────────────────────────
+
+def index_trips(trips):
+    """(Re)indexes `trips`."""
+    rows = [(trip.pk, *trip_document(trip)) for trip in trips]
+    if not rows:
+        return
+    with connection.cursor() as cursor:
+        if connection.vendor == "sqlite":
+            placeholders = ", ".join(["%s"] * (len(SEARCH_FIELDS) + 1))
+            cursor.executemany(
+                f"INSERT OR REPLACE INTO {SEARCH_TABLE} (rowid, {', '.join(SEARCH_FIELDS)}) VALUES ({placeholders})",
+                rows,
+            )
+        elif connection.vendor == "postgresql":
+            document = " || ".join(
+                f"setweight(to_tsvector('simple', %s), '{weight}')" for weight in POSTGRES_WEIGHTS
+            )
+            cursor.executemany(
+                f"INSERT INTO {SEARCH_TABLE} (trip_id, document) VALUES (%s, {document}) "
+                f"ON CONFLICT (trip_id) DO UPDATE SET document = excluded.document",
+                rows,
+            )
+
+
+def remove_trips(trip_ids):
+    trip_ids = list(trip_ids)
+    if not trip_ids or connection.vendor not in ("sqlite", "postgresql"):
+        return
+    key = "rowid" if connection.vendor == "sqlite" else "trip_id"
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"DELETE FROM {SEARCH_TABLE} WHERE {key} IN ({', '.join(['%s'] * len(trip_ids))})", trip_ids,
+        )
+
+
+def rebuild_search_index():
+    """Reindexes every trip from scratch and returns how many were indexed."""
+    if connection.vendor not in ("sqlite", "postgresql"):
+        return 0
+    trips = list(Trip.objects.only("id", *SEARCH_FIELDS).order_by("id"))
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {SEARCH_TABLE}")
+        for start in range(0, len(trips), 1000):
+            index_trips(trips[start:start + 1000])
+    return len(trips)
+
+
+# ─── Queries ─────────────────────────────────────────────────────────────────
+
+def search_trip_ids(query, limit=20):
+    """Ids of active trips matching every word of `query`, best match first."""
+    terms = query_terms(query)
+    if not terms:
+        return []
+
+    if connection.vendor == "sqlite":
+        # Each word quoted (so FTS5 syntax in user input is inert) and starred for prefix matching
+        match = " ".join(f'"{term}"*' if len(term) >= MIN_PREFIX_LENGTH else f'"{term}"' for term in terms)
+        weights = ", ".join(str(weight) for weight in SQLITE_WEIGHTS)
+        sql = (
+            f"SELECT {SEARCH_TABLE}.rowid FROM {SEARCH_TABLE} JOIN core_trip t ON t.id = {SEARCH_TABLE}.rowid "
+            f"WHERE {SEARCH_TABLE} MATCH %s AND t.is_active "
+            f"ORDER BY bm25({SEARCH_TABLE}, {weights}), {SEARCH_TABLE}.rowid DESC LIMIT %s"
+        )
+        params = [match, limit]
+    elif connection.vendor == "postgresql":
+        # Words are \w+ only, so nothing in them is tsquery syntax
+        match = " & ".join(f"{term}:*" if len(term) >= MIN_PREFIX_LENGTH else term for term in terms)
+        sql = (
+            f"SELECT s.trip_id FROM {SEARCH_TABLE} s JOIN core_trip t ON t.id = s.trip_id "
+            f"WHERE s.document @@ to_tsquery('simple', %s) AND t.is_active "
+            f"ORDER BY ts_rank(s.document, to_tsquery('simple', %s)) DESC, s.trip_id DESC LIMIT %s"
+        )
+        params = [match, match, limit]
+    else:
+        trips = Trip.objects.filter(is_active=True)
+        for term in terms:
+            trips = trips.filter(
+                Q(title__icontains=term) | Q(location__icontains=term) | Q(state__icontains=term)
+                | Q(country__icontains=term) | Q(short_description__icontains=term)
+            )
+        return list(trips.order_by("-id").values_list("id", flat=True)[:limit])
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return [row[0] for row in cursor.fetchall()]
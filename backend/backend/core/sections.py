@@ -0,0 +1,231 @@
+"""
+Registry of the homepage showcase sections (International, Himalayan, Monsoon, ...).
+
+Each section used to be a hand-written view + serializer pair + singleton
+config model. They all follow the same shape, so a section is now described
+once here and served by the generic section_trips / admin_section_config
+views, the section serializer factory, the shared SectionConfig table and
+the TripSection membership table.
+
+Adding a section means adding an entry to SECTIONS — no new view, serializer,
+URL, config table or Trip column.
+"""
+
+
+class Section:
+    """
+    Declarative description of one showcase section.
+
+    Membership is stored in TripSection rows; member_flag, visible_flag,
+    order_field and priority_field are the flat names the API has always
+    used for those values (they were Trip columns before TripSection).
+    """
+
+    def __init__(self, key, label, default_title, member_flag, visible_flag, order_field,
+                 priority_field=None, card_fields=(), ordering=None):
+        self.key = key                          # snake_case id, e.g. "north_india"
+        self.slug = key.replace("_", "-")       # URL form, e.g. "north-india"
+        self.label = label                      # human readable, e.g. "North India"
+        self.default_title = default_title      # heading used until an admin edits it
+        self.member_flag = member_flag          # API flag: trip belongs to the section
+        self.visible_flag = visible_flag        # API flag: trip is shown in the scroller
+        self.order_field = order_field          # API field: lower = first
+        self.priority_field = priority_field    # API field: higher = first (optional)
+        self.card_fields = tuple(card_fields)   # fields rendered on a section card
+        self._ordering = ordering               # overrides the default ordering below
+
+    @property
+    def legacy_fields(self):
+        """
+        Flat API field name -> TripSection attribute backing it. The member
+        flag maps to None: it is true when the TripSection row exists.
+        """
+        fields = {
+            self.member_flag: None,
+            self.visible_flag: "visible",
+            self.order_field: "display_order",
+        }
+        if self.priority_field:
+            fields[self.priority_field] = "featured_priority"
+        return fields
+
+    @property
+    def ordering(self):
+        """
+        order_by() spec for the section's TripSection rows: priority first
+        (if any), then display order, newest trip first on ties — unless
+        the section gives its own.
+        """
+        if self._ordering:
+            return self._ordering
+        if self.priority_field:
+            return ("-featured_priority", "display_order", "-trip_id")
+        return ("display_order", "-trip_id")
+
+    @property
+    def filter_params(self):
+        """trip_list query params that filter on this section (flag name + legacy alias)."""
+        return (self.member_flag, f"is_{self.key}_trip")
+
+    def __repr__(self):
+        return f"<Section {self.key}>"
+
+
+SECTIONS = [
+    Section(
+        "international", "International", "Explore International Trips",
+        member_flag="is_international",
+        visible_flag="show_in_international_section",
+        order_field="display_order",
+        card_fields=("id", "title", "country", "location", "price", "duration_days", "image", "display_order"),
+    ),
+    Section(
+        "india", "India", "Explore India Trips",
+        member_flag="is_india_trip",
+        visible_flag="show_in_india_section",
+        order_field="india_display_order",
+        priority_field="india_featured_priority",
+        card_fields=("id", "title", "state", "location", "price", "duration_days", "image", "india_display_order"),
+    ),
+    Section(
+        "north_india", "North India", "Explore North India Trips",
+        member_flag="is_north_india_trip",
+        visible_flag="show_in_north_india_section",
+        order_field="north_india_display_order",
+        priority_field="north_india_featured_priority",
+        card_fields=("id", "title", "state", "location", "price", "duration_days", "image", "north_india_display_order"),
+    ),
+    Section(
+        "himachal", "Himachal", "Explore Himachal Pradesh",
+        member_flag="is_himachal_trip",
+        visible_flag="show_in_himachal_section",
+        order_field="himachal_display_order",
+        priority_field="himachal_featured_priority",
+        card_fields=("id", "title", "state", "location", "price", "duration_days", "image", "himachal_display_order"),
+    ),
+    Section(
+        "uttarakhand", "Uttarakhand", "Explore Uttarakhand",
+        member_flag="is_uttarakhand_trip",
+        visible_flag="show_in_uttarakhand_section",
+        order_field="uttarakhand_display_order",
+        priority_field="uttarakhand_featured_priority",
+        card_fields=("id", "title", "state", "location", "price", "duration_days", "image", "uttarakhand_display_order"),
+    ),
+    Section(
+        "honeymoon", "Honeymoon", "Honeymoon Getaways",
+        member_flag="is_honeymoon",
+        visible_flag="show_in_honeymoon_section",
+        order_field="honeymoon_display_order",
+        priority_field="honeymoon_featured_priority",
+        card_fields=(
+            "id", "title", "location", "country", "state", "price", "duration_days", "image",
+            "short_description", "honeymoon_display_order", "honeymoon_featured_priority",
+        ),
+    ),
+    Section(
+        "himalayan", "Himalayan", "Majestic Himalayan Treks",
+        member_flag="is_himalayan_trek",
+        visible_flag="show_in_himalayan_section",
+        order_field="himalayan_display_order",
+        card_fields=(
+            "id", "title", "location", "country", "state", "price", "duration_days", "image",
+            "short_description", "himalayan_display_order",
+        ),
+    ),
+    Section(
+        "backpacking", "Backpacking", "Adventure Backpacking",
+        member_flag="is_backpacking_trip",
+        visible_flag="show_in_backpacking_section",
+        order_field="backpacking_display_order",
+        priority_field="backpacking_featured_priority",
+        card_fields=(
+            "id", "title", "location", "country", "state", "price", "duration_days", "image",
+            "short_description", "backpacking_display_order", "backpacking_featured_priority",
+        ),
+    ),
+    Section(
+        "summer", "Summer", "Summer Getaways",
+        member_flag="is_summer_trek",
+        visible_flag="show_in_summer_section",
+        order_field="summer_display_order",
+        priority_field="summer_featured_priority",
+        card_fields=(
+            "id", "title", "location", "country", "state", "price", "duration_days", "image",
+            "short_description", "summer_display_order", "summer_featured_priority",
+        ),
+    ),
+    Section(
+        "monsoon", "Monsoon", "Misty Monsoon Treks",
+        member_flag="is_monsoon_trek",
+        visible_flag="show_in_monsoon_section",
+        order_field="monsoon_display_order",
+        priority_field="monsoon_featured_priority",
+        card_fields=("id", "title", "location", "image", "price", "duration_days", "monsoon_display_order", "monsoon_featured_priority"),
+    ),
+    Section(
+        "community", "Community", "Social Community Trips",
+        member_flag="is_community_trip",
+        visible_flag="show_in_community_section",
+        order_field="community_display_order",
+        card_fields=("id", "title", "location", "image", "price", "duration_days", "short_description", "community_display_order"),
+    ),
+    Section(
+        "festival", "Festival", "Celebrate Festival Trips",
+        member_flag="is_festival_trip",
+        visible_flag="show_in_festival_section",
+        order_field="festival_display_order",
+        priority_field="festival_featured_priority",
+        card_fields=(
+            "id", "title", "location", "price", "duration_days", "short_description", "image", "category",
+            "is_festival_trip", "show_in_festival_section", "festival_display_order", "festival_featured_priority",
+        ),
+    ),
+    Section(
+        "adventure", "Adventure", "Epic Adventure Trips",
+        member_flag="is_adventure_trip",
+        visible_flag="show_in_adventure_section",
+        order_field="adventure_display_order",
+        card_fields=("id", "title", "state", "location", "price", "duration_days", "image", "adventure_display_order"),
+        # Ties have always come out oldest trip first here
+        ordering=("display_order", "trip_id"),
+    ),
+    Section(
+        "biking", "Biking", "Epic Biking Trips",
+        member_flag="is_biking_trip",
+        visible_flag="show_in_biking_section",
+        order_field="biking_display_order",
+        priority_field="biking_featured_priority",
+        card_fields=(
+            "id", "title", "location", "country", "state", "price", "duration_days", "duration_nights", "image",
+            "short_description", "biking_display_order", "biking_featured_priority",
+        ),
+    ),
+    Section(
+        "long_weekend", "Long Weekend", "Long Weekend Gateways",
+        member_flag="is_long_weekend_trip",
+        visible_flag="show_in_long_weekend_section",
+        order_field="long_weekend_display_order",
+        priority_field="long_weekend_featured_priority",
+        card_fields=("id", "title", "state", "location", "price", "duration_days", "image", "long_weekend_display_order"),
+    ),
+    Section(
+        "girls", "All Girls Group", "All Girls Group Tours",
+        member_flag="is_girls_trip",
+        visible_flag="show_in_girls_section",
+        order_field="girls_display_order",
+        priority_field="girls_featured_priority",
+        card_fields=(
+            "id", "title", "location", "price", "image", "duration_days", "duration_nights",
+            "girls_display_order", "girls_featured_priority", "short_description",
+        ),
+    ),
+]
+
+SECTIONS_BY_KEY = {section.key: section for section in SECTIONS}
+SECTIONS_BY_SLUG = {section.slug: section for section in SECTIONS}
+SECTION_CHOICES = [(section.key, section.label) for section in SECTIONS]
+
+
+def get_section(slug_or_key):
+    """Looks a section up by its URL slug ("north-india") or key ("north_india")."""
+    return SECTIONS_BY_SLUG.get(slug_or_key) or SECTIONS_BY_KEY.get(slug_or_key)
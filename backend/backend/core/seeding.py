@@ -0,0 +1,192 @@
+"""
+Synthetic catalog for tests and benchmarks.
+
+seed_catalog() fills an empty database with a realistic-looking catalog —
+categories, trips in every showcase section, users, bookings, enquiries,
+trip views, reviews, coupons, ... — using bulk_create so thousands of rows
+take well under a second. The data is deterministic for a given `seed`.
+"""
+
+import random
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+
+from .catalog_cache import CATALOG_VERSION_KEY, COUPONS_VERSION_KEY, REVIEWS_VERSION_KEY, SITE_STATS_VERSION_KEY, bump_catalog_version
+from .models import (
+    Booking, Category, ContactMessage, Coupon, Enquiry, Profile, Review, SiteStat,
+    Trip, TripBatch, TripGalleryImage, TripPriceOption, TripSection, TripView,
+)
+from .recommendations import build_recommendations, build_trip_similarities
+from .search import rebuild_search_index
+from .sections import SECTIONS
+
+
+SEED_PASSWORD = "seed-password"
+
+CATEGORIES = ["Treks", "Beaches", "Heritage", "Wildlife", "Backpacking", "Weekend"]
+LOCATIONS = [
+    ("Manali", "Himachal Pradesh", "India"),
+    ("Rishikesh", "Uttarakhand", "India"),
+    ("Leh", "Ladakh", "India"),
+    ("Goa", "Goa", "India"),
+    ("Jaipur", "Rajasthan", "India"),
+    ("Munnar", "Kerala", "India"),
+    ("Bali", "", "Indonesia"),
+    ("Phuket", "", "Thailand"),
+    ("Kathmandu", "", "Nepal"),
+]
+
+
+def seed_catalog(trips=200, users=100, bookings=2000, views=2000, reviews=500, enquiries=500, coupons=50, seed=0):
+    """
+    Seeds the catalog and returns the admin user. Every trip joins a couple
+    of showcase sections; bookings, enquiries and views are spread over
+    random users and trips. Users share SEED_PASSWORD; the admin is "admin".
+    """
+    rng = random.Random(seed)
+
+    categories = Category.objects.bulk_create(
+        Category(name=name, slug=name.lower()) for name in CATEGORIES
+    )
+
+    trip_rows = []
+    for i in range(trips):
+        location, state, country = rng.choice(LOCATIONS)
+        days = rng.randint(2, 10)
+        trip_rows.append(Trip(
+            title=f"{location} Escape {i}",
+            location=location,
+            state=state,
+            country=country,
+            price=rng.randrange(5000, 80000, 500),
+            duration_days=days,
+            duration_nights=days - 1,
+            description=f"{days} days around {location}.",
+            short_description=f"Explore {location}",
+            itinerary=[{"day": day, "title": f"Day {day}"} for day in range(1, days + 1)],
+            highlights=["Sunrise point", "Local food walk"],
+            inclusions=["Stay", "Meals"],
+            exclusions=["Flights"],
+            faqs=[{"q": "Is it safe?", "a": "Yes."}],
+            is_active=rng.random() > 0.05,
+            category=rng.choice(categories),
+            is_featured=i < 3,
+            show_in_journey_in_frames=i % 10 == 0,
+            journey_in_frames_order=i,
+            is_good_friday_trip=i % 8 == 0,
+            show_in_good_friday_section=i % 16 == 0,
+            good_friday_display_order=i,
+        ))
+    trip_rows = Trip.objects.bulk_create(trip_rows)
+
+    TripSection.objects.bulk_create(
+        TripSection(
+            trip=trip,
+            section=section.key,
+            visible=rng.random() > 0.2,
+            display_order=rng.randint(0, 100),
+            featured_priority=rng.randint(0, 10),
+        )
+        for trip in trip_rows
+        for section in rng.sample(SECTIONS, 2)
+    )
+
+    TripBatch.objects.bulk_create(
+        TripBatch(
+            trip=trip,
+            start_date=start,
+            end_date=start + timedelta(days=trip.duration_days - 1),
+            capacity=rng.choice([None, 20, 30]),
+            seats_booked=rng.randint(0, 20),
+            status=rng.choice(["Available", "Available", "Filling Fast", "Full"]),
+        )
+        for trip in trip_rows
+        for start in (date(2026, 1, 1) + timedelta(days=7 * n + rng.randint(0, 6)) for n in range(4))
+    )
+
+    TripPriceOption.objects.bulk_create(
+        TripPriceOption(trip=trip, occupancy=occupancy, price=trip.price + extra, position=position)
+        for trip in trip_rows
+        for position, (occupancy, extra) in enumerate([("Triple", 0), ("Double", 2000)])
+    )
+
+    TripGalleryImage.objects.bulk_create(
+        TripGalleryImage(trip=trip, image=f"https://example.com/{trip.pk}/{n}.jpg", display_order=n)
+        for trip in trip_rows[:20]
+        for n in range(3)
+    )
+
+    password = make_password(SEED_PASSWORD)
+    user_rows = User.objects.bulk_create(
+        [User(username="admin", email="admin@example.com", password=password)]
+        + [User(username=f"traveller{i}", email=f"traveller{i}@example.com", password=password) for i in range(users)]
+    )
+    # bulk_create skips the post_save signal that normally creates profiles
+    Profile.objects.bulk_create(
+        Profile(user=user, role="ADMIN" if user.username == "admin" else "USER") for user in user_rows
+    )
+
+    Booking.objects.bulk_create(
+        Booking(
+            user=rng.choice(user_rows),
+            trip=trip,
+            full_name="Seed Traveller",
+            email="traveller@example.com",
+            phone="9999999999",
+            persons=persons,
+            total_amount=trip.price * persons,
+            status=rng.choice(["PENDING", "APPROVED", "DECLINED"]),
+        )
+        for trip, persons in ((rng.choice(trip_rows), rng.randint(1, 4)) for _ in range(bookings))
+    )
+
+    Enquiry.objects.bulk_create(
+        Enquiry(trip=rng.choice(trip_rows), user=rng.choice(user_rows), name="Seed Traveller",
+                email="traveller@example.com", phone="9999999999", message="Is this trip available?")
+        for _ in range(enquiries)
+    )
+
+    # TripView is unique per (user, trip)
+    view_pairs = {(rng.choice(user_rows), rng.choice(trip_rows)) for _ in range(views)}
+    TripView.objects.bulk_create(TripView(user=user, trip=trip) for user, trip in view_pairs)
+
+    Review.objects.bulk_create(
+        Review(name=f"Guest {i}", trip=rng.choice(trip_rows).title, rating=rng.randint(3, 5), review="Loved it.")
+        for i in range(reviews)
+    )
+
+    ContactMessage.objects.bulk_create(
+        ContactMessage(name=f"Guest {i}", email="guest@example.com", message="Please call me back.")
+        for i in range(50)
+    )
+
+    SiteStat.objects.bulk_create([
+        SiteStat(key="trips_completed", label="Trips Completed", value=1200),
+        SiteStat(key="happy_travellers", label="Happy Travellers", value=15000),
+    ])
+
+    Coupon.objects.bulk_create(
+        Coupon(
+            code=f"SEED{i}",
+            discount_type="PERCENTAGE" if i % 2 else "FLAT",
+            discount_value=Decimal(10 if i % 2 else 500),
+            trip=rng.choice(trip_rows) if i % 3 == 0 else None,
+            user=rng.choice(user_rows) if i % 5 == 0 else None,
+        )
+        for i in range(coupons)
+    )
+
+    # bulk_create sends no post_save: build what the TripView and Trip
+    # receivers would, plus the similar trips the build_recommendations
+    # command computes
+    build_recommendations()
+    build_trip_similarities()
+    rebuild_search_index()
+
+    # ... and invalidate cached responses / ETags
+    for key in (CATALOG_VERSION_KEY, REVIEWS_VERSION_KEY, SITE_STATS_VERSION_KEY, COUPONS_VERSION_KEY):
+        bump_catalog_version(key)
+    return user_rows[0]
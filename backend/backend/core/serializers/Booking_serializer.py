@@ -16,3 +16,10 @@ class BookingListSerializer(serializers.ModelSerializer):
     class Meta:
         model = Booking
         fields = "__all__"
+
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """Joins each booking's trip and its category; prefetches the trip's section memberships, batches and price options."""
+        return queryset.select_related("trip__category").prefetch_related(
+            "trip__section_memberships", "trip__batches", "trip__price_options",
+        )
@@ -1,4 +1,5 @@
 from .serializers import TripSerializer
+from .trip_card_serializer import TripCardSerializer
 from .auth_serializer import LoginSerializer
 from .signup_serializer import SignupSerializer
 from .enquiry_serializer import EnquirySerializer
@@ -10,26 +11,11 @@ from .contactmessage_serializer import ContactMessageSerializer
 from .Booking_serializer import BookingCreateSerializer, BookingListSerializer
 from .review_serializer import ReviewSerializer
 from .sitestat_serializer import SiteStatSerializer
-from .international_trip_serializer import InternationalTripSerializer, InternationalSectionConfigSerializer
-from .india_trip_serializer import IndiaTripSerializer, IndiaSectionConfigSerializer
-from .north_india_trip_serializer import NorthIndiaTripSerializer, NorthIndiaSectionConfigSerializer
-from .honeymoon_serializer import HoneymoonTripSerializer, HoneymoonSectionConfigSerializer
-from .himalayan_serializer import HimalayanTripSerializer, HimalayanSectionConfigSerializer
-from .backpacking_serializer import BackpackingTripSerializer, BackpackingSectionConfigSerializer
-from .summer_serializer import SummerTripSerializer, SummerSectionConfigSerializer
-from .monsoon_serializer import MonsoonTripSerializer, MonsoonSectionConfigSerializer
-from .community_serializer import CommunityTripSerializer, CommunitySectionConfigSerializer
-from .festival_serializer import FestivalTripSerializer, FestivalSectionConfigSerializer
-from .adventure_serializer import AdventureTripSerializer, AdventureSectionConfigSerializer
-from .biking_serializer import BikingTripSerializer, BikingSectionConfigSerializer
-from .girls_trip_serializer import GirlsTripSerializer, GirlsSectionConfigSerializer
 from .category_serializer import CategorySerializer
-
-from .himachal_serializer import HimachalTripSerializer, HimachalSectionConfigSerializer
-from .uttarakhand_serializer import UttarakhandTripSerializer, UttarakhandSectionConfigSerializer
-from .long_weekend_serializer import LongWeekendTripSerializer, LongWeekendSectionConfigSerializer
+from .section_serializer import SectionConfigSerializer, TripSectionFieldsSerializer, section_trip_serializer
+from .batch_serializer import TripBatchSerializer, SeatHoldSerializer
+from .price_option_serializer import TripPriceOptionSerializer
 
 from .gallery_serializer import TripGalleryImageSerializer
-from .coupon_serializer import CouponSerializer, CouponValidateSerializer
-
+from .coupon_serializer import CouponSerializer, CouponValidateSerializer, CouponBulkCreateSerializer
 
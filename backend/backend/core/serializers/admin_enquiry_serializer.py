@@ -15,3 +15,9 @@ class AdminEnquirySerializer(serializers.ModelSerializer):
             "message",
             "created_at",
         )
+
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """Joins the trip for trip_title, reading only its title."""
+        columns = [name for name in AdminEnquirySerializer.Meta.fields if name != "trip_title"]
+        return queryset.select_related("trip").only(*columns, "trip__title")
@@ -1,7 +1,17 @@
-from rest_framework import serializers
 from ..models import Trip
+from .section_serializer import TripSectionFieldsSerializer
+from .batch_serializer import TripBatchSerializer, TripBatchesMixin
+from .price_option_serializer import TripPriceOptionSerializer, TripPriceOptionsMixin
+
+class AdminTripSerializer(TripPriceOptionsMixin, TripBatchesMixin, TripSectionFieldsSerializer):
+    batches = TripBatchSerializer(many=True, required=False)
+    price_options = TripPriceOptionSerializer(many=True, required=False)
 
-class AdminTripSerializer(serializers.ModelSerializer):
     class Meta:
         model = Trip
         fields = "__all__"
+
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """Prefetches the section memberships behind the flat section fields, the batches and the price options."""
+        return queryset.prefetch_related("section_memberships", "batches", "price_options")
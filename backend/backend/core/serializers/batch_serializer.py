@@ -0,0 +1,103 @@
+from rest_framework import serializers
+from ..inventory import batches_in_use
+from ..models import SeatHold, TripBatch
+
+
+class TripBatchSerializer(serializers.ModelSerializer):
+    """
+    A TripBatch in the shape the Trip.batches JSON list had — startDate,
+    endDate, status — plus its id and seat counts. Sending the id back
+    updates that batch rather than creating a new one.
+    """
+    id = serializers.IntegerField(required=False)
+    startDate = serializers.DateField(source="start_date")
+    endDate = serializers.DateField(source="end_date", required=False, allow_null=True)
+    seatsBooked = serializers.IntegerField(source="seats_booked", read_only=True)
+    seatsLeft = serializers.IntegerField(source="seats_left", read_only=True)
+
+    class Meta:
+        model = TripBatch
+        fields = ["id", "startDate", "endDate", "status", "capacity", "seatsBooked", "seatsLeft"]
+
+
+class SeatHoldSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = SeatHold
+        fields = ["id", "batch", "seats", "expires_at"]
+
+
+class TripBatchesMixin:
+    """
+    For Trip serializers declaring `batches = TripBatchSerializer(many=True,
+    required=False)`: writes the list back to the trip's TripBatch rows.
+    An omitted list leaves the batches alone; one leaving out a batch that
+    has seats sold or held, or lowering a capacity below the seats a batch
+    has sold or held, is refused (400) before anything is saved.
+    """
+
+    def create(self, validated_data):
+        batches = validated_data.pop("batches", None)
+        trip = super().create(validated_data)
+        if batches is not None:
+            save_trip_batches(trip, batches)
+        return trip
+
+    def update(self, instance, validated_data):
+        batches = validated_data.pop("batches", None)
+        if batches is not None:
+            check_batches_removable(instance, batches)
+            check_batch_capacities(instance, batches)
+        trip = super().update(instance, validated_data)
+        if batches is not None:
+            save_trip_batches(trip, batches)
+        return trip
+
+
+def check_batches_removable(trip, batches):
+    """
+    Raises a ValidationError if `batches` leaves out a batch of the trip
+    with undeclined bookings or unexpired holds (see batches_in_use).
+    """
+    kept = [values["id"] for values in batches if values.get("id") is not None]
+    in_use = batches_in_use(trip.batches.exclude(pk__in=kept))
+    dates = [str(start_date) for start_date in in_use.values_list("start_date", flat=True)]
+    if dates:
+        raise serializers.ValidationError({"batches": [
+            f"The batches departing {', '.join(dates)} have bookings or held seats and cannot be removed; "
+            "set them to Full instead."
+        ]})
+
+
+def check_batch_capacities(trip, batches):
+    """
+    Raises a ValidationError if `batches` gives one of the trip's batches a
+    capacity below the seats it has sold or held.
+    """
+    booked = dict(trip.batches.values_list("id", "seats_booked"))
+    short = [
+        f"{values['start_date']} ({booked[values['id']]} seats taken)" for values in batches
+        if values.get("id") in booked and values.get("capacity") is not None and values["capacity"] < booked[values["id"]]
+    ]
+    if short:
+        raise serializers.ValidationError({"batches": [
+            f"The capacity of the batches departing {', '.join(short)} is below the seats already sold or held."
+        ]})
+
+
+def save_trip_batches(trip, batches):
+    """
+    Makes the trip's TripBatch rows match `batches` (validated
+    TripBatchSerializer data): entries with the id of one of its batches
+    update it, the rest are created, and batches left out are deleted.
+    """
+    existing = {batch.pk: batch for batch in trip.batches.all()}
+    keep = []
+    for values in batches:
+        batch = existing.get(values.pop("id", None)) or TripBatch(trip=trip)
+        for attr, value in values.items():
+            setattr(batch, attr, value)
+        batch.save()
+        keep.append(batch.pk)
+    trip.batches.exclude(pk__in=keep).delete()
+    # A prefetched trip.batches would still render the old rows
+    getattr(trip, "_prefetched_objects_cache", {}).pop("batches", None)
@@ -1,6 +1,10 @@
 from rest_framework import serializers
+from ..coupon_bulk import DEFAULT_CODE_LENGTH
 from ..models import Coupon
 
+# Coupons one bulk request may create
+MAX_GENERATED_COUPONS = 100_000
+
 class CouponSerializer(serializers.ModelSerializer):
     class Meta:
         model = Coupon
@@ -10,3 +14,30 @@ class CouponValidateSerializer(serializers.Serializer):
     code = serializers.CharField(max_length=50)
     trip_id = serializers.IntegerField(required=False, allow_null=True)
     booking_amount = serializers.DecimalField(max_digits=10, decimal_places=2)
+
+class CouponBulkCreateSerializer(serializers.ModelSerializer):
+    """A batch of generated coupons: how many (or for which users) and what they give (see coupon_bulk.py)."""
+    count = serializers.IntegerField(min_value=1, max_value=MAX_GENERATED_COUPONS, required=False)
+    prefix = serializers.RegexField(r"^[A-Za-z0-9-]*$", max_length=20, required=False, allow_blank=True, default="")
+    code_length = serializers.IntegerField(min_value=6, max_value=20, default=DEFAULT_CODE_LENGTH)
+    user_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), required=False, allow_empty=False, max_length=MAX_GENERATED_COUPONS,
+    )
+
+    class Meta:
+        model = Coupon
+        fields = [
+            "count", "prefix", "code_length", "user_ids",
+            "discount_type", "discount_value", "max_discount", "min_booking_amount",
+            "is_active", "expiry_date", "usage_limit", "trip",
+        ]
+
+    def validate(self, attrs):
+        if "user_ids" in attrs:
+            if len(set(attrs["user_ids"])) != len(attrs["user_ids"]):
+                raise serializers.ValidationError({"user_ids": "A user can only be listed once."})
+            if attrs.get("count", len(attrs["user_ids"])) != len(attrs["user_ids"]):
+                raise serializers.ValidationError({"count": "Must match the number of user_ids."})
+        elif "count" not in attrs:
+            raise serializers.ValidationError({"count": "Either count or user_ids is required."})
+        return attrs
@@ -7,3 +7,8 @@ class UserAdminSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ("id", "username", "email", "role")
+
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """Joins the profile that carries the role."""
+        return queryset.select_related("profile")
@@ -0,0 +1,43 @@
+from rest_framework import serializers
+from ..models import TripPriceOption
+
+
+class TripPriceOptionSerializer(serializers.ModelSerializer):
+    """A TripPriceOption in the shape the Trip.price_options JSON list had."""
+
+    class Meta:
+        model = TripPriceOption
+        fields = ["occupancy", "price"]
+
+
+class TripPriceOptionsMixin:
+    """
+    For Trip serializers declaring `price_options =
+    TripPriceOptionSerializer(many=True, required=False)`: replaces the
+    trip's options with the list, in its order. An omitted list leaves them
+    alone.
+    """
+
+    def create(self, validated_data):
+        options = validated_data.pop("price_options", None)
+        trip = super().create(validated_data)
+        if options is not None:
+            save_trip_price_options(trip, options)
+        return trip
+
+    def update(self, instance, validated_data):
+        options = validated_data.pop("price_options", None)
+        trip = super().update(instance, validated_data)
+        if options is not None:
+            save_trip_price_options(trip, options)
+        return trip
+
+
+def save_trip_price_options(trip, options):
+    """Replaces the trip's TripPriceOption rows with `options` (validated TripPriceOptionSerializer data)."""
+    trip.price_options.all().delete()
+    TripPriceOption.objects.bulk_create(
+        TripPriceOption(trip=trip, position=position, **values) for position, values in enumerate(options)
+    )
+    # A prefetched trip.price_options would still render the old rows
+    getattr(trip, "_prefetched_objects_cache", {}).pop("price_options", None)
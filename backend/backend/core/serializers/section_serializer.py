@@ -0,0 +1,135 @@
+from django.db import transaction
+from rest_framework import serializers
+from ..models import Category, SectionConfig, TripSection
+from ..sections import SECTIONS
+
+
+class SectionConfigSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = SectionConfig
+        fields = ["is_enabled", "title", "subtitle", "scroll_speed"]
+
+
+# Flat section field names in registry order, for Meta.fields lists.
+SECTION_FIELD_NAMES = [name for section in SECTIONS for name in section.legacy_fields]
+
+
+class TripSectionFieldsSerializer(serializers.ModelSerializer):
+    """
+    Base for Trip serializers. Exposes the trip's TripSection rows under the
+    flat field names the API has always used (is_monsoon_trek,
+    show_in_monsoon_section, monsoon_display_order, ...) and writes them back
+    to TripSection. Setting a member flag to false removes the trip from
+    that section; omitted fields keep their current value.
+
+    save() runs in one transaction, so the trip row, its sections and what
+    the mixins write (batches, price options) are saved all or nothing.
+    """
+
+    def save(self, **kwargs):
+        with transaction.atomic():
+            return super().save(**kwargs)
+
+    def create(self, validated_data):
+        sections = self._pop_section_data(validated_data)
+        trip = super().create(validated_data)
+        save_trip_sections(trip, sections)
+        return trip
+
+    def update(self, instance, validated_data):
+        sections = self._pop_section_data(validated_data)
+        trip = super().update(instance, validated_data)
+        save_trip_sections(trip, sections)
+        return trip
+
+    @staticmethod
+    def _pop_section_data(validated_data):
+        """Moves the flat section fields out of validated_data: { section_key: { attr: value } }."""
+        sections = {}
+        for section in SECTIONS:
+            for name, attr in section.legacy_fields.items():
+                if name in validated_data:
+                    sections.setdefault(section.key, {})[attr] = validated_data.pop(name)
+        return sections
+
+
+def _section_field(attr):
+    if attr in (None, "visible"):
+        return serializers.BooleanField(required=False)
+    return serializers.IntegerField(required=False)
+
+
+# The metaclass has already collected the declared fields, so the per-section
+# ones generated from the registry are added to its result directly.
+TripSectionFieldsSerializer._declared_fields = {
+    **TripSectionFieldsSerializer._declared_fields,
+    **{
+        name: _section_field(attr)
+        for section in SECTIONS
+        for name, attr in section.legacy_fields.items()
+    },
+}
+
+
+def save_trip_sections(trip, sections):
+    """
+    Applies { section_key: { attr: value } } (attr None = member flag) to the
+    trip's TripSection rows.
+    """
+    for key, values in sections.items():
+        membership = trip.get_section_membership(key)
+        is_member = values.pop(None, membership is not None)
+
+        if not is_member:
+            if membership is not None:
+                membership.delete()
+            continue
+
+        if membership is None:
+            membership = TripSection(trip=trip, section=key)
+        for attr, value in values.items():
+            setattr(membership, attr, value)
+        membership.save()
+
+    trip.clear_section_cache()
+
+
+class SectionCategorySerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Category
+        fields = ["id", "name", "slug", "emoji"]
+
+
+_trip_serializers = {}
+
+
+def section_trip_serializer(section):
+    """
+    Returns the card serializer class for a sections.Section, built once from
+    its card_fields. It renders TripSection rows (with select_related("trip")):
+    the section's own flat fields (e.g. "monsoon_display_order") come from the
+    membership row, everything else from the trip. A "category" card field is
+    rendered as a nested category.
+    """
+    serializer_class = _trip_serializers.get(section.key)
+    if serializer_class is None:
+        legacy_fields = section.legacy_fields
+        attrs = {}
+        for name in section.card_fields:
+            if name == "category":
+                attrs[name] = SectionCategorySerializer(source="trip.category", read_only=True)
+            elif name == section.member_flag:
+                attrs[name] = serializers.SerializerMethodField()
+                attrs[f"get_{name}"] = lambda self, membership: True
+            elif name in legacy_fields:
+                source = legacy_fields[name]
+                attrs[name] = serializers.ReadOnlyField(**({} if source == name else {"source": source}))
+            elif name == "id":
+                attrs[name] = serializers.ReadOnlyField(source="trip_id")
+            else:
+                attrs[name] = serializers.ReadOnlyField(source=f"trip.{name}")
+
+        name = "".join(part.title() for part in section.key.split("_")) + "TripSerializer"
+        serializer_class = type(name, (serializers.Serializer,), attrs)
+        _trip_serializers[section.key] = serializer_class
+    return serializer_class
@@ -4,10 +4,15 @@ This TripSerializer is a Django REST Framework ModelSerializer used to convert T
 from rest_framework import serializers
 from ..models import Trip, Category
 from .category_serializer import CategorySerializer
+from .section_serializer import TripSectionFieldsSerializer, SECTION_FIELD_NAMES
+from .batch_serializer import TripBatchSerializer, TripBatchesMixin
+from .price_option_serializer import TripPriceOptionSerializer, TripPriceOptionsMixin
 
 
-class TripSerializer(serializers.ModelSerializer):
+class TripSerializer(TripPriceOptionsMixin, TripBatchesMixin, TripSectionFieldsSerializer):
     category = CategorySerializer(read_only=True)
+    batches = TripBatchSerializer(many=True, required=False)
+    price_options = TripPriceOptionSerializer(many=True, required=False)
     category_id = serializers.PrimaryKeyRelatedField(
         queryset=Category.objects.all(),
         source="category",
@@ -35,55 +40,7 @@ class TripSerializer(serializers.ModelSerializer):
             "is_active",
             "country",
             "short_description",
-            "is_international",
-            "show_in_international_section",
-            "display_order",
-            "is_india_trip",
-            "show_in_india_section",
-            "is_north_india_trip",
-            "show_in_north_india_section",
-            "north_india_display_order",
-            "north_india_featured_priority",
-            "is_himachal_trip",
-            "show_in_himachal_section",
-            "himachal_display_order",
-            "himachal_featured_priority",
-            "is_uttarakhand_trip",
-            "show_in_uttarakhand_section",
-            "uttarakhand_display_order",
-            "uttarakhand_featured_priority",
-            "is_honeymoon",
-            "show_in_honeymoon_section",
-            "honeymoon_display_order",
-            "honeymoon_featured_priority",
-            "is_himalayan_trek",
-            "show_in_himalayan_section",
-            "is_backpacking_trip",
-            "show_in_backpacking_section",
-            "backpacking_display_order",
-            "backpacking_featured_priority",
-            "is_summer_trek",
-            "show_in_summer_section",
-            "summer_display_order",
-            "summer_featured_priority",
-            "is_monsoon_trek",
-            "show_in_monsoon_section",
-            "monsoon_display_order",
-            "monsoon_featured_priority",
-            "is_community_trip",
-            "show_in_community_section",
-            "is_festival_trip",
-            "show_in_festival_section",
-            "festival_display_order",
-            "festival_featured_priority",
-            "is_biking_trip",
-            "show_in_biking_section",
-            "biking_display_order",
-            "biking_featured_priority",
-            "is_long_weekend_trip",
-            "show_in_long_weekend_section",
-            "long_weekend_display_order",
-            "long_weekend_featured_priority",
+            *SECTION_FIELD_NAMES,
             "category",
             "category_id",
             "is_featured",
@@ -97,4 +54,10 @@ class TripSerializer(serializers.ModelSerializer):
             "faqs",
             "pickup_location",
             "drop_location",
+            "updated_at",
         ]
+
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """Joins the nested category and prefetches section memberships, batches and price options."""
+        return queryset.select_related("category").prefetch_related("section_memberships", "batches", "price_options")
@@ -0,0 +1,63 @@
+from django.db.models import Prefetch
+from rest_framework import serializers
+from ..models import Trip, TripSection
+from ..sections import SECTIONS
+from .category_serializer import CategorySerializer
+
+
+class TripCardSerializer(serializers.ModelSerializer):
+    """
+    Compact trip for list endpoints (catalog page, recommendations): what a
+    trip card and the client-side search need. The heavy detail fields
+    (itinerary, faqs, batches, price_options, ...) stay on TripSerializer.
+
+    `sections` lists the keys of the showcase sections the trip belongs to.
+    Sections passed as context["sections"] — e.g. the ones trip_list was
+    filtered on — also get their flat fields (is_girls_trip,
+    girls_featured_priority, ...).
+    """
+    category = CategorySerializer(read_only=True)
+    sections = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Trip
+        fields = [
+            "id",
+            "title",
+            "location",
+            "state",
+            "country",
+            "price",
+            "duration_days",
+            "duration_nights",
+            "image",
+            "short_description",
+            "description",
+            "is_featured",
+            "category",
+            "sections",
+        ]
+
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """
+        Narrows a Trip queryset to what this serializer reads: the category
+        is joined, memberships are prefetched in one query and the large
+        JSON/TEXT detail columns are never loaded.
+        """
+        columns = [name for name in TripCardSerializer.Meta.fields if name != "sections"]
+        return (
+            queryset.select_related("category")
+            .prefetch_related(Prefetch("section_memberships", queryset=TripSection.objects.order_by()))
+            .only(*columns)
+        )
+
+    def get_sections(self, trip):
+        return [section.key for section in SECTIONS if trip.get_section_membership(section.key)]
+
+    def to_representation(self, trip):
+        data = super().to_representation(trip)
+        for section in self.context.get("sections", ()):
+            for name in section.legacy_fields:
+                data[name] = getattr(trip, name)
+        return data
@@ -13,3 +13,9 @@ class UserEnquirySerializer(serializers.ModelSerializer):
             "created_at",
             "message",
         )
+
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """Joins the trip for trip_title, reading only its title."""
+        columns = [name for name in UserEnquirySerializer.Meta.fields if name != "trip_title"]
+        return queryset.select_related("trip").only(*columns, "trip__title")
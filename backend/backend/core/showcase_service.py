@@ -0,0 +1,158 @@
+from .catalog_cache import get_or_build
+from .models import Trip, TripSection, SectionConfig
+from .recommendations import trending_trip_ids
+from .sections import SECTIONS
+from .serializers import TripSerializer, SectionConfigSerializer, section_trip_serializer
+
+
+FEATURED_LIMIT = 3
+
+
+def _ordering_key(ordering):
+    """
+    Turns an order_by() spec such as ("-featured_priority", "display_order", "-trip_id")
+    into a sort key function for in-memory TripSection rows. All ordering
+    columns are integers, so descending order is just a negated value.
+    """
+    parts = [(name.lstrip("-"), name.startswith("-")) for name in ordering]
+
+    def key(membership):
+        return tuple(-getattr(membership, name) if desc else getattr(membership, name) for name, desc in parts)
+
+    return key
+
+
+def load_section_configs():
+    """
+    Returns { section_key: SectionConfig } for every section from the config
+    snapshot: all rows are read in one query per catalog version and then
+    served from catalog_cache, so public reads don't touch the DB. Saving a
+    config (admin_section_config or Django admin) bumps the catalog version,
+    which refreshes the snapshot.
+
+    A section that was never configured gets an unsaved row carrying its
+    default title — a public GET should never INSERT the way load() does.
+    """
+    rows = get_or_build(
+        "section-configs",
+        lambda: {config.section: config for config in SectionConfig.objects.all()},
+    )
+    return {
+        section.key: rows.get(section.key) or SectionConfig(section=section.key, title=section.default_title)
+        for section in SECTIONS
+    }
+
+
+def get_section_config(section):
+    """Returns the SectionConfig for a sections.Section from the config snapshot."""
+    return load_section_configs()[section.key]
+
+
+def _section_trip_fields(section):
+    """Trip columns a section card reads, as .only() paths on a TripSection query."""
+    legacy_fields = section.legacy_fields
+    fields = {"trip__id"}
+    for name in section.card_fields:
+        if name == "category":
+            fields.update(("trip__category", "trip__category__id", "trip__category__name", "trip__category__slug", "trip__category__emoji"))
+        elif name not in legacy_fields:
+            fields.add("trip__" + name)
+    return fields
+
+
+def _memberships():
+    """Visible TripSection rows of active trips, with their trips joined in."""
+    return TripSection.objects.filter(visible=True, trip__is_active=True).select_related("trip")
+
+
+def _section_payload(section, config, trips):
+    if not config.is_enabled:
+        return {"config": {"is_enabled": False}, "trips": []}
+
+    return {
+        "config": SectionConfigSerializer(config).data,
+        "trips": section_trip_serializer(section)(trips, many=True).data,
+    }
+
+
+def build_section_payload(section):
+    """
+    Builds the { config, trips } payload served by /v1/trips/<section>/.
+    One range scan over TripSection's (section, visible, display_order)
+    index, loading only the section's card columns.
+    """
+    config = get_section_config(section)
+    if not config.is_enabled:
+        return _section_payload(section, config, [])
+
+    memberships = _memberships().filter(section=section.key)
+    if "category" in section.card_fields:
+        memberships = memberships.select_related("trip__category")
+    memberships = memberships.only(
+        "section", "visible", "display_order", "featured_priority", "trip",
+        *_section_trip_fields(section),
+    ).order_by(*section.ordering)
+
+    return _section_payload(section, config, memberships)
+
+
+def get_featured_trips():
+    """
+    The newest featured trips. When none is marked featured, the trending
+    trips (see recommendations.trending_trip_ids), then the newest active trips.
+    """
+    trips = TripSerializer.setup_eager_loading(Trip.objects.filter(is_active=True))
+    featured = list(trips.filter(is_featured=True).order_by("-id")[:FEATURED_LIMIT])
+    if featured:
+        return featured
+
+    trending = trending_trip_ids()[:FEATURED_LIMIT]
+    featured = sorted(trips.filter(pk__in=trending), key=lambda trip: trending.index(trip.pk)) if trending else []
+    return featured or list(trips.order_by("-id")[:FEATURED_LIMIT])
+
+
+def build_home_payload():
+    """
+    Builds the whole homepage (every showcase section plus the featured trips)
+    in a handful of queries instead of one config + one trip query per section.
+
+    Algorithm:
+      1. Section configs come from the config snapshot (one query at most).
+      2. One query reads the visible memberships of every enabled section,
+         joined with the card columns of their trips.
+      3. Python buckets and sorts the memberships into each section.
+      4. The (at most 3) featured trips are loaded in full.
+
+    Returns:
+      {
+        "sections": { section_key: { "config": {...}, "trips": [...] }, ... },
+        "featured": [ TripSerializer data, ... ]
+      }
+    """
+    configs = load_section_configs()
+    enabled = [section for section in SECTIONS if configs[section.key].is_enabled]
+
+    # ── Step 2: one pass over the enabled sections' memberships ─────────────
+    fields = {"section", "visible", "display_order", "featured_priority", "trip"}
+    for section in enabled:
+        fields.update(_section_trip_fields(section))
+    memberships = _memberships().filter(section__in=[section.key for section in enabled])
+    if any("category" in section.card_fields for section in enabled):
+        memberships = memberships.select_related("trip__category")
+    memberships = memberships.only(*fields).order_by()
+
+    # ── Step 3: bucket into sections ────────────────────────────────────────
+    buckets = {section.key: [] for section in SECTIONS}
+    for membership in memberships:
+        buckets[membership.section].append(membership)
+
+    sections = {}
+    for section in SECTIONS:
+        members = sorted(buckets[section.key], key=_ordering_key(section.ordering))
+        sections[section.key] = _section_payload(section, configs[section.key], members)
+
+    # ── Step 4: featured trips ──────────────────────────────────────────────
+    return {
+        "sections": sections,
+        "featured": TripSerializer(get_featured_trips(), many=True).data,
+    }
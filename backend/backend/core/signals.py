@@ -5,11 +5,96 @@ This signals.py file is a Django module that defines a signal receiver function
 
 
 from django.contrib.auth.models import User
-from django.db.models.signals import post_save
+from django.core.signals import request_finished
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
-from .models import Profile
+from django.utils import timezone
+from .models import Profile, Trip, TripBatch, TripPriceOption, TripSection, TripView, Category, SectionConfig, Review, SiteStat, Coupon
+from .catalog_cache import bump_catalog_version, REVIEWS_VERSION_KEY, SITE_STATS_VERSION_KEY, COUPONS_VERSION_KEY
+from .recommendations import build_recommendations
+from .search import index_trips, remove_trips
+from .view_buffer import flush_trip_views_if_due
 
 @receiver(post_save, sender=User)
 def create_user_profile(sender, instance, created, **kwargs):
     if created:
         Profile.objects.create(user=instance)
+
+
+# ─── Catalog cache invalidation ──────────────────────────────────────────────
+# Any write to the catalog (trips, section memberships, batches, categories, section configs) bumps
+# the catalog version so cached showcase responses are rebuilt on next read. The bump
+# waits for the write's transaction to commit (see bump_catalog_version).
+
+def bump_catalog_version_on_change(sender, **kwargs):
+    bump_catalog_version()
+
+
+CATALOG_MODELS = [Trip, TripSection, TripBatch, TripPriceOption, Category, SectionConfig]
+
+for model in CATALOG_MODELS:
+    post_save.connect(bump_catalog_version_on_change, sender=model, dispatch_uid=f"catalog-version-save-{model.__name__}")
+    post_delete.connect(bump_catalog_version_on_change, sender=model, dispatch_uid=f"catalog-version-delete-{model.__name__}")
+
+
+# A membership change is a change to its trip as far as /v1/trips/changes/ is
+# concerned. Only saves: memberships are removed through the trip's own admin
+# form / serializer, which save the trip anyway, and a post_delete receiver
+# would cost one UPDATE per membership when a trip is deleted.
+
+@receiver(post_save, sender=TripSection)
+def touch_trip_on_section_change(sender, instance, **kwargs):
+    Trip.objects.filter(pk=instance.trip_id).update(updated_at=timezone.now())
+
+
+# ─── Search index ────────────────────────────────────────────────────────────
+# Keeps core_trip_search in step with trips saved or deleted one at a time
+# (see search.py; bulk writes call rebuild_search_index()).
+
+@receiver(post_save, sender=Trip)
+def index_trip_on_save(sender, instance, **kwargs):
+    index_trips([instance])
+
+
+@receiver(post_delete, sender=Trip)
+def unindex_trip_on_delete(sender, instance, **kwargs):
+    remove_trips([instance.pk])
+
+
+# Reviews and site stats have their own versions (ETags of /v1/reviews/ and
+# /v1/site-stats/), and so do coupons (the coupon index, coupon_index.py)
+
+def bump_reviews_version_on_change(sender, **kwargs):
+    bump_catalog_version(REVIEWS_VERSION_KEY)
+
+
+def bump_site_stats_version_on_change(sender, **kwargs):
+    bump_catalog_version(SITE_STATS_VERSION_KEY)
+
+
+def bump_coupons_version_on_change(sender, **kwargs):
+    bump_catalog_version(COUPONS_VERSION_KEY)
+
+
+CONTENT_VERSION_RECEIVERS = (
+    (Review, bump_reviews_version_on_change),
+    (SiteStat, bump_site_stats_version_on_change),
+    (Coupon, bump_coupons_version_on_change),
+)
+
+for model, receiver_func in CONTENT_VERSION_RECEIVERS:
+    post_save.connect(receiver_func, sender=model, dispatch_uid=f"content-version-save-{model.__name__}")
+    post_delete.connect(receiver_func, sender=model, dispatch_uid=f"content-version-delete-{model.__name__}")
+
+
+# ─── Recommendations ─────────────────────────────────────────────────────────
+# A new view changes what the viewer should see next (see recommendations.py).
+# Views recorded through the API are buffered and rebuild recommendations when
+# flushed (view_buffer.py); this covers TripViews saved any other way.
+
+@receiver(post_save, sender=TripView)
+def refresh_recommendations_on_view(sender, instance, **kwargs):
+    build_recommendations([instance.user_id])
+
+
+request_finished.connect(flush_trip_views_if_due, dispatch_uid="trip-view-buffer-flush")
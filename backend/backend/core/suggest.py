@@ -0,0 +1,171 @@
+"""
+Typeahead suggestions for the search box (/v1/trips/suggest/?q=).
+
+Suggestions are the distinct locations, states and countries of active
+trips plus the trip titles, each weighted by popularity: views counted in
+TripViewCount plus BOOKING_WEIGHT per booking (a place weighs as much as
+its trips together).
+
+SuggestionIndex holds them in process, best first, with a sorted array of
+normalized keys — the whole label and every later word of it, so "esc"
+finds "Manali Snow Escape" — pointing back at them. A keystroke is a
+bisect for the range of keys starting with the query and a pick of the
+best (lowest) entry positions in it. Prefixes whose range is wider than
+WIDE_RANGE keys ("m", "ma", "escape" in a catalog of "... Escape" trips)
+have their answers precomputed at build time instead, so no keystroke
+scans more than WIDE_RANGE keys.
+
+The index is built on first use and rebuilt when the catalog version
+changes (see catalog_cache.py), or after MAX_AGE seconds so popularity
+keeps up with new views.
+"""
+
+import heapq
+import threading
+import time
+import unicodedata
+from bisect import bisect_left
+
+from django.conf import settings
+from django.db.models import Count, Sum
+
+from .catalog_cache import get_catalog_version
+from .models import Booking, Trip, TripViewCount
+
+
+MAX_SUGGESTIONS = 20
+WIDE_RANGE = 256
+BOOKING_WEIGHT = 5
+MAX_AGE = getattr(settings, "SUGGEST_INDEX_MAX_AGE", 15 * 60)
+
+# Places before trips when equally popular
+KINDS = ["location", "state", "country", "trip"]
+
+# Sorts after every character a key can contain
+_KEY_END = "\U0010ffff"
+
+
+def normalize(text):
+    """Lowercased, accent-free, single-spaced: "  Bālī  Island" -> "bali island"."""
+    decomposed = unicodedata.normalize("NFKD", text or "")
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(stripped.casefold().split())
+
+
+def _keys(label):
+    """The normalized label and each of its later words onwards."""
+    words = normalize(label).split(" ")
+    return {" ".join(words[start:]) for start in range(len(words)) if words[start]}
+
+
+class SuggestionIndex:
+    def __init__(self, suggestions):
+        """`suggestions`: [(label, kind, trip_id or None, weight)] in any order."""
+        self._suggestions = sorted(
+            suggestions, key=lambda item: (-item[3], KINDS.index(item[1]), normalize(item[0])),
+        )
+
+        pairs = sorted(
+            (key, position)
+            for position, (label, _, _, _) in enumerate(self._suggestions)
+            for key in _keys(label)
+        )
+        self._keys = [key for key, _ in pairs]
+        self._positions = [position for _, position in pairs]
+
+        self._wide = {}
+        self._precompute_wide(0, len(self._keys), 1)
+
+    def _precompute_wide(self, start, end, length):
+        """
+        Stores the answers of the wide `length`-character prefixes among
+        keys[start:end], then looks for wide ones a character longer inside
+        them. Wide ranges of one length are disjoint, so each level costs at
+        most one pass over the keys.
+        """
+        while start < end:
+            key = self._keys[start]
+            if len(key) < length:
+                # The parent prefix itself, sorted first in its range
+                start += 1
+                continue
+            prefix = key[:length]
+            stop = bisect_left(self._keys, prefix + _KEY_END, start, end)
+            if stop - start > WIDE_RANGE:
+                self._wide[prefix] = heapq.nsmallest(MAX_SUGGESTIONS, set(self._positions[start:stop]))
+                self._precompute_wide(start, stop, length + 1)
+            start = stop
+
+    def __len__(self):
+        return len(self._suggestions)
+
+    def suggest(self, query, limit=8):
+        """The best `limit` suggestions with a key starting with `query`."""
+        prefix = normalize(query)
+        if not prefix:
+            return []
+        limit = min(limit, MAX_SUGGESTIONS)
+
+        positions = self._wide.get(prefix)
+        if positions is not None:
+            positions = positions[:limit]
+        else:
+            start = bisect_left(self._keys, prefix)
+            end = bisect_left(self._keys, prefix + _KEY_END, start)
+            positions = heapq.nsmallest(limit, set(self._positions[start:end]))
+
+        return [
+            {"label": label, "kind": kind, "trip_id": trip_id}
+            for label, kind, trip_id, _ in (self._suggestions[position] for position in positions)
+        ]
+
+
+def build_suggestion_index():
+    """Reads active trips and their popularity into a new SuggestionIndex."""
+    views = dict(TripViewCount.objects.values("trip_id").annotate(n=Sum("count")).values_list("trip_id", "n"))
+    bookings = dict(Booking.objects.values("trip_id").annotate(n=Count("id")).values_list("trip_id", "n"))
+
+    suggestions = []
+    places = {}  # normalized label -> [label, kind, weight]
+    trips = Trip.objects.filter(is_active=True).values_list("id", "title", "location", "state", "country")
+    for trip_id, title, *trip_places in trips:
+        weight = views.get(trip_id, 0) + BOOKING_WEIGHT * bookings.get(trip_id, 0)
+        suggestions.append((title, "trip", trip_id, weight))
+
+        # "Goa" the location and "Goa" the state are one suggestion
+        seen = set()
+        for kind, label in zip(KINDS, trip_places):
+            key = normalize(label)
+            if not key or key in seen:
+                continue
+            seen.add(key)
+            place = places.setdefault(key, [label, kind, 0])
+            place[2] += weight
+
+    suggestions.extend((label, kind, None, weight) for label, kind, weight in places.values())
+    return SuggestionIndex(suggestions)
+
+
+# In-process index: (catalog version, built at, SuggestionIndex)
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_suggestion_index():
+    global _index
+    version = get_catalog_version()
+    entry = _index
+    if entry is None or entry[0] != version or time.monotonic() - entry[1] >= MAX_AGE:
+        with _index_lock:
+            # Another thread may have rebuilt it while this one waited
+            entry = _index
+            if entry is None or entry[0] != version or time.monotonic() - entry[1] >= MAX_AGE:
+                entry = _index = (version, time.monotonic(), build_suggestion_index())
+    return entry[2]
+
+
+def clear_suggestion_index():
+    """Drops the in-process index (used by tests)."""
+    global _index
+    with _index_lock:
+        _index = None
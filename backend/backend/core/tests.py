@@ -1,3 +1,1369 @@
-from django.test import TestCase
+import io
+import threading
+import time
+from datetime import timedelta
+from unittest import mock, skipUnless
 
-# Create your tests here.
+from django.contrib import admin as django_admin
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import IntegrityError, connection, transaction
+from django.db.migrations.executor import MigrationExecutor
+from django.test import RequestFactory, TestCase, TransactionTestCase
+from django.utils import timezone
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from .admin import TripBatchInline
+from .catalog_cache import clear_local_cache
+from .coupon_bulk import generate_coupons, import_coupons_csv
+from .coupon_index import clear_coupon_index
+from .coupon_service import get_applicable_coupons, record_coupon_usage
+from .models import (
+    Booking, Category, ContactMessage, Coupon, Enquiry, PasswordResetOTP, Review, SeatHold, SectionConfig, SiteStat,
+    Trip, TripBatch, TripGalleryImage, TripPriceOption, TripRecommendation, TripSection, TripView, TripViewCount,
+)
+from .inventory import place_hold, release_expired_holds, release_seats, reserve_seats
+from .recommendations import TRENDING_CACHE_TIMEOUT, build_recommendations, build_trip_similarities, trending_trip_ids
+from .view_buffer import trip_view_buffer
+from .search import rebuild_search_index, search_trip_ids
+from .seeding import SEED_PASSWORD, seed_catalog
+from .suggest import SuggestionIndex, clear_suggestion_index, get_suggestion_index
+from .sections import SECTIONS, get_section
+from .showcase_service import load_section_configs
+from .urls import urlpatterns
+
+
+@skipUnless(connection.vendor == "sqlite", "EXPLAIN QUERY PLAN is SQLite syntax")
+class ListingIndexTests(TestCase):
+    """Every public trip listing reads core_trip / core_tripsection through an index."""
+
+    LISTING_URLS = [
+        "/v1/trips/",
+        "/v1/trips/?category=treks",
+        "/v1/trips/?is_monsoon_trek=true",
+        "/v1/trips/featured/",
+        "/v1/trips/good-friday/",
+        "/v1/trips/good-friday/all/",
+        "/v1/gallery/journey-frames/",
+        "/v1/trips/monsoon/",
+        "/v1/trips/himalayan/",
+        "/v1/home/",
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        category = Category.objects.create(name="Treks", slug="treks")
+        for i in range(3):
+            trip = Trip.objects.create(
+                title=f"Trek {i}",
+                location="Uttarakhand",
+                price=10000 + i,
+                duration_days=5,
+                category=category,
+                is_featured=i == 0,
+                show_in_journey_in_frames=True,
+                journey_in_frames_order=i,
+                is_good_friday_trip=True,
+                show_in_good_friday_section=True,
+                good_friday_display_order=i,
+            )
+            TripSection.objects.create(trip=trip, section="monsoon", display_order=i, featured_priority=i)
+            TripSection.objects.create(trip=trip, section="himalayan", display_order=i)
+
+    def setUp(self):
+        cache.clear()
+        clear_local_cache()
+
+    def query_plan(self, sql):
+        with connection.cursor() as cursor:
+            cursor.execute("EXPLAIN QUERY PLAN " + sql)
+            return [row[-1] for row in cursor.fetchall()]
+
+    def test_listings_use_indexes(self):
+        for url in self.LISTING_URLS:
+            with self.subTest(url=url):
+                with CaptureQueriesContext(connection) as queries:
+                    response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+
+                for query in queries.captured_queries:
+                    if not query["sql"].startswith("SELECT"):
+                        continue
+                    plan = self.query_plan(query["sql"])
+                    table_scans = [
+                        step for step in plan
+                        if step.startswith("SCAN core_trip") and "INDEX" not in step
+                    ]
+                    self.assertEqual(table_scans, [], f"{query['sql']}\n{plan}")
+
+
+class TripListTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.trip = Trip.objects.create(
+            title="Girls Trip", location="Manali", price=9000, duration_days=4,
+            itinerary=[{"day": 1, "title": "Arrive"}], faqs=[{"q": "?", "a": "!"}],
+        )
+        TripSection.objects.create(trip=cls.trip, section="girls", featured_priority=3)
+
+    def test_list_returns_cards_without_detail_fields(self):
+        card = self.client.get("/v1/trips/").json()[0]
+
+        self.assertEqual(card["sections"], ["girls"])
+        for field in ("itinerary", "faqs", "batches", "price_options", "is_girls_trip"):
+            self.assertNotIn(field, card)
+
+    def test_section_filter_adds_that_sections_fields(self):
+        card = self.client.get("/v1/trips/?is_girls_trip=true").json()[0]
+
+        self.assertTrue(card["is_girls_trip"])
+        self.assertEqual(card["girls_featured_priority"], 3)
+        self.assertNotIn("is_monsoon_trek", card)
+
+    def test_detail_keeps_heavy_fields(self):
+        trip = self.client.get(f"/v1/trips/{self.trip.pk}/").json()
+
+        self.assertEqual(trip["itinerary"], [{"day": 1, "title": "Arrive"}])
+        self.assertTrue(trip["is_girls_trip"])
+
+
+class HomePageTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.featured = Trip.objects.create(title="Spiti", location="Kaza", price=15000, duration_days=7, is_featured=True)
+        cls.later = Trip.objects.create(title="Kasol", location="Kasol", price=4000, duration_days=2)
+        cls.hidden = Trip.objects.create(title="Tosh", location="Tosh", price=4000, duration_days=2)
+        cls.inactive = Trip.objects.create(title="Old", location="Manali", price=4000, duration_days=2, is_active=False)
+        TripSection.objects.create(trip=cls.featured, section="monsoon", display_order=2)
+        TripSection.objects.create(trip=cls.later, section="monsoon", display_order=1, featured_priority=5)
+        TripSection.objects.create(trip=cls.hidden, section="monsoon", visible=False)
+        TripSection.objects.create(trip=cls.inactive, section="monsoon")
+        TripSection.objects.create(trip=cls.later, section="girls")
+        SectionConfig.objects.create(section="girls", title="Girls Only", is_enabled=False)
+
+    def setUp(self):
+        cache.clear()
+        clear_local_cache()
+
+    def test_payload_has_every_section_and_the_featured_trips(self):
+        payload = self.client.get("/v1/home/").json()
+
+        self.assertEqual(set(payload), {"sections", "featured"})
+        self.assertEqual(set(payload["sections"]), {section.key for section in SECTIONS})
+        self.assertEqual([trip["id"] for trip in payload["featured"]], [self.featured.pk])
+
+        monsoon = payload["sections"]["monsoon"]
+        self.assertEqual(set(monsoon), {"config", "trips"})
+        self.assertEqual([trip["id"] for trip in monsoon["trips"]], [self.later.pk, self.featured.pk])
+        self.assertEqual(payload["sections"]["girls"], {"config": {"is_enabled": False}, "trips": []})
+
+    def test_sections_match_their_own_endpoints(self):
+        payload = self.client.get("/v1/home/").json()
+
+        for section in SECTIONS:
+            with self.subTest(section=section.key):
+                self.assertEqual(payload["sections"][section.key], self.client.get(f"/v1/trips/{section.slug}/").json())
+
+
+class CatalogCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.trip = Trip.objects.create(title="Hampta", location="Manali", price=8000, duration_days=5)
+        TripSection.objects.create(trip=cls.trip, section="himalayan")
+
+    def setUp(self):
+        cache.clear()
+        clear_local_cache()
+
+    def test_reads_are_cached_until_a_catalog_write(self):
+        first = self.client.get("/v1/trips/himalayan/")
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get("/v1/trips/himalayan/").json(), first.json())
+            self.assertEqual(self.client.get("/v1/trips/himalayan/", HTTP_IF_NONE_MATCH=first["ETag"]).status_code, 304)
+
+        def renamed_trip():
+            self.trip.title = "Hampta Pass"
+            self.trip.save()
+
+        def saved_config():
+            config = SectionConfig.load(get_section("himalayan"))
+            config.title = "Treks"
+            config.save()
+
+        etag = first["ETag"]
+        for write in (renamed_trip, lambda: Category.objects.create(name="Treks", slug="treks"), saved_config):
+            with self.subTest(write=write.__name__):
+                with self.captureOnCommitCallbacks(execute=True):
+                    write()
+                response = self.client.get("/v1/trips/himalayan/", HTTP_IF_NONE_MATCH=etag)
+                self.assertEqual(response.status_code, 200)
+                self.assertNotEqual(response["ETag"], etag)
+                etag = response["ETag"]
+
+        payload = self.client.get("/v1/trips/himalayan/").json()
+        self.assertEqual((payload["config"]["title"], payload["trips"][0]["title"]), ("Treks", "Hampta Pass"))
+
+    def test_writes_bump_the_version_once_committed(self):
+        etag = self.client.get("/v1/trips/himalayan/")["ETag"]
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                self.trip.title = "Hampta Pass"
+                self.trip.save()
+                # A read before the commit, which other connections would
+                # answer from the old rows, caches nothing under a new version
+                self.assertEqual(self.client.get("/v1/trips/himalayan/", HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        response = self.client.get("/v1/trips/himalayan/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["trips"][0]["title"], "Hampta Pass")
+
+
+class SectionRegistryTests(TestCase):
+    """/v1/trips/<section>/ serves what the per-section views it replaced did."""
+
+    @classmethod
+    def setUpTestData(cls):
+        def trip(title, section, display_order):
+            trip = Trip.objects.create(title=title, location="Manali", state="Himachal", price=5000, duration_days=3)
+            TripSection.objects.create(trip=trip, section=section, display_order=display_order)
+            return trip
+
+        cls.h1, cls.h2, cls.h0 = trip("H1", "himalayan", 1), trip("H2", "himalayan", 1), trip("H0", "himalayan", 0)
+        cls.a1, cls.a2, cls.a0 = trip("A1", "adventure", 1), trip("A2", "adventure", 1), trip("A0", "adventure", 0)
+
+    def test_payload_has_the_old_config_and_card_fields(self):
+        payload = self.client.get("/v1/trips/himalayan/").json()
+
+        self.assertEqual(payload["config"], {
+            "is_enabled": True, "title": "Majestic Himalayan Treks", "subtitle": "", "scroll_speed": 60,
+        })
+        # HimalayanTripSerializer's fields
+        self.assertEqual(list(payload["trips"][0]), [
+            "id", "title", "location", "country", "state", "price", "duration_days", "image",
+            "short_description", "himalayan_display_order",
+        ])
+        self.assertEqual(list(self.client.get("/v1/trips/adventure/").json()["trips"][0]), [
+            "id", "title", "state", "location", "price", "duration_days", "image", "adventure_display_order",
+        ])
+
+    def test_ties_keep_each_sections_old_order(self):
+        def ids(section):
+            return [trip["id"] for trip in self.client.get(f"/v1/trips/{section}/").json()["trips"]]
+
+        # order_by("himalayan_display_order", "-id")
+        self.assertEqual(ids("himalayan"), [self.h0.pk, self.h2.pk, self.h1.pk])
+        # order_by("adventure_display_order"), oldest first on ties
+        self.assertEqual(ids("adventure"), [self.a0.pk, self.a1.pk, self.a2.pk])
+        self.assertEqual(
+            [trip["id"] for trip in self.client.get("/v1/home/").json()["sections"]["adventure"]["trips"]],
+            [self.a0.pk, self.a1.pk, self.a2.pk],
+        )
+
+
+class SectionMigrationTests(TransactionTestCase):
+    """0050/0051 copy the legacy section configs and Trip section columns into SectionConfig / TripSection."""
+
+    before = [("core", "0049_girlssectionconfig_trip_girls_display_order_and_more")]
+    after = [("core", "0051_tripsection")]
+
+    def setUp(self):
+        executor = MigrationExecutor(connection)
+        executor.migrate(self.before)
+        self.addCleanup(self.migrate_to_latest)
+        self.old_apps = executor.loader.project_state(self.before).apps
+
+    def migrate_to_latest(self):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(executor.loader.graph.leaf_nodes())
+
+    def migrate(self):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(self.after)
+        return executor.loader.project_state(self.after).apps
+
+    def test_flagged_trips_become_memberships(self):
+        OldTrip = self.old_apps.get_model("core", "Trip")
+        both = OldTrip.objects.create(
+            title="Both", location="Manali", price=5000, duration_days=3,
+            is_monsoon_trek=True, show_in_monsoon_section=False, monsoon_display_order=4, monsoon_featured_priority=7,
+            is_himalayan_trek=True, show_in_himalayan_section=True, himalayan_display_order=2,
+            # Ordering columns of sections it is not in are not copied
+            india_display_order=9,
+        )
+        neither = OldTrip.objects.create(title="Neither", location="Goa", price=5000, duration_days=3)
+        self.old_apps.get_model("core", "GirlsSectionConfig").objects.create(
+            pk=1, is_enabled=False, title="Girls Only", subtitle="Safe and fun", scroll_speed=45,
+        )
+
+        apps = self.migrate()
+        TripSection = apps.get_model("core", "TripSection")
+        self.assertEqual(
+            sorted(TripSection.objects.values_list("trip_id", "section", "visible", "display_order", "featured_priority")),
+            [(both.pk, "himalayan", True, 2, 0), (both.pk, "monsoon", False, 4, 7)],
+        )
+        self.assertFalse(TripSection.objects.filter(trip_id=neither.pk).exists())
+        self.assertEqual(
+            list(apps.get_model("core", "SectionConfig").objects.values_list("section", "is_enabled", "title", "subtitle", "scroll_speed")),
+            [("girls", False, "Girls Only", "Safe and fun", 45)],
+        )
+
+
+class KeysetPaginationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        for i in range(5):
+            Review.objects.create(name=f"Guest {i}", trip="Manali", review="Great")
+
+    def walk(self, url):
+        ids = []
+        while url:
+            page = self.client.get(url).json()
+            ids += [review["id"] for review in page["results"]]
+            url = page["next"]
+        return ids
+
+    def test_pages_cover_the_full_list_in_order(self):
+        full = [review["id"] for review in self.client.get("/v1/reviews/").json()]
+
+        self.assertEqual(len(full), 5)
+        self.assertEqual(self.walk("/v1/reviews/?page_size=2"), full)
+
+    def test_large_page_size_returns_a_single_page(self):
+        page = self.client.get("/v1/reviews/?page_size=100000").json()
+
+        self.assertEqual(len(page["results"]), 5)
+        self.assertIsNone(page["next"])
+
+
+class ListQueryCountTests(TestCase):
+    """List endpoints run a fixed number of queries however many rows they return."""
+
+    QUERY_COUNTS = [
+        ("/v1/trips/", 2),
+        ("/v1/trips/recommended/", 4),
+        ("/v1/trips/featured/", 4),
+        ("/v1/trips/good-friday/", 4),
+        ("/v1/gallery/journey-frames/", 4),
+        ("/v1/trips/monsoon/", 2),
+        ("/v1/home/", 6),
+        ("/v1/my-enquiries/", 1),
+        ("/v1/admin/enquiries/", 2),
+        ("/v1/admin/trips/", 5),
+        ("/v1/admin/users/", 2),
+        ("/v1/bookings/my/", 4),
+        ("/v1/admin/bookings/", 5),
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user("admin", password="secret")
+        cls.admin.profile.role = "ADMIN"
+        cls.admin.profile.save()
+        cls.category = Category.objects.create(name="Treks", slug="treks")
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def add_rows(self, count):
+        for _ in range(count):
+            n = Trip.objects.count()
+            trip = Trip.objects.create(
+                title=f"Trip {n}", location="Manali", price=9000, duration_days=4, category=self.category,
+                is_featured=True, show_in_good_friday_section=True, show_in_journey_in_frames=True,
+            )
+            TripSection.objects.create(trip=trip, section="monsoon")
+            traveller = User.objects.create_user(f"traveller{n}")
+            for user in (self.admin, traveller):
+                Booking.objects.create(
+                    user=user, trip=trip, full_name="Guest", email="guest@example.com", phone="1", total_amount=9000,
+                )
+            Enquiry.objects.create(trip=trip, user=self.admin, name="Guest", email="guest@example.com", phone="1")
+
+    def test_query_count_does_not_grow_with_rows(self):
+        for rows in (1, 4):
+            self.add_rows(rows)
+            for url, expected in self.QUERY_COUNTS:
+                with self.subTest(url=url, rows=rows):
+                    cache.clear()
+                    clear_local_cache()
+                    # A fresh user object, so the profile lookup is counted every time
+                    self.client.force_authenticate(User.objects.get(pk=self.admin.pk))
+                    with self.assertNumQueries(expected):
+                        response = self.client.get(url)
+                    self.assertEqual(response.status_code, 200)
+
+
+class SectionConfigSnapshotTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        clear_local_cache()
+
+    def test_snapshot_is_read_once_per_catalog_version(self):
+        with self.assertNumQueries(1):
+            load_section_configs()
+        with self.assertNumQueries(0):
+            self.assertEqual(load_section_configs()["himalayan"].title, get_section("himalayan").default_title)
+
+    def test_saving_a_config_refreshes_the_snapshot(self):
+        admin = User.objects.create_user("admin")
+        admin.profile.role = "ADMIN"
+        admin.profile.save()
+        client = APIClient()
+        client.force_authenticate(admin)
+        self.assertEqual(client.get("/v1/trips/himalayan/").json()["config"]["title"], get_section("himalayan").default_title)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            client.patch("/v1/admin/himalayan-config/", {"title": "Into the Himalayas"}, format="json")
+
+        self.assertEqual(client.get("/v1/admin/himalayan-config/").json()["title"], "Into the Himalayas")
+        self.assertEqual(client.get("/v1/trips/himalayan/").json()["config"]["title"], "Into the Himalayas")
+
+
+class ConditionalGetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.trip = Trip.objects.create(title="Kasol", location="Himachal", price=7000, duration_days=3)
+        Review.objects.create(name="Guest", trip="Kasol", review="Great")
+
+    def setUp(self):
+        cache.clear()
+        clear_local_cache()
+
+    def test_matching_etag_returns_304_without_queries(self):
+        for url in ("/v1/trips/", f"/v1/trips/{self.trip.pk}/", "/v1/home/", "/v1/reviews/", "/v1/site-stats/"):
+            with self.subTest(url=url):
+                etag = self.client.get(url)["ETag"]
+
+                with self.assertNumQueries(0):
+                    response = self.client.get(url, headers={"If-None-Match": etag})
+                self.assertEqual(response.status_code, 304)
+                self.assertEqual(response.content, b"")
+
+    def test_etag_changes_with_the_data_behind_it(self):
+        trips_etag = self.client.get("/v1/trips/")["ETag"]
+        reviews_etag = self.client.get("/v1/reviews/")["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Review.objects.create(name="Guest 2", trip="Kasol", review="Loved it")
+        self.assertEqual(self.client.get("/v1/trips/", headers={"If-None-Match": trips_etag}).status_code, 304)
+        self.assertEqual(self.client.get("/v1/reviews/", headers={"If-None-Match": reviews_etag}).status_code, 200)
+
+        self.trip.price = 7500
+        with self.captureOnCommitCallbacks(execute=True):
+            self.trip.save()
+        response = self.client.get("/v1/trips/", headers={"If-None-Match": trips_etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], trips_etag)
+        self.assertEqual(response.json()[0]["price"], 7500)
+
+
+class TripChangesTests(TestCase):
+    def test_returns_trips_changed_since(self):
+        old = Trip.objects.create(title="Old", location="Goa", price=5000, duration_days=2)
+        deactivated = Trip.objects.create(title="Gone", location="Goa", price=5000, duration_days=2)
+        since = self.client.get("/v1/trips/changes/", {"since": "2000-01-01T00:00:00Z"}).json()["until"]
+
+        new = Trip.objects.create(title="New", location="Leh", price=9000, duration_days=5)
+        deactivated.is_active = False
+        deactivated.save()
+        TripSection.objects.create(trip=old, section="monsoon")
+
+        changes = self.client.get("/v1/trips/changes/", {"since": since}).json()
+        self.assertEqual([trip["id"] for trip in changes["updated"]], [new.pk, old.pk])
+        self.assertTrue(changes["updated"][1]["is_monsoon_trek"])
+        self.assertEqual(changes["deactivated"], [deactivated.pk])
+
+    def test_since_is_required(self):
+        self.assertEqual(self.client.get("/v1/trips/changes/").status_code, 400)
+        self.assertEqual(self.client.get("/v1/trips/changes/", {"since": "yesterday"}).status_code, 400)
+        self.assertEqual(self.client.get("/v1/trips/changes/", {"since": "1700000000"}).status_code, 200)
+
+
+class TripSearchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.manali = Trip.objects.create(
+            title="Manali Snow Escape", location="Manali", state="Himachal Pradesh", price=9000, duration_days=4,
+            itinerary=[{"day": 1, "title": "Solang Valley"}, "Old Manali cafes"],
+        )
+        cls.kasol = Trip.objects.create(
+            title="Kasol Backpacking", location="Kasol", state="Himachal Pradesh", price=6000, duration_days=3,
+            highlights=["Manali day trip"],
+        )
+        cls.goa = Trip.objects.create(title="Goa Beaches", location="Goa", country="India", price=7000, duration_days=3)
+
+    def test_prefix_matches_are_ranked_by_field(self):
+        response = self.client.get("/v1/trips/search/", {"q": "man"})
+        self.assertEqual([trip["id"] for trip in response.json()], [self.manali.pk, self.kasol.pk])
+        self.assertEqual(search_trip_ids("himachal solang"), [self.manali.pk])
+        self.assertEqual(search_trip_ids('goa"* ('), [self.goa.pk])
+        self.assertEqual(search_trip_ids(""), [])
+
+    def test_index_follows_saves_and_deletes(self):
+        self.kasol.title = "Kasol and Tosh"
+        self.kasol.save()
+        self.assertEqual(search_trip_ids("tosh"), [self.kasol.pk])
+        self.assertEqual(search_trip_ids("backpack"), [])
+
+        self.goa.is_active = False
+        self.goa.save()
+        self.assertEqual(search_trip_ids("goa"), [])
+
+        self.kasol.delete()
+        self.assertEqual(search_trip_ids("kasol"), [])
+
+        Trip.objects.filter(pk=self.manali.pk).update(title="Spiti Circuit")
+        self.assertEqual(rebuild_search_index(), 2)
+        self.assertEqual(search_trip_ids("spiti"), [self.manali.pk])
+
+    def test_highlight_objects_are_indexed_by_their_text(self):
+        for trip, highlight in ((self.manali, "Snow"), (self.kasol, "Cafes"), (self.goa, "Sunsets")):
+            trip.highlights = [{"title": highlight, "description": f"{highlight} of the trip"}]
+            trip.save()
+
+        response = self.client.get("/v1/trips/search/", {"q": "description"})
+        self.assertEqual(response.json(), [])
+        self.assertEqual(search_trip_ids("title"), [])
+        self.assertEqual(search_trip_ids("sunsets"), [self.goa.pk])
+
+
+class TripFacetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        treks = Category.objects.create(name="Treks", slug="treks")
+        beaches = Category.objects.create(name="Beaches", slug="beaches")
+        cls.kedarkantha = Trip.objects.create(
+            title="Kedarkantha", location="Sankri", state="Uttarakhand", price=9000, duration_days=5, category=treks,
+        )
+        cls.hampta = Trip.objects.create(
+            title="Hampta Pass", location="Manali", state="Himachal Pradesh", price=12000, duration_days=5, category=treks,
+        )
+        cls.gokarna = Trip.objects.create(
+            title="Gokarna", location="Gokarna", state="Karnataka", price=8000, duration_days=3, category=beaches,
+        )
+        cls.bali = Trip.objects.create(title="Bali", location="Bali", country="Indonesia", price=60000, duration_days=7)
+        for trip, start in ((cls.kedarkantha, "2026-12-04"), (cls.kedarkantha, "2026-12-18"),
+                            (cls.hampta, "2026-06-10"), (cls.gokarna, "2026-12-11")):
+            TripBatch.objects.create(trip=trip, start_date=start)
+        Trip.objects.create(title="Retired", location="Goa", state="Goa", price=5000, duration_days=2, is_active=False)
+        TripSection.objects.create(trip=cls.kedarkantha, section="himalayan")
+        TripSection.objects.create(trip=cls.hampta, section="himalayan")
+
+    def setUp(self):
+        cache.clear()
+        clear_local_cache()
+
+    def counts(self, **params):
+        data = self.client.get("/v1/trips/facets/", params).json()
+        return data["total"], {
+            facet: {item["value"]: item["count"] for item in items} for facet, items in data["facets"].items()
+        }
+
+    def test_counts_ignore_the_facets_own_filter(self):
+        total, facets = self.counts()
+        self.assertEqual(total, 4)
+        self.assertEqual(facets["price"], {"under-10k": 2, "10k-25k": 1, "50k-plus": 1})
+        self.assertEqual(facets["duration"], {"1-3": 1, "4-6": 2, "7-9": 1})
+        self.assertEqual(facets["month"], {"2026-06": 1, "2026-12": 2})
+        self.assertEqual(facets["section"], {"himalayan": 2})
+        self.assertNotIn("Goa", facets["state"])
+
+        total, facets = self.counts(category="treks", month="2026-12")
+        self.assertEqual(total, 1)
+        self.assertEqual(facets["category"], {"treks": 1, "beaches": 1})
+        self.assertEqual(facets["month"], {"2026-06": 1, "2026-12": 1})
+        self.assertEqual(facets["state"], {"Uttarakhand": 1, "Himachal Pradesh": 0, "Karnataka": 0})
+
+    def test_trip_list_filters_on_facets(self):
+        def ids(query):
+            return [trip["id"] for trip in self.client.get(f"/v1/trips/?{query}").json()]
+
+        self.assertEqual(ids("price=under-10k,10k-25k&duration=4-6"), [self.kedarkantha.pk, self.hampta.pk])
+        self.assertEqual(ids("month=2026-12&is_himalayan_trek=true"), [self.kedarkantha.pk])
+        self.assertEqual(ids("country=Indonesia"), [self.bali.pk])
+        self.assertEqual(ids("category=treks,beaches&state=Karnataka"), [self.gokarna.pk])
+        self.assertEqual(ids("price=nonsense"), [])
+
+        # The cached index follows catalog changes
+        self.gokarna.price = 30000
+        with self.captureOnCommitCallbacks(execute=True):
+            self.gokarna.save()
+        self.assertEqual(ids("price=25k-50k"), [self.gokarna.pk])
+
+    def test_trip_list_and_counts_agree(self):
+        for query in ("price=under-10k,50k-plus", "duration=4-6&month=2026-12,2026-13", "month=2026-06,2026-12&state=goa",
+                      "country=INDONESIA,india&price=50k-plus", "month=soon", "duration=1-3,10-plus"):
+            with self.subTest(query=query):
+                listed = self.client.get(f"/v1/trips/?{query}").json()
+                self.assertEqual(len(listed), self.client.get(f"/v1/trips/facets/?{query}").json()["total"])
+
+    def test_state_and_country_ignore_case(self):
+        udupi = Trip.objects.create(title="Udupi", location="Udupi", state="karnataka", price=7000, duration_days=2)
+        ids = [trip["id"] for trip in self.client.get("/v1/trips/?state=KARNATAKA").json()]
+        self.assertEqual(ids, [self.gokarna.pk, udupi.pk])
+        self.assertEqual([trip["id"] for trip in self.client.get("/v1/trips/?country=indonesia").json()], [self.bali.pk])
+
+        total, facets = self.counts(state="karnataka")
+        self.assertEqual(total, 2)
+        self.assertEqual(facets["state"], {"Karnataka": 2, "Uttarakhand": 1, "Himachal Pradesh": 1})
+
+
+class TripBatchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user("batch-admin")
+        cls.admin.profile.role = "ADMIN"
+        cls.admin.profile.save()
+        cls.trip = Trip.objects.create(title="Chadar", location="Leh", price=25000, duration_days=8)
+        cls.other = Trip.objects.create(title="Kheerganga", location="Kasol", price=5000, duration_days=2)
+        cls.january = TripBatch.objects.create(trip=cls.trip, start_date="2027-01-10", capacity=20, seats_booked=20)
+        cls.february = TripBatch.objects.create(trip=cls.trip, start_date="2027-02-07", status="Filling Fast")
+        TripBatch.objects.create(trip=cls.other, start_date="2027-01-20", status="Full")
+
+    def test_trip_list_filters_on_departures(self):
+        def ids(query):
+            response = self.client.get(f"/v1/trips/?{query}")
+            self.assertEqual(response.status_code, 200)
+            return [trip["id"] for trip in response.json()]
+
+        self.assertEqual(ids("departs_from=2027-01-01&departs_to=2027-01-31"), [self.trip.pk, self.other.pk])
+        self.assertEqual(ids("departs_from=2027-01-01&departs_to=2027-01-31&has_seats=true"), [])
+        self.assertEqual(ids("departs_from=2027-02-01&has_seats=true"), [self.trip.pk])
+        self.assertEqual(self.client.get("/v1/trips/?departs_from=soon").status_code, 400)
+
+    def test_admin_writes_batches_in_the_json_shape(self):
+        detail = self.client.get(f"/v1/trips/{self.trip.pk}/").json()
+        self.assertEqual(
+            [(batch["startDate"], batch["status"], batch["seatsLeft"]) for batch in detail["batches"]],
+            [("2027-01-10", "Available", 0), ("2027-02-07", "Filling Fast", None)],
+        )
+
+        client = APIClient()
+        client.force_authenticate(self.admin)
+        payload = {
+            "title": "Chadar", "location": "Leh", "price": 25000, "duration_days": 8,
+            "batches": [
+                {"id": self.january.pk, "startDate": "2027-01-12", "endDate": "2027-01-19", "status": "Full"},
+                {"startDate": "2027-03-01", "status": "Available"},
+            ],
+        }
+        response = client.put(f"/v1/admin/trips/{self.trip.pk}/", payload, format="json")
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual([batch["startDate"] for batch in response.json()["batches"]], ["2027-01-12", "2027-03-01"])
+
+        self.january.refresh_from_db()
+        self.assertEqual((str(self.january.start_date), self.january.status, self.january.seats_booked), ("2027-01-12", "Full", 20))
+        self.assertFalse(TripBatch.objects.filter(pk=self.february.pk).exists())
+
+    def test_batches_with_seats_taken_are_not_deleted(self):
+        client = APIClient()
+        client.force_authenticate(self.admin)
+        Booking.objects.create(
+            user=self.admin, trip=self.trip, batch=self.february, full_name="A", email="a@example.com",
+            phone="1", total_amount=25000,
+        )
+        payload = {
+            "title": "Chadar Renamed", "location": "Leh", "price": 25000, "duration_days": 8,
+            "batches": [{"id": self.january.pk, "startDate": "2027-01-10", "status": "Available"}],
+        }
+        response = client.put(f"/v1/admin/trips/{self.trip.pk}/", payload, format="json")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("2027-02-07", response.json()["batches"][0])
+        self.assertTrue(TripBatch.objects.filter(pk=self.february.pk).exists())
+        self.assertFalse(Trip.objects.filter(title="Chadar Renamed").exists())
+
+        Booking.objects.filter(batch=self.february).update(status="DECLINED")
+        self.assertEqual(client.put(f"/v1/admin/trips/{self.trip.pk}/", payload, format="json").status_code, 200)
+        self.assertFalse(TripBatch.objects.filter(pk=self.february.pk).exists())
+
+    def test_capacity_is_not_set_below_the_seats_taken(self):
+        client = APIClient()
+        client.force_authenticate(self.admin)
+        payload = {
+            "title": "Chadar", "location": "Leh", "price": 25000, "duration_days": 8,
+            "batches": [{"id": self.january.pk, "startDate": "2027-01-10", "status": "Full", "capacity": 15}],
+        }
+        response = client.put(f"/v1/admin/trips/{self.trip.pk}/", payload, format="json")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("2027-01-10 (20 seats taken)", response.json()["batches"][0])
+        self.assertEqual(TripBatch.objects.get(pk=self.january.pk).capacity, 20)
+
+    def test_a_failed_trip_write_changes_nothing(self):
+        client = APIClient()
+        client.force_authenticate(self.admin)
+        payload = {
+            "title": "Chadar Renamed", "location": "Leh", "price": 25000, "duration_days": 8, "is_himalayan_trek": True,
+            "price_options": [{"occupancy": "Double", "price": 27000}],
+            "batches": [{"startDate": "2027-03-01", "status": "Available"}],
+        }
+        with mock.patch("backend.backend.core.serializers.batch_serializer.save_trip_batches",
+                        side_effect=IntegrityError("batch clash")):
+            with self.assertRaises(IntegrityError):
+                client.put(f"/v1/admin/trips/{self.trip.pk}/", payload, format="json")
+
+        self.trip.refresh_from_db()
+        self.assertEqual(self.trip.title, "Chadar")
+        self.assertFalse(self.trip.section_memberships.exists())
+        self.assertFalse(self.trip.price_options.exists())
+
+    def test_django_admin_inline_keeps_the_same_rules(self):
+        request = RequestFactory().post("/")
+        request.user = User.objects.create_superuser("root")
+        formset_class = TripBatchInline(Trip, django_admin.site).get_formset(request, self.trip)
+        SeatHold.objects.create(
+            batch=self.february, user=self.admin, seats=2, expires_at=timezone.now() + timedelta(minutes=5),
+        )
+
+        def formset(changes):
+            data = {"batches-TOTAL_FORMS": 2, "batches-INITIAL_FORMS": 2}
+            for position, batch in enumerate((self.january, self.february)):
+                values = {
+                    "id": batch.pk, "trip": self.trip.pk, "start_date": batch.start_date, "status": batch.status,
+                    "capacity": batch.capacity or "", **changes.get(batch.pk, {}),
+                }
+                data.update({f"batches-{position}-{name}": value for name, value in values.items()})
+            return formset_class(data, instance=self.trip, prefix="batches")
+
+        deleting_held = formset({self.february.pk: {"DELETE": "on"}})
+        self.assertFalse(deleting_held.is_valid())
+        self.assertIn("2027-02-07", deleting_held.non_form_errors()[0])
+
+        shrinking = formset({self.january.pk: {"capacity": 15}})
+        self.assertFalse(shrinking.is_valid())
+        self.assertIn("20 seats", shrinking.errors[0]["capacity"][0])
+
+        self.assertTrue(formset({self.january.pk: {"capacity": 25}}).is_valid())
+
+
+class SeatInventoryTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user("seat-admin")
+        cls.admin.profile.role = "ADMIN"
+        cls.admin.profile.save()
+        cls.alice = User.objects.create_user("alice")
+        cls.bob = User.objects.create_user("bob")
+        cls.trip = Trip.objects.create(title="Hampta Pass", location="Manali", price=12000, duration_days=5)
+        cls.batch = TripBatch.objects.create(trip=cls.trip, start_date="2027-06-01", capacity=4)
+
+    def setUp(self):
+        cache.clear()
+        clear_local_cache()
+
+    def client_for(self, user):
+        client = APIClient()
+        client.force_authenticate(user)
+        return client
+
+    def book(self, user, persons, **extra):
+        return self.client_for(user).post("/v1/bookings/create/", {
+            "trip": self.trip.pk, "batch": self.batch.pk, "persons": persons,
+            "full_name": user.username, "email": "a@example.com", "phone": "1", **extra,
+        }, format="json")
+
+    def seats_booked(self):
+        self.batch.refresh_from_db()
+        return self.batch.seats_booked
+
+    def test_invalid_bookings_take_no_seats(self):
+        hold = self.client_for(self.alice).post("/v1/bookings/holds/", {"batch": self.batch.pk, "persons": 2}, format="json")
+        self.assertEqual(self.seats_booked(), 2)
+
+        for extra in ({"travel_date": "garbage"}, {"email": "not-an-email"}):
+            with self.subTest(extra=extra):
+                response = self.book(self.alice, 2, hold=hold.json()["id"], **extra)
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(self.seats_booked(), 2)
+        self.assertTrue(SeatHold.objects.filter(pk=hold.json()["id"]).exists())
+
+        # A failure once the seats are taken gives them back
+        with mock.patch.object(Booking, "save", side_effect=RuntimeError("database went away")):
+            with self.assertRaises(RuntimeError):
+                self.book(self.bob, 1)
+        self.assertEqual(self.seats_booked(), 2)
+
+    def test_holds_and_bookings_never_oversell(self):
+        hold = self.client_for(self.alice).post("/v1/bookings/holds/", {"batch": self.batch.pk, "persons": 3}, format="json")
+        self.assertEqual(hold.status_code, 201)
+        self.assertEqual(self.seats_booked(), 3)
+
+        refused = self.client_for(self.bob).post("/v1/bookings/holds/", {"batch": self.batch.pk, "persons": 2}, format="json")
+        self.assertEqual((refused.status_code, refused.json()["seats_left"]), (409, 1))
+
+        # The hold's 3 seats plus the one left
+        self.assertEqual(self.book(self.alice, 4, hold=hold.json()["id"]).status_code, 201)
+        self.assertEqual((self.seats_booked(), SeatHold.objects.count()), (4, 0))
+        self.assertEqual(self.book(self.bob, 1).status_code, 409)
+        self.assertEqual(Booking.objects.filter(trip=self.trip).count(), 1)
+
+    def test_expired_holds_give_their_seats_back(self):
+        hold = place_hold(self.alice, self.batch.pk, 4)
+        self.assertIsNone(place_hold(self.bob, self.batch.pk, 1))
+
+        SeatHold.objects.filter(pk=hold.pk).update(expires_at=timezone.now() - timedelta(seconds=1))
+        self.assertEqual(self.book(self.bob, 2, hold=hold.pk).status_code, 201)
+        self.assertEqual((self.seats_booked(), SeatHold.objects.count()), (2, 0))
+        self.assertEqual(release_expired_holds(), 0)
+
+    def test_declining_a_booking_frees_its_seats(self):
+        booking = Booking.objects.get(pk=self.book(self.alice, 3).json()["id"])
+        admin = self.client_for(self.admin)
+
+        self.assertEqual(admin.patch(f"/v1/admin/bookings/{booking.pk}/status/", {"status": "DECLINED"}).status_code, 200)
+        self.assertEqual(self.seats_booked(), 0)
+        self.assertEqual(self.book(self.bob, 2).status_code, 201)
+
+        # Only 2 seats left for the 3 of the reinstated booking
+        self.assertEqual(admin.patch(f"/v1/admin/bookings/{booking.pk}/status/", {"status": "APPROVED"}).status_code, 409)
+        booking.refresh_from_db()
+        self.assertEqual((booking.status, self.seats_booked()), ("DECLINED", 2))
+
+
+class PricingTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("payer")
+        cls.trip = Trip.objects.create(title="Spiti Circuit", location="Kaza", price=10000, duration_days=7)
+        TripPriceOption.objects.create(trip=cls.trip, occupancy="Triple", price=10000, position=0)
+        cls.double = TripPriceOption.objects.create(trip=cls.trip, occupancy="Double", price=12000, position=1)
+        Coupon.objects.create(code="SPITI10", discount_value=10, max_discount=1000)
+
+    def setUp(self):
+        cache.clear()
+        clear_local_cache()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def quote(self, **params):
+        return self.client.get(f"/v1/trips/{self.trip.pk}/quote/", params)
+
+    def test_quote_prices_occupancy_persons_gst_and_coupon(self):
+        quote = self.quote(persons=2, occupancy=" DOUBLE ", coupon="spiti10").json()
+        self.assertEqual(
+            {key: quote[key] for key in ("occupancy", "unit_price", "amount", "gst", "discount_amount", "total_amount")},
+            {"occupancy": "Double", "unit_price": 12000, "amount": 24000, "gst": 1200, "discount_amount": 1000, "total_amount": 24200},
+        )
+        self.assertTrue(quote["coupon"]["valid"])
+        self.assertEqual(self.quote().json()["total_amount"], 10500)
+
+        self.assertEqual(self.quote(occupancy="Quad").status_code, 400)
+        self.assertEqual(self.quote(persons=0).status_code, 400)
+        self.assertEqual(self.client.get("/v1/trips/999999/quote/").status_code, 404)
+
+    def test_price_table_is_cached_until_the_options_change(self):
+        self.quote(occupancy="Double")
+        with self.assertNumQueries(0):
+            self.assertEqual(self.quote(occupancy="Double").json()["unit_price"], 12000)
+
+        self.double.price = 13000
+        with self.captureOnCommitCallbacks(execute=True):
+            self.double.save()
+        self.assertEqual(self.quote(occupancy="Double").json()["unit_price"], 13000)
+
+    def test_bookings_are_charged_the_quote_not_the_page_total(self):
+        response = self.client.post("/v1/bookings/create/", {
+            "trip": self.trip.pk, "persons": 2, "occupancy_details": "Double", "coupon_code": "SPITI10",
+            "total_amount": 1, "discount_amount": 99999, "full_name": "P", "email": "p@example.com", "phone": "1",
+        }, format="json")
+        self.assertEqual(response.status_code, 201, response.content)
+        booking = Booking.objects.get(pk=response.json()["id"])
+        self.assertEqual((booking.total_amount, booking.discount_amount, booking.occupancy_details), (24200, 1000, "Double"))
+
+        refused = self.client.post("/v1/bookings/create/", {
+            "trip": self.trip.pk, "persons": 1, "coupon_code": "NOPE", "full_name": "P", "email": "p@example.com", "phone": "1",
+        }, format="json")
+        self.assertEqual(refused.status_code, 400)
+
+
+class CouponIndexTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.alice, cls.bob = User.objects.create_user("alice"), User.objects.create_user("bob")
+        cls.trip = Trip.objects.create(title="Hampta Pass", location="Manali", price=8000, duration_days=5)
+        cls.other_trip = Trip.objects.create(title="Valley of Flowers", location="Ghangaria", price=9000, duration_days=6)
+        Coupon.objects.create(code="ALL10", discount_value=10, max_discount=500)
+        Coupon.objects.create(code="BIG2K", discount_type="FLAT", discount_value=2000, min_booking_amount=20000)
+        Coupon.objects.create(code="HAMPTA5", discount_value=5, trip=cls.trip)
+        Coupon.objects.create(code="VOF5", discount_value=5, trip=cls.other_trip)
+        Coupon.objects.create(code="ALICE300", discount_type="FLAT", discount_value=300, user=cls.alice)
+        Coupon.objects.create(code="ALICEVOF", discount_type="FLAT", discount_value=250, user=cls.alice, trip=cls.other_trip)
+        Coupon.objects.create(code="GONE", discount_value=50, expiry_date=timezone.now() - timedelta(days=1))
+        Coupon.objects.create(code="OFF", discount_value=50, is_active=False)
+        cls.once = Coupon.objects.create(code="ONCE", discount_type="FLAT", discount_value=100, usage_limit=1)
+
+    def setUp(self):
+        cache.clear()
+        clear_coupon_index()
+
+    def codes(self, user, trip, amount):
+        return [coupon["code"] for coupon in get_applicable_coupons(user.pk, str(trip.pk), amount)["all_coupons"]]
+
+    def test_lookup_reads_only_the_matching_buckets(self):
+        self.assertEqual(self.codes(self.alice, self.trip, 8000), ["ALL10", "HAMPTA5", "ALICE300", "ONCE"])
+        self.assertEqual(self.codes(self.bob, self.trip, 30000), ["BIG2K", "HAMPTA5", "ALL10", "ONCE"])
+        self.assertEqual(self.codes(self.alice, self.other_trip, 4000), ["ALL10", "ALICE300", "ALICEVOF", "VOF5", "ONCE"])
+
+    def test_index_is_rebuilt_when_coupons_change_and_usage_is_read_live(self):
+        self.codes(self.bob, self.trip, 10000)
+        with self.assertNumQueries(1):  # ONCE's usage
+            self.codes(self.bob, self.trip, 10000)
+
+        record_coupon_usage(self.once)
+        self.assertNotIn("ONCE", self.codes(self.bob, self.trip, 10000))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Coupon.objects.create(code="BOB1K", discount_type="FLAT", discount_value=1000, user=self.bob)
+            Coupon.objects.filter(code="ALL10").get().delete()
+        self.assertEqual(self.codes(self.bob, self.trip, 10000), ["BOB1K", "HAMPTA5"])
+
+
+class CouponBulkTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.users = [User.objects.create_user(f"traveller{i}") for i in range(3)]
+        cls.trip = Trip.objects.create(title="Chadar Trek", location="Leh", price=25000, duration_days=9)
+        Coupon.objects.create(code="TAKEN1", discount_value=5)
+
+    def setUp(self):
+        cache.clear()
+        clear_coupon_index()
+
+    def test_generated_codes_are_unique_and_personal(self):
+        with mock.patch("backend.backend.core.coupon_bulk.BATCH_SIZE", 2):
+            codes = generate_coupons(prefix="diwali-", code_length=6, user_ids=[user.pk for user in self.users],
+                                     discount_type="FLAT", discount_value=500, usage_limit=1)
+        self.assertEqual(len(set(codes)), 3)
+        self.assertTrue(all(code.startswith("DIWALI-") and len(code) == 13 for code in codes))
+        self.assertEqual(
+            sorted(Coupon.objects.filter(code__in=codes).values_list("user_id", flat=True)),
+            [user.pk for user in self.users],
+        )
+        # No signals, but the coupon index hears of them
+        self.assertEqual(
+            [c["code"] for c in get_applicable_coupons(self.users[0].pk, self.trip.pk, 1000)["all_coupons"]],
+            [codes[0], "TAKEN1"],
+        )
+
+        with self.assertRaises(ValueError):
+            generate_coupons(user_ids=[self.users[0].pk, 999999], discount_value=5)
+        self.assertEqual(Coupon.objects.count(), 4)
+
+    def test_codes_taken_meanwhile_are_replaced(self):
+        Coupon.objects.create(code="TAKEN2", discount_value=5)
+        Coupon.objects.create(code="TAKEN3", discount_value=5)
+        admin = User.objects.create_user("admin")
+        admin.profile.role = "ADMIN"
+        admin.profile.save()
+        client = APIClient()
+        client.force_authenticate(admin)
+
+        def picking(*codes):
+            # As if the codes were created after generate_coupons() read the codes in use
+            return (
+                mock.patch("backend.backend.core.coupon_bulk._taken_codes", return_value=set()),
+                mock.patch("backend.backend.core.coupon_bulk._random.choices", side_effect=[list(code) for code in codes]),
+            )
+
+        taken_codes, choices = picking("TAKEN1", "FRESH1")
+        with taken_codes, choices:
+            self.assertEqual(generate_coupons(1, code_length=6, discount_value=5), ["FRESH1"])
+
+        taken_codes, choices = picking("TAKEN1", "TAKEN2", "TAKEN3")
+        with taken_codes, choices:
+            response = client.post("/v1/admin/coupons/generate/", {"count": 1, "code_length": 6, "discount_value": 5}, format="json")
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(Coupon.objects.count(), 4)
+
+    def test_csv_import_is_all_or_nothing(self):
+        def rows(*lines):
+            return io.StringIO("code,discount_type,discount_value,expiry_date,user,trip\n" + "".join(f"{line}\n" for line in lines))
+
+        with mock.patch("backend.backend.core.coupon_bulk.BATCH_SIZE", 1):
+            created = import_coupons_csv(rows(f"LEH10,,10,,,{self.trip.pk}", f"MINE,FLAT,300,2030-01-01 00:00,{self.users[1].pk},"))
+        self.assertEqual(created, 2)
+        mine = Coupon.objects.get(code="MINE")
+        self.assertEqual((mine.discount_type, mine.user_id, mine.expiry_date.year), ("FLAT", self.users[1].pk, 2030))
+
+        for lines, error in (
+            (["NEW1,PERCENT,10,,,"], "Line 2: discount_type"),
+            (["NEW1,,10,,,", "taken1,,10,,,"], "Line 3: coupon taken1 already exists"),
+            (["NEW1,,10,,,", "new1,,5,,,"], "Line 3: coupon new1 already exists"),
+            (["NEW1,,10,,,", "NEW2,,10,,999999,"], "Line 3: no user with id 999999"),
+        ):
+            with self.subTest(lines=lines), self.assertRaisesMessage(ValueError, error):
+                import_coupons_csv(rows(*lines))
+        self.assertFalse(Coupon.objects.filter(code__startswith="NEW").exists())
+
+
+class SeatInventoryConcurrencyTests(TransactionTestCase):
+    def test_concurrent_checkouts_never_oversell_a_batch(self):
+        trip = Trip.objects.create(title="Kedarkantha", location="Sankri", price=9000, duration_days=6)
+        batch = TripBatch.objects.create(trip=trip, start_date="2027-12-20", capacity=25)
+        threads = 20
+        barrier = threading.Barrier(threads)
+        taken, refused, errors = [], [], []
+
+        def checkout():
+            try:
+                barrier.wait()
+                for attempt in range(5):
+                    if not reserve_seats(batch.pk, 2):
+                        refused.append(attempt)
+                        continue
+                    taken.append(2)
+                    # Every other one is abandoned and handed back
+                    if attempt % 2:
+                        release_seats(batch.pk, 2)
+                        taken.append(-2)
+            except Exception as error:
+                errors.append(error)
+            finally:
+                connection.close()
+
+        workers = [threading.Thread(target=checkout) for _ in range(threads)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        self.assertEqual(errors, [])
+        self.assertTrue(refused)
+        batch.refresh_from_db()
+        self.assertEqual(batch.seats_booked, sum(taken))
+        self.assertLessEqual(batch.seats_booked, 25)
+
+
+class TripSuggestTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.manali = Trip.objects.create(
+            title="Manali Snow Escape", location="Manali", state="Himachal Pradesh", price=9000, duration_days=4,
+        )
+        cls.mandu = Trip.objects.create(title="Mandu Heritage Walk", location="Mandu", state="Madhya Pradesh", price=4000, duration_days=2)
+        cls.bali = Trip.objects.create(title="Bāli Island Hopper", location="Bali", country="Indonesia", price=40000, duration_days=6)
+        TripViewCount.objects.create(trip=cls.mandu, hour="2026-01-01T00:00:00Z", count=3)
+        TripViewCount.objects.create(trip=cls.manali, hour="2026-01-01T00:00:00Z", count=10)
+
+    def setUp(self):
+        cache.clear()
+        clear_suggestion_index()
+        self.addCleanup(clear_suggestion_index)
+
+    def suggest(self, q, **params):
+        return [(item["label"], item["kind"]) for item in self.client.get("/v1/trips/suggest/", {"q": q, **params}).json()]
+
+    def test_prefixes_and_later_words_rank_by_popularity(self):
+        self.assertEqual(self.suggest("man"), [
+            ("Manali", "location"), ("Manali Snow Escape", "trip"), ("Mandu", "location"), ("Mandu Heritage Walk", "trip"),
+        ])
+        self.assertEqual(self.suggest("ma", limit=2), [("Manali", "location"), ("Manali Snow Escape", "trip")])
+        self.assertEqual(self.suggest("prad"), [("Himachal Pradesh", "state"), ("Madhya Pradesh", "state")])
+        self.assertEqual(self.suggest("  SNOW es"), [("Manali Snow Escape", "trip")])
+        self.assertEqual(self.suggest("bali"), [("Bali", "location"), ("Bāli Island Hopper", "trip")])
+        self.assertEqual(self.suggest(""), [])
+
+    def test_precomputed_wide_prefixes_match_a_full_scan(self):
+        suggestions = [(f"Trip {i} Escape", "trip", i, i % 7) for i in range(60)] + [("Escapade", "location", None, 3)]
+        full_scan = SuggestionIndex(suggestions)
+        with mock.patch("backend.backend.core.suggest.WIDE_RANGE", 2):
+            precomputed = SuggestionIndex(suggestions)
+
+        for q in ("t", "trip", "trip 1", "trip 12", "e", "esc", "escapade", "1 e"):
+            with self.subTest(q=q):
+                self.assertEqual(precomputed.suggest(q, limit=10), full_scan.suggest(q, limit=10))
+
+    def test_index_is_rebuilt_when_the_catalog_changes(self):
+        index = get_suggestion_index()
+        self.assertIs(get_suggestion_index(), index)
+
+        self.mandu.is_active = False
+        with self.captureOnCommitCallbacks(execute=True):
+            self.mandu.save()
+        self.assertEqual(self.suggest("mand"), [])
+
+
+class RecommendationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        treks = Category.objects.create(name="Treks", slug="treks")
+        cls.a, cls.b, cls.c, cls.d = (
+            Trip.objects.create(title=title, location="Himachal", price=10000, duration_days=4, category=treks)
+            for title in "ABCD"
+        )
+        cls.users = [User.objects.create_user(f"user{i}") for i in range(3)]
+
+    def view(self, user, *trips):
+        TripView.objects.bulk_create(TripView(user=user, trip=trip) for trip in trips)
+
+    def test_co_viewed_trips_rank_first(self):
+        me, other, another = self.users
+        self.view(me, self.a, self.b)
+        self.view(other, self.a, self.c)
+        self.view(another, self.a, self.c, self.d)
+        build_recommendations()
+
+        client = APIClient()
+        client.force_authenticate(me)
+        ids = [trip["id"] for trip in client.get("/v1/trips/recommended/").json()]
+        self.assertEqual(ids, [self.c.pk, self.d.pk])
+
+    def test_a_users_rebuild_reads_only_the_latest_co_viewers(self):
+        me, other, another = self.users
+        newest = User.objects.create_user("newest")
+        self.view(me, self.a, self.b)
+        self.view(other, self.a, self.c)
+        self.view(another, self.a, self.c)
+        self.view(newest, self.a, self.d)
+        TripView.objects.filter(user=newest).update(viewed_at=timezone.now() + timedelta(minutes=1))
+
+        def recommended():
+            return list(TripRecommendation.objects.filter(user=me).order_by("rank").values_list("trip", flat=True))
+
+        build_recommendations([me.pk])
+        self.assertEqual(recommended(), [self.c.pk, self.d.pk])
+        with mock.patch("backend.backend.core.recommendations.COVIEWERS_PER_TRIP", 1):
+            build_recommendations([me.pk])
+        self.assertEqual(recommended(), [self.d.pk, self.c.pk])
+
+    def test_a_view_refreshes_the_viewers_list(self):
+        client = APIClient()
+        client.force_authenticate(self.users[0])
+
+        client.post(f"/v1/trips/{self.a.pk}/view/")
+        trip_view_buffer.flush()
+
+        self.assertNotIn(self.a.pk, TripRecommendation.objects.filter(user=self.users[0]).values_list("trip", flat=True))
+        self.assertNotIn(self.a.pk, [trip["id"] for trip in client.get("/v1/trips/recommended/").json()])
+
+    def test_similar_trips_ranks_by_co_views(self):
+        me, other, another = self.users
+        self.view(me, self.a, self.b)
+        self.view(other, self.a, self.b)
+        self.view(another, self.a, self.c)
+        build_trip_similarities()
+
+        ids = [trip["id"] for trip in self.client.get(f"/v1/trips/{self.a.pk}/similar/").json()]
+        self.assertEqual(ids, [self.b.pk, self.c.pk])
+        self.assertEqual(self.client.get(f"/v1/trips/{self.d.pk}/similar/").json(), [])
+
+    def test_anonymous_users_get_active_trips_minus_excluded(self):
+        ids = [trip["id"] for trip in self.client.get(f"/v1/trips/recommended/?exclude={self.a.pk}").json()]
+        self.assertEqual(ids, [self.b.pk, self.c.pk, self.d.pk])
+
+
+class TripViewBufferTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("viewer")
+        cls.trips = [Trip.objects.create(title=f"Trip {i}", location="Goa", price=5000, duration_days=2) for i in range(4)]
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.addCleanup(trip_view_buffer.flush)
+
+    def test_views_are_written_in_one_batch_when_the_buffer_fills(self):
+        self.addCleanup(setattr, trip_view_buffer, "flush_size", trip_view_buffer.flush_size)
+        trip_view_buffer.flush_size = 4
+
+        for trip in (self.trips[0], self.trips[0], self.trips[1]):
+            with self.assertNumQueries(1):
+                self.client.post(f"/v1/trips/{trip.pk}/view/")
+        self.assertEqual(TripView.objects.count(), 0)
+
+        self.client.post(f"/v1/trips/{self.trips[2].pk}/view/")
+        self.assertEqual(len(trip_view_buffer), 0)
+        self.assertEqual(
+            set(TripView.objects.values_list("trip_id", flat=True)), {trip.pk for trip in self.trips[:3]},
+        )
+        self.assertEqual(list(TripRecommendation.objects.filter(user=self.user).values_list("trip_id", flat=True)), [self.trips[3].pk])
+
+    def test_views_of_trips_deactivated_before_the_flush_are_dropped(self):
+        self.client.post(f"/v1/trips/{self.trips[0].pk}/view/")
+        self.client.post(f"/v1/trips/{self.trips[1].pk}/view/")
+        Trip.objects.filter(pk=self.trips[1].pk).update(is_active=False)
+
+        self.assertEqual(trip_view_buffer.flush(), 1)
+        self.assertEqual(list(TripView.objects.values_list("trip_id", flat=True)), [self.trips[0].pk])
+
+    def test_anonymous_views_are_counted_and_drive_trending(self):
+        cache.clear()
+        anonymous = APIClient()
+        for trip, views in ((self.trips[2], 4), (self.trips[0], 1), (self.trips[1], 2)):
+            for _ in range(views):
+                self.assertEqual(anonymous.post(f"/v1/trips/{trip.pk}/view/").status_code, 200)
+
+        self.assertEqual(trip_view_buffer.flush(), 7)
+        self.assertEqual(TripView.objects.count(), 0)
+        self.assertEqual(
+            dict(TripViewCount.objects.values_list("trip_id", "count")),
+            {self.trips[2].pk: 4, self.trips[0].pk: 1, self.trips[1].pk: 2},
+        )
+
+        anonymous.post(f"/v1/trips/{self.trips[0].pk}/view/")
+        anonymous.post(f"/v1/trips/{self.trips[0].pk}/view/")
+        trip_view_buffer.flush()
+        self.assertEqual(TripViewCount.objects.get(trip=self.trips[0]).count, 3)
+
+        cache.clear()
+        self.assertEqual(trending_trip_ids(), [self.trips[2].pk, self.trips[0].pk, self.trips[1].pk])
+        response = anonymous.get(f"/v1/trips/recommended/?exclude={self.trips[0].pk}")
+        self.assertEqual(
+            [trip["id"] for trip in response.json()], [self.trips[2].pk, self.trips[1].pk, self.trips[3].pk],
+        )
+
+    def test_featured_fallback_to_trending_is_not_cached_past_the_trending_timeout(self):
+        cache.clear()
+        clear_local_cache()
+        hour = timezone.now().replace(minute=0, second=0, microsecond=0)
+        TripViewCount.objects.create(trip=self.trips[1], hour=hour, count=5)
+
+        first = self.client.get("/v1/trips/featured/")
+        self.assertEqual(first.json()[0]["id"], self.trips[1].pk)
+
+        # Views bump no version: served from the cache, and still a 304 ...
+        TripViewCount.objects.create(trip=self.trips[3], hour=hour, count=50)
+        self.assertEqual(self.client.get("/v1/trips/featured/").json()[0]["id"], self.trips[1].pk)
+        self.assertEqual(self.client.get("/v1/trips/featured/", HTTP_IF_NONE_MATCH=first["ETag"]).status_code, 304)
+
+        # ... until the trending list itself would have been recomputed
+        later = time.time() + TRENDING_CACHE_TIMEOUT
+        with mock.patch("time.time", return_value=later):
+            response = self.client.get("/v1/trips/featured/", HTTP_IF_NONE_MATCH=first["ETag"])
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json()[0]["id"], self.trips[3].pk)
+            self.assertEqual(self.client.get("/v1/home/").json()["featured"][0]["id"], self.trips[3].pk)
+
+
+class EndpointQueryBudgetTests(TestCase):
+    """
+    Every URL in core/urls.py stays within a fixed query budget against a
+    seeded catalog (see seeding.py), so an N+1 in a view or serializer fails
+    here rather than in production. Budgets are upper bounds measured with
+    cold caches; lowering one is always fine.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = seed_catalog(trips=300, users=200, bookings=3000, views=3000, reviews=1000, enquiries=1000)
+        cls.booking = Booking.objects.filter(user__profile__role="USER").select_related("user").first()
+        cls.traveller = cls.booking.user
+        cls.trip = Trip.objects.filter(is_active=True).first()
+        cls.spare_trip = Trip.objects.exclude(pk=cls.trip.pk).last()
+        cls.spare_user = User.objects.exclude(pk__in=[cls.admin.pk, cls.traveller.pk]).last()
+        cls.coupon, cls.spare_coupon = Coupon.objects.filter(trip=None, user=None)[:2]
+        cls.message = ContactMessage.objects.first()
+        cls.image = TripGalleryImage.objects.first()
+        cls.stat = SiteStat.objects.first()
+        PasswordResetOTP.objects.create(email=cls.traveller.email, otp="123456")
+        cls.batch = TripBatch.objects.create(trip=cls.trip, start_date="2027-05-01", capacity=50)
+        cls.hold = place_hold(cls.traveller, cls.batch.pk, 2)
+        cls.spare_hold = place_hold(cls.traveller, cls.batch.pk, 1)
+
+    def endpoints(self):
+        """(route, method, url, user, data, max queries) — destructive calls last."""
+        trip, booking, coupon = self.trip, self.booking, self.coupon
+        new_trip = {"title": "New Trip", "location": "Leh", "price": 20000, "duration_days": 5, "is_himalayan_trek": True}
+        new_coupon = {"code": "NEWCODE", "discount_type": "FLAT", "discount_value": "100"}
+        return [
+            ("v1/hello/", "get", "/v1/hello/", None, None, 0),
+            ("v1/home/", "get", "/v1/home/", None, None, 6),
+            ("v1/trips/", "get", "/v1/trips/?is_himalayan_trek=true&price=10k-25k,25k-50k", None, None, 6),
+            ("v1/categories/", "get", "/v1/categories/", None, None, 1),
+            ("v1/admin/categories/", "get", "/v1/admin/categories/", "admin", None, 2),
+            ("v1/admin/categories/", "post", "/v1/admin/categories/", "admin", {"name": "Snow", "slug": "snow"}, 3),
+            ("v1/trips/recommended/", "get", "/v1/trips/recommended/", "traveller", None, 2),
+            ("v1/trips/featured/", "get", "/v1/trips/featured/", None, None, 4),
+            ("v1/trips/changes/", "get", "/v1/trips/changes/?since=0", None, None, 4),
+            ("v1/trips/search/", "get", "/v1/trips/search/?q=manali esc", None, None, 3),
+            ("v1/trips/suggest/", "get", "/v1/trips/suggest/?q=ma", None, None, 3),
+            ("v1/trips/facets/", "get", "/v1/trips/facets/?price=10k-25k&is_himalayan_trek=true", None, None, 4),
+            ("v1/trips/<int:pk>/", "get", f"/v1/trips/{trip.pk}/", None, None, 4),
+            ("v1/trips/<int:pk>/similar/", "get", f"/v1/trips/{trip.pk}/similar/", None, None, 3),
+            ("v1/trips/<int:pk>/quote/", "get", f"/v1/trips/{trip.pk}/quote/?persons=2&occupancy=double&batch={self.batch.pk}&coupon={coupon.code}", "traveller", None, 5),
+            ("v1/trips/<int:pk>/view/", "post", f"/v1/trips/{trip.pk}/view/", "traveller", None, 1),
+            ("v1/auth/login/", "post", "/v1/auth/login/", None, {"username": self.traveller.username, "password": SEED_PASSWORD}, 2),
+            ("v1/auth/signup/", "post", "/v1/auth/signup/", None, {"username": "newbie", "email": "newbie@example.com", "password": "secret123"}, 4),
+            ("v1/auth/protected/", "get", "/v1/auth/protected/", "traveller", None, 0),
+            ("v1/auth/request-reset/", "post", "/v1/auth/request-reset/", None, {"email": self.admin.email}, 7),
+            ("v1/auth/verify-otp/", "post", "/v1/auth/verify-otp/", None, {"email": self.traveller.email, "otp": "123456"}, 2),
+            ("v1/auth/reset-password/", "post", "/v1/auth/reset-password/", None, {"email": self.traveller.email, "new_password": "secret123"}, 4),
+            ("v1/enquiries/", "post", "/v1/enquiries/", "traveller", {"trip": trip.pk, "name": "A", "email": "a@example.com", "phone": "1"}, 3),
+            ("v1/my-enquiries/", "get", "/v1/my-enquiries/", "traveller", None, 1),
+            ("v1/admin/enquiries/", "get", "/v1/admin/enquiries/", "admin", None, 2),
+            ("v1/admin/trips/", "get", "/v1/admin/trips/", "admin", None, 5),
+            ("v1/admin/trips/", "post", "/v1/admin/trips/", "admin", new_trip, 11),
+            ("v1/admin/trips/<int:pk>/", "put", f"/v1/admin/trips/{trip.pk}/", "admin", {**new_trip, "title": trip.title}, 12),
+            ("v1/admin/trips/<int:pk>/toggle/", "patch", f"/v1/admin/trips/{self.spare_trip.pk}/toggle/", "admin", None, 4),
+            ("v1/admin/users/", "get", "/v1/admin/users/", "admin", None, 2),
+            ("v1/admin/users/<int:pk>/role/", "patch", f"/v1/admin/users/{self.spare_user.pk}/role/", "admin", {"role": "USER"}, 4),
+            ("v1/contact/", "post", "/v1/contact/", None, {"name": "A", "email": "a@example.com", "message": "Hi"}, 1),
+            ("v1/admin/contact-messages/", "get", "/v1/admin/contact-messages/", "admin", None, 2),
+            ("v1/bookings/create/", "post", "/v1/bookings/create/", "traveller", {"trip": trip.pk, "persons": 2, "full_name": "A", "email": "a@example.com", "phone": "1", "coupon_code": coupon.code, "batch": self.batch.pk, "hold": self.hold.pk}, 12),
+            ("v1/bookings/holds/", "post", "/v1/bookings/holds/", "traveller", {"batch": self.batch.pk, "persons": 2}, 3),
+            ("v1/bookings/holds/<int:pk>/", "delete", f"/v1/bookings/holds/{self.spare_hold.pk}/", "traveller", None, 3),
+            ("v1/bookings/my/", "get", "/v1/bookings/my/", "traveller", None, 4),
+            ("v1/bookings/my/<int:pk>/", "get", f"/v1/bookings/my/{booking.pk}/", "traveller", None, 4),
+            ("v1/admin/bookings/", "get", "/v1/admin/bookings/", "admin", None, 5),
+            ("v1/admin/bookings/<int:pk>/status/", "patch", f"/v1/admin/bookings/{booking.pk}/status/", "admin", {"status": "APPROVED"}, 6),
+            ("v1/reviews/", "get", "/v1/reviews/", None, None, 1),
+            ("v1/reviews/create/", "post", "/v1/reviews/create/", None, {"name": "A", "trip": trip.title, "review": "Nice"}, 1),
+            ("v1/site-stats/", "get", "/v1/site-stats/", None, None, 1),
+            ("v1/admin/site-stats/", "get", "/v1/admin/site-stats/", "admin", None, 2),
+            ("v1/admin/site-stats/<int:pk>/", "patch", f"/v1/admin/site-stats/{self.stat.pk}/", "admin", {"value": 5}, 3),
+            ("v1/gallery/journey-frames/", "get", "/v1/gallery/journey-frames/", None, None, 4),
+            ("v1/gallery/images/", "get", "/v1/gallery/images/", None, None, 1),
+            ("v1/gallery/images/", "post", "/v1/gallery/images/", "admin", {"trip": trip.pk, "image": "https://example.com/new.jpg"}, 3),
+            ("v1/trips/good-friday/", "get", "/v1/trips/good-friday/", None, None, 4),
+            ("v1/trips/good-friday/all/", "get", "/v1/trips/good-friday/all/", None, None, 4),
+            ("v1/trips/<slug:section>/", "get", "/v1/trips/himalayan/", None, None, 2),
+            ("v1/admin/<slug:section>-config/", "get", "/v1/admin/himalayan-config/", "admin", None, 2),
+            ("v1/admin/<slug:section>-config/", "patch", "/v1/admin/himalayan-config/", "admin", {"scroll_speed": 40}, 6),
+            ("v1/coupons/validate/", "post", "/v1/coupons/validate/", "traveller", {"code": coupon.code, "trip_id": trip.pk, "booking_amount": "20000"}, 1),
+            ("v1/coupons/applicable/", "get", f"/v1/coupons/applicable/?trip_id={trip.pk}&booking_amount=20000", "traveller", None, 1),
+            ("v1/admin/coupons/", "get", "/v1/admin/coupons/", "admin", None, 2),
+            ("v1/admin/coupons/", "post", "/v1/admin/coupons/", "admin", new_coupon, 3),
+            ("v1/admin/coupons/generate/", "post", "/v1/admin/coupons/generate/", "admin", {"count": 1500, "discount_value": "10", "usage_limit": 1}, 28),
+            ("v1/admin/coupons/import/", "post", "/v1/admin/coupons/import/", "admin", {"file": SimpleUploadedFile("coupons.csv", b"code,discount_value,user\nIMPORTED1,10,\nIMPORTED2,5,%d\n" % self.traveller.pk)}, 6),
+            ("v1/admin/coupons/<int:pk>/", "get", f"/v1/admin/coupons/{coupon.pk}/", "admin", None, 2),
+            ("v1/admin/coupons/<int:pk>/", "put", f"/v1/admin/coupons/{coupon.pk}/", "admin", {**new_coupon, "code": coupon.code}, 4),
+            ("v1/admin/coupons/<int:pk>/", "delete", f"/v1/admin/coupons/{self.spare_coupon.pk}/", "admin", None, 3),
+            ("v1/gallery/images/<int:pk>/", "delete", f"/v1/gallery/images/{self.image.pk}/", "admin", None, 3),
+            ("v1/admin/contact-messages/<int:pk>/", "delete", f"/v1/admin/contact-messages/{self.message.pk}/", "admin", None, 3),
+            ("v1/admin/trips/<int:pk>/", "delete", f"/v1/admin/trips/{self.spare_trip.pk}/", "admin", None, 20),
+            ("v1/admin/users/<int:pk>/", "delete", f"/v1/admin/users/{self.spare_user.pk}/", "admin", None, 16),
+        ]
+
+    def test_every_route_has_a_budget(self):
+        routes = {str(pattern.pattern) for pattern in urlpatterns}
+        self.assertEqual(routes - {endpoint[0] for endpoint in self.endpoints()}, set())
+
+    def test_endpoints_stay_within_query_budget(self):
+        # The buffered trip view must not be flushed into another endpoint's count
+        self.addCleanup(trip_view_buffer.flush)
+        self.addCleanup(setattr, trip_view_buffer, "flush_interval", trip_view_buffer.flush_interval)
+        trip_view_buffer.flush_interval = float("inf")
+        client = APIClient()
+        users = {"admin": self.admin.pk, "traveller": self.traveller.pk}
+
+        for route, method, url, user, data, budget in self.endpoints():
+            with self.subTest(method=method, url=url):
+                cache.clear()
+                clear_local_cache()
+                # A fresh user object, so the profile lookup is counted every time
+                client.force_authenticate(User.objects.get(pk=users[user]) if user else None)
+
+                # Uploads go as multipart/form-data
+                is_upload = any(isinstance(value, SimpleUploadedFile) for value in (data or {}).values())
+                with CaptureQueriesContext(connection) as queries:
+                    response = getattr(client, method)(url, data, format="multipart" if is_upload else "json")
+
+                self.assertLess(response.status_code, 300, response.content[:500])
+                self.assertLessEqual(
+                    len(queries), budget,
+                    "\n".join(query["sql"] for query in queries.captured_queries),
+                )
@@ -0,0 +1,148 @@
+"""
+Write-coalescing buffer for trip views.
+
+record_trip_view used to update_or_create a TripView per page view — a
+SELECT plus an INSERT/UPDATE under SQLite's write lock on every request.
+Views are now counted in process instead:
+
+  - (user_id, trip_id) pairs of logged-in viewers, so repeated views of the
+    same trip coalesce into one TripView upsert,
+  - per-trip, per-hour view counts of every visitor, anonymous ones
+    included, added to TripViewCount (the trending signal).
+
+Both are written in one batch when the buffer is flushed:
+
+  - after a request finishes (request_finished, i.e. once the response has
+    gone out) if FLUSH_SIZE views are pending or the oldest pending view is
+    FLUSH_INTERVAL seconds old,
+  - inline, if the buffer holds BUFFER_LIMIT distinct entries (it never
+    grows past that),
+  - when the process exits.
+
+The flushed users' recommendations are rebuilt in the same batch, since
+bulk_create does not send the post_save the TripView receiver listens to.
+Views still buffered when the process dies are lost, which is an
+acceptable price for a recommendation signal.
+"""
+
+import atexit
+import logging
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.db import DatabaseError, connection, transaction
+from django.utils import timezone
+
+from .models import Trip, TripView, TripViewCount
+from .recommendations import build_recommendations
+
+
+logger = logging.getLogger(__name__)
+
+FLUSH_SIZE = getattr(settings, "TRIP_VIEW_FLUSH_SIZE", 100)
+FLUSH_INTERVAL = getattr(settings, "TRIP_VIEW_FLUSH_INTERVAL", 5)
+BUFFER_LIMIT = getattr(settings, "TRIP_VIEW_BUFFER_LIMIT", 10000)
+
+
+def _add_view_counts(counts):
+    """
+    Adds { (trip_id, hour): views } to TripViewCount in one statement. The
+    ORM's bulk_create(update_conflicts=True) can only overwrite a column, so
+    this is the upsert spelled out: INSERT ... ON CONFLICT DO UPDATE SET
+    count = count + excluded.count, which SQLite and PostgreSQL both accept.
+    """
+    quote = connection.ops.quote_name
+    table = quote(TripViewCount._meta.db_table)
+    sql = (
+        f"INSERT INTO {table} ({quote('trip_id')}, {quote('hour')}, {quote('count')}) VALUES (%s, %s, %s) "
+        f"ON CONFLICT ({quote('trip_id')}, {quote('hour')}) "
+        f"DO UPDATE SET {quote('count')} = {table}.{quote('count')} + excluded.{quote('count')}"
+    )
+    with connection.cursor() as cursor:
+        cursor.executemany(sql, [
+            (trip_id, connection.ops.adapt_datetimefield_value(hour), views)
+            for (trip_id, hour), views in counts.items()
+        ])
+
+
+class TripViewBuffer:
+    def __init__(self, flush_size=FLUSH_SIZE, flush_interval=FLUSH_INTERVAL, limit=BUFFER_LIMIT):
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.limit = limit
+        self._views = set()         # {(user_id, trip_id)} of logged-in viewers
+        self._counts = Counter()    # {(trip_id, hour): views}
+        self._events = 0
+        self._oldest = None
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """Views recorded since the last flush."""
+        return self._events
+
+    def record(self, user_id, trip_id):
+        """Buffers a view (user_id is None for anonymous visitors). Only writes to the DB when the buffer is full."""
+        hour = timezone.now().replace(minute=0, second=0, microsecond=0)
+        with self._lock:
+            if not self._events:
+                self._oldest = time.monotonic()
+            self._events += 1
+            self._counts[(trip_id, hour)] += 1
+            if user_id is not None:
+                self._views.add((user_id, trip_id))
+            full = len(self._views) + len(self._counts) >= self.limit
+        if full:
+            self.flush()
+
+    def is_due(self):
+        with self._lock:
+            return bool(self._events) and (
+                self._events >= self.flush_size
+                or time.monotonic() - self._oldest >= self.flush_interval
+            )
+
+    def flush_if_due(self):
+        if self.is_due():
+            self.flush()
+
+    def flush(self):
+        """
+        Writes every pending view and returns how many were written. Views of
+        trips that were deleted or deactivated meanwhile are dropped; a failed
+        write is logged and dropped rather than raised into a request.
+        """
+        with self._lock:
+            views, counts = self._views, self._counts
+            self._views, self._counts, self._events = set(), Counter(), 0
+        if not counts:
+            return 0
+
+        trip_ids = {trip_id for trip_id, _ in counts}
+        active = set(Trip.objects.filter(pk__in=trip_ids, is_active=True).values_list("pk", flat=True))
+        views = [TripView(user_id=user_id, trip_id=trip_id) for user_id, trip_id in views if trip_id in active]
+        counts = {key: n for key, n in counts.items() if key[0] in active}
+        try:
+            with transaction.atomic():
+                TripView.objects.bulk_create(
+                    views, update_conflicts=True, unique_fields=["user", "trip"], update_fields=["viewed_at"],
+                )
+                _add_view_counts(counts)
+            if views:
+                build_recommendations({view.user_id for view in views})
+        except DatabaseError:
+            logger.exception("Dropped %d buffered trip views", sum(counts.values()))
+            return 0
+        return sum(counts.values())
+
+
+trip_view_buffer = TripViewBuffer()
+
+
+def flush_trip_views_if_due(sender, **kwargs):
+    """request_finished receiver (connected in signals.py)."""
+    trip_view_buffer.flush_if_due()
+
+
+atexit.register(trip_view_buffer.flush)
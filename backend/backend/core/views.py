@@ -3,11 +3,24 @@ from rest_framework.response import Response
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework_simplejwt.tokens import RefreshToken
 
-from .models import Trip, Enquiry, ContactMessage, Booking, TripView, Review, SiteStat, InternationalSectionConfig, IndiaSectionConfig, NorthIndiaSectionConfig, HoneymoonSectionConfig, HimalayanSectionConfig, BackpackingSectionConfig, SummerSectionConfig, MonsoonSectionConfig, CommunitySectionConfig, FestivalSectionConfig, AdventureSectionConfig, BikingSectionConfig, HimachalSectionConfig, UttarakhandSectionConfig, LongWeekendSectionConfig, GirlsSectionConfig, Category, TripGalleryImage, Coupon
+from .models import Trip, TripBatch, SeatHold, Enquiry, ContactMessage, Booking, Review, SiteStat, SectionConfig, Category, TripGalleryImage, Coupon
 from .coupon_service import validate_coupon, record_coupon_usage, get_applicable_coupons
+from .coupon_bulk import generate_coupons, import_coupons_csv
+from .showcase_service import build_home_payload, build_section_payload, get_featured_trips, get_section_config
+from .sections import SECTIONS, get_section
+from .catalog_cache import catalog_cached, versioned_etag, REVIEWS_VERSION_KEY, SITE_STATS_VERSION_KEY
+from .pagination import list_response
+from .view_buffer import trip_view_buffer
+from .recommendations import TRENDING_CACHE_TIMEOUT, trending_trip_ids
+from .search import search_trip_ids
+from .suggest import get_suggestion_index
+from .facets import NEW_FACETS, facet_query, get_facet_index, parse_facet_filters
+from .pricing import quote
+from .inventory import book_seats, change_booking_status, place_hold, release_hold, release_seats, release_user_seats
 
 from .serializers import (
     TripSerializer,
+    TripCardSerializer,
     LoginSerializer,
     SignupSerializer,
     EnquirySerializer,
@@ -19,51 +32,29 @@ from .serializers import (
     BookingListSerializer,
     ReviewSerializer,
     SiteStatSerializer,
-    InternationalTripSerializer,
-    InternationalSectionConfigSerializer,
-    IndiaTripSerializer,
-    IndiaSectionConfigSerializer,
-    NorthIndiaTripSerializer,
-    NorthIndiaSectionConfigSerializer,
-    HoneymoonTripSerializer,
-    HoneymoonSectionConfigSerializer,
-    HimalayanTripSerializer,
-    HimalayanSectionConfigSerializer,
-    BackpackingTripSerializer,
-    BackpackingSectionConfigSerializer,
-    SummerTripSerializer,
-    SummerSectionConfigSerializer,
-    MonsoonTripSerializer,
-    MonsoonSectionConfigSerializer,
-    CommunityTripSerializer,
-    CommunitySectionConfigSerializer,
-    FestivalTripSerializer,
-    FestivalSectionConfigSerializer,
-    AdventureTripSerializer,
-    AdventureSectionConfigSerializer,
-    BikingTripSerializer,
-    BikingSectionConfigSerializer,
-    HimachalTripSerializer,
-    HimachalSectionConfigSerializer,
-    UttarakhandTripSerializer,
-    UttarakhandSectionConfigSerializer,
-    LongWeekendTripSerializer,
-    LongWeekendSectionConfigSerializer,
-    GirlsTripSerializer,
-    GirlsSectionConfigSerializer,
+    SectionConfigSerializer,
     CategorySerializer,
     TripGalleryImageSerializer,
     CouponSerializer,
     CouponValidateSerializer,
+    CouponBulkCreateSerializer,
+    SeatHoldSerializer,
 )
 
+from django.db import IntegrityError, transaction
+from django.core.exceptions import ValidationError
+from django.db.models import F, Q
 from django.shortcuts import get_object_or_404
 
 from django.contrib.auth.models import User
 from .serializers import UserAdminSerializer
 
+import io
 import uuid
+from datetime import date, datetime, timezone as dt_timezone
 from django.conf import settings
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 from .utils import generate_easebuzz_hash
 import razorpay
 
@@ -76,80 +67,133 @@ import string
 from .models import PasswordResetOTP
 
 @api_view(["GET"])
+@versioned_etag()
 def trip_list(request):
-    trips = Trip.objects.filter(is_active=True)
-    category_slug = request.query_params.get("category")
-    is_international = request.query_params.get("is_international")
-    is_india_trip = request.query_params.get("is_india_trip")
-    is_himalayan_trek = request.query_params.get("is_himalayan_trek")
-    is_community_trip = request.query_params.get("is_community_trip")
-    is_festival_trip = request.query_params.get("is_festival_trip")
-    is_honeymoon_trip = request.query_params.get("is_honeymoon_trip")
-    is_backpacking_trip = request.query_params.get("is_backpacking_trip")
-    is_adventure_trip = request.query_params.get("is_adventure_trip")
-    is_himachal_trip = request.query_params.get("is_himachal_trip")
-    is_uttarakhand_trip = request.query_params.get("is_uttarakhand_trip")
-    is_long_weekend_trip = request.query_params.get("is_long_weekend_trip")
-    is_girls_trip = request.query_params.get("is_girls_trip")
-    
-    if category_slug:
-        trips = trips.filter(category__slug=category_slug)
-        
-    if is_international and is_international.lower() == "true":
-        trips = trips.filter(is_international=True)
-        
-    if is_india_trip and is_india_trip.lower() == "true":
-        trips = trips.filter(is_india_trip=True)
-        
-    if is_himalayan_trek and is_himalayan_trek.lower() == "true":
-        trips = trips.filter(is_himalayan_trek=True)
-        
-    if is_community_trip and is_community_trip.lower() == "true":
-        trips = trips.filter(is_community_trip=True)
-        
-    if is_festival_trip and is_festival_trip.lower() == "true":
-        trips = trips.filter(is_festival_trip=True)
-        
-    if is_honeymoon_trip and is_honeymoon_trip.lower() == "true":
-        trips = trips.filter(is_honeymoon=True)
-        
-    if is_backpacking_trip and is_backpacking_trip.lower() == "true":
-        trips = trips.filter(is_backpacking_trip=True)
-        
-    if is_adventure_trip and is_adventure_trip.lower() == "true":
-        trips = trips.filter(is_adventure_trip=True)
-        
-    if is_himachal_trip and is_himachal_trip.lower() == "true":
-        trips = trips.filter(is_himachal_trip=True)
-        
-    if is_uttarakhand_trip and is_uttarakhand_trip.lower() == "true":
-        trips = trips.filter(is_uttarakhand_trip=True)
+    trips = TripCardSerializer.setup_eager_loading(Trip.objects.filter(is_active=True))
+    category_slugs = [slug for slug in request.query_params.get("category", "").split(",") if slug]
+
+    if category_slugs:
+        trips = trips.filter(category__slug__in=category_slugs)
+
+    # ?is_<flag>=true filters on any showcase section (see sections.py),
+    # e.g. ?is_himalayan_trek=true or the legacy ?is_honeymoon_trip=true
+    sections = []
+    for section in SECTIONS:
+        if any(request.query_params.get(param, "").lower() == "true" for param in section.filter_params):
+            trips = trips.filter(section_memberships__section=section.key)
+            sections.append(section)
+
+    # ?price=, ?duration=, ?state=, ?country=, ?month= (see facets.py)
+    filters = {
+        facet: values for facet, values in parse_facet_filters(request.query_params).items() if facet in NEW_FACETS
+    }
+    if filters:
+        trips = trips.filter(facet_query(filters))
+
+    # ?departs_from=2026-12-01&departs_to=2026-12-31: a batch starts in that
+    # range (either end optional); ?has_seats=true: ... and is not full
+    departures = {}
+    for param, lookup in (("departs_from", "start_date__gte"), ("departs_to", "start_date__lte")):
+        value = request.query_params.get(param)
+        if value:
+            try:
+                departures[lookup] = date.fromisoformat(value)
+            except ValueError:
+                return Response({"detail": f"{param} must be a YYYY-MM-DD date."}, status=400)
+    has_seats = request.query_params.get("has_seats", "").lower() == "true"
+    if departures or has_seats:
+        batches = TripBatch.objects.filter(**departures)
+        if has_seats:
+            batches = batches.filter(
+                Q(capacity__isnull=True) | Q(seats_booked__lt=F("capacity")),
+                status__in=["Available", "Filling Fast"],
+            )
+        trips = trips.filter(pk__in=batches.values("trip_id"))
 
-    if is_long_weekend_trip and is_long_weekend_trip.lower() == "true":
-        trips = trips.filter(is_long_weekend_trip=True)
+    return list_response(request, trips, TripCardSerializer, ("id",), context={"sections": sections})
 
-    if is_girls_trip and is_girls_trip.lower() == "true":
-        trips = trips.filter(is_girls_trip=True)
-        
-    serializer = TripSerializer(trips, many=True)
-    return Response(serializer.data)
+
+@api_view(["GET"])
+@permission_classes([AllowAny])
+@versioned_etag()
+def trip_search(request):
+    """
+    Full-text search over active trips (see search.py): ?q=manali trek, every
+    word matching as a prefix, best match first. ?limit= caps the results
+    (default 20, at most 50). Returns TripCardSerializer data.
+    """
+    try:
+        limit = min(max(int(request.query_params.get("limit", 20)), 1), 50)
+    except ValueError:
+        limit = 20
+
+    trip_ids = search_trip_ids(request.query_params.get("q", ""), limit)
+    if not trip_ids:
+        return Response([])
+
+    trips = TripCardSerializer.setup_eager_loading(Trip.objects.filter(pk__in=trip_ids))
+    trips = sorted(trips, key=lambda trip: trip_ids.index(trip.pk))
+    return Response(TripCardSerializer(trips, many=True).data)
+
+
+@api_view(["GET"])
+@permission_classes([AllowAny])
+@versioned_etag()
+def trip_facets(request):
+    """
+    Facet counts for the catalog filter sidebar (see facets.py). Takes the
+    same filters as trip_list and returns, for every facet value, how many
+    active trips would match with that value picked:
+    { total, facets: { price|duration|category|state|country|month|section: [{value, label, count}] } }.
+    """
+    return Response(get_facet_index().counts(parse_facet_filters(request.query_params)))
+
+
+@api_view(["GET"])
+@permission_classes([AllowAny])
+def trip_suggest(request):
+    """
+    Typeahead for the search box (see suggest.py): ?q=man returns the most
+    popular places and trip titles starting with, or with a word starting
+    with, the query — [{label, kind: location|state|country|trip, trip_id}].
+    ?limit= caps the results (default 8, at most 20).
+    """
+    try:
+        limit = min(max(int(request.query_params.get("limit", 8)), 1), 20)
+    except ValueError:
+        limit = 8
+    return Response(get_suggestion_index().suggest(request.query_params.get("q", ""), limit))
 
 
 @api_view(["GET"])
 @permission_classes([AllowAny])
+@versioned_etag(max_age=TRENDING_CACHE_TIMEOUT)
+@catalog_cached("featured", max_age=TRENDING_CACHE_TIMEOUT)
 def featured_trips(request):
-    """Return up to 3 featured trips. Falls back to latest 3 if none marked."""
-    trips = Trip.objects.filter(is_active=True, is_featured=True).order_by("-id")[:3]
-    if not trips.exists():
-        trips = Trip.objects.filter(is_active=True).order_by("-id")[:3]
-    serializer = TripSerializer(trips, many=True)
+    """
+    Return up to 3 featured trips. Falls back to the trending trips, then
+    the latest 3, if none is marked. Trending follows views, which bump no
+    version, so this and the homepage are cached for TRENDING_CACHE_TIMEOUT
+    seconds at most.
+    """
+    serializer = TripSerializer(get_featured_trips(), many=True)
     return Response(serializer.data)
 
 
+@api_view(["GET"])
+@permission_classes([AllowAny])
+@versioned_etag(max_age=TRENDING_CACHE_TIMEOUT)
+@catalog_cached("home", max_age=TRENDING_CACHE_TIMEOUT)
+def home_page(request):
+    """Return every showcase section and the featured trips in one response."""
+    return Response(build_home_payload())
+
+
 # ─── Categories ───────────────────────────────────────────────────────────────
 
 @api_view(["GET"])
 @permission_classes([AllowAny])
+@versioned_etag()
 def category_list(request):
     """Return all categories for public display."""
     categories = Category.objects.all()
@@ -179,10 +223,9 @@ def admin_categories(request):
 
 @api_view(["GET"])
 @permission_classes([AllowAny])
+@versioned_etag(REVIEWS_VERSION_KEY)
 def list_reviews(request):
-    reviews = Review.objects.all()
-    serializer = ReviewSerializer(reviews, many=True)
-    return Response(serializer.data)
+    return list_response(request, Review.objects.all(), ReviewSerializer, ("-created_at", "-id"))
 
 
 @api_view(["POST"])
@@ -195,9 +238,10 @@ def create_review(request):
     return Response(serializer.errors, status=400)
 
 @api_view(["GET"])
+@versioned_etag()
 def trip_detail(request, pk):
     try:
-        trip = Trip.objects.get(pk=pk, is_active=True)
+        trip = TripSerializer.setup_eager_loading(Trip.objects).get(pk=pk, is_active=True)
     except Trip.DoesNotExist:
         return Response(
             {"detail": "Trip not found"},
@@ -208,6 +252,46 @@ def trip_detail(request, pk):
     return Response(serializer.data)
 
 
+def _parse_since(value):
+    """?since= as an aware datetime: ISO 8601 or a Unix timestamp. None if invalid."""
+    try:
+        return datetime.fromtimestamp(float(value), tz=dt_timezone.utc)
+    except (TypeError, ValueError, OverflowError, OSError):
+        pass
+    try:
+        since = parse_datetime(value or "")
+    except ValueError:
+        return None
+    if since is not None and timezone.is_naive(since):
+        since = timezone.make_aware(since)
+    return since
+
+
+@api_view(["GET"])
+def trip_changes(request):
+    """
+    Trips created, updated or deactivated since ?since= (ISO 8601 or a Unix
+    timestamp), for incremental sync. Active trips are returned in full under
+    "updated", deactivated ones as ids under "deactivated". Pass the returned
+    "until" as the next request's since.
+    """
+    since = _parse_since(request.query_params.get("since"))
+    if since is None:
+        return Response({"detail": "since must be an ISO 8601 datetime or a Unix timestamp."}, status=400)
+
+    until = timezone.now()
+    trips = list(
+        TripSerializer.setup_eager_loading(Trip.objects.filter(updated_at__gte=since)).order_by("updated_at", "id")
+    )
+
+    return Response({
+        "since": since,
+        "until": until,
+        "updated": TripSerializer([trip for trip in trips if trip.is_active], many=True).data,
+        "deactivated": [trip.id for trip in trips if not trip.is_active],
+    })
+
+
 @api_view(["GET"])
 def hello_api(request):
     return Response({"message": "Hello from TravelSource API"})
@@ -233,8 +317,6 @@ def login_view(request):
     })
 
 
-
-
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
 def protected_test_view(request):
@@ -257,7 +339,6 @@ def signup_view(request):
     }, status=201)
 
 
-
 @api_view(["POST"])
 @permission_classes([AllowAny])
 def create_enquiry(request):
@@ -277,12 +358,11 @@ def create_enquiry(request):
     )
 
 
-
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
 def my_enquiries(request):
-    enquiries = Enquiry.objects.filter(user=request.user).order_by("-created_at")
-    serializer = UserEnquirySerializer(enquiries, many=True)
+    enquiries = UserEnquirySerializer.setup_eager_loading(Enquiry.objects.filter(user=request.user))
+    serializer = UserEnquirySerializer(enquiries.order_by("-created_at"), many=True)
     return Response(serializer.data)
 
 
@@ -295,10 +375,8 @@ def admin_enquiries(request):
             status=403
         )
 
-    enquiries = Enquiry.objects.all().order_by("-created_at")
-    serializer = AdminEnquirySerializer(enquiries, many=True)
-    return Response(serializer.data)
-
+    enquiries = AdminEnquirySerializer.setup_eager_loading(Enquiry.objects.all())
+    return list_response(request, enquiries, AdminEnquirySerializer, ("-created_at", "-id"))
 
 
 @api_view(["GET", "POST"])
@@ -308,9 +386,8 @@ def admin_trips(request):
         return Response({"detail": "Not authorized"}, status=403)
 
     if request.method == "GET":
-        trips = Trip.objects.all().order_by("-id")
-        serializer = AdminTripSerializer(trips, many=True)
-        return Response(serializer.data)
+        trips = AdminTripSerializer.setup_eager_loading(Trip.objects.all())
+        return list_response(request, trips, AdminTripSerializer, ("-id",))
 
     if request.method == "POST":
         serializer = AdminTripSerializer(data=request.data)
@@ -357,11 +434,8 @@ def admin_users(request):
     if request.user.profile.role != "ADMIN":
         return Response({"detail": "Not authorized"}, status=403)
 
-    users = User.objects.all().order_by("-date_joined")
-    serializer = UserAdminSerializer(users, many=True)
-    return Response(serializer.data)
-
-
+    users = UserAdminSerializer.setup_eager_loading(User.objects.all())
+    return list_response(request, users, UserAdminSerializer, ("-date_joined", "-id"))
 
 
 @api_view(["PATCH"])
@@ -389,8 +463,6 @@ def update_user_role(request, pk):
     return Response({"role": role})
 
 
-
-
 @api_view(["DELETE"])
 @permission_classes([IsAuthenticated])
 def delete_user(request, pk):
@@ -405,11 +477,12 @@ def delete_user(request, pk):
             status=400
         )
 
+    # Their holds and bookings go with them, and so must the seats they took
+    release_user_seats(user)
     user.delete()
     return Response({"detail": "User deleted"})
 
 
-
 @api_view(["POST"])
 def contact_us(request):
     serializer = ContactMessageSerializer(data=request.data)
@@ -430,9 +503,7 @@ def admin_contact_messages(request):
     if request.user.profile.role != "ADMIN":
         return Response({"detail": "Not authorized"}, status=403)
 
-    messages = ContactMessage.objects.all().order_by("-created_at")
-    serializer = ContactMessageSerializer(messages, many=True)
-    return Response(serializer.data)
+    return list_response(request, ContactMessage.objects.all(), ContactMessageSerializer, ("-created_at", "-id"))
 
 
 @api_view(["DELETE"])
@@ -449,89 +520,154 @@ def delete_contact_message(request, pk):
         return Response({"detail": "Message not found"}, status=404)
 
 
-
-
 @api_view(["POST"])
 @permission_classes([IsAuthenticated])
 def create_booking(request):
+    # Priced here rather than trusted from the page: total_amount and
+    # discount_amount in the request are ignored.
     try:
-        trip_id = request.data.get("trip")
-        persons = int(request.data.get("persons", 1))
+        priced = quote(
+            request.data.get("trip"),
+            request.data.get("persons", 1),
+            occupancy=request.data.get("occupancy_details", ""),
+            batch_id=request.data.get("batch"),
+            coupon_code=request.data.get("coupon_code", ""),
+            user_id=request.user.id,
+        )
+    except LookupError:
+        return Response({"error": "Trip not found"}, status=404)
+    except ValueError as e:
+        return Response({"error": str(e)}, status=400)
 
-        if persons <= 0:
-            return Response({"error": "Invalid Number of persons"}, status=400)
-        
-        trip = Trip.objects.get(id=trip_id)
+    if priced["coupon"] and not priced["coupon"]["valid"]:
+        return Response({"error": priced["coupon"]["message"]}, status=400)
 
-        coupon_code = request.data.get("coupon_code", "")
-        discount_amount = request.data.get("discount_amount", 0)
+    batch_id, persons = priced["batch"], priced["persons"]
+    booking = Booking(
+        user=request.user,
+        trip_id=priced["trip"],
+        batch_id=batch_id,
+        full_name=request.data.get("full_name"),
+        email=request.data.get("email"),
+        phone=request.data.get("phone"),
+        travel_date=request.data.get("travel_date") or None,
+        persons=persons,
+        total_amount=priced["total_amount"],
+        itinerary=request.data.get("itinerary", ""),
+        batch_details=request.data.get("batch_details", ""),
+        occupancy_details=priced["occupancy"] or request.data.get("occupancy_details", ""),
+        coupon_code=priced["coupon"]["code"] if priced["coupon"] else "",
+        discount_amount=priced["discount_amount"],
+    )
+    # Checked before any seats are taken
+    try:
+        booking.full_clean(exclude=["user", "trip", "batch"], validate_unique=False)
+    except ValidationError as e:
+        return Response({"error": "; ".join(
+            f"{field}: {' '.join(messages)}" for field, messages in e.message_dict.items()
+        )}, status=400)
 
-        # Validate total amount optionally
-        frontend_total = request.data.get("total_amount")
-        if frontend_total:
-            total_amount = float(frontend_total)
-        else:
-            total_amount = float(trip.price * persons) - float(discount_amount)
-
-        booking = Booking.objects.create(
-            user=request.user,
-            trip=trip,
-            full_name=request.data.get("full_name"),
-            email=request.data.get("email"),
-            phone=request.data.get("phone"),
-            travel_date=request.data.get("travel_date"),
-            persons=persons,
-            total_amount=total_amount,
-            itinerary=request.data.get("itinerary", ""),
-            batch_details=request.data.get("batch_details", ""),
-            occupancy_details=request.data.get("occupancy_details", ""),
-            coupon_code=coupon_code,
-            discount_amount=discount_amount
-        )
+    # A booking on a batch takes its seats first — those of the checkout's
+    # hold, if it sends one — and is turned away (409) without enough left.
+    if batch_id and not book_seats(request.user, batch_id, persons, request.data.get("hold")):
+        return Response({"error": "Not enough seats left on this batch"}, status=409)
 
-        # If booking is successful and coupon is used, record usage
-        if coupon_code:
-            try:
-                coupon = Coupon.objects.get(code__iexact=coupon_code)
-                record_coupon_usage(coupon)
-            except Coupon.DoesNotExist:
-                pass # Coupon might be invalid or deleted, but booking still succeeds
+    try:
+        with transaction.atomic():
+            booking.save()
+
+            # If booking is successful and coupon is used, record usage
+            if booking.coupon_code:
+                try:
+                    coupon = Coupon.objects.get(code__iexact=booking.coupon_code)
+                    record_coupon_usage(coupon)
+                except Coupon.DoesNotExist:
+                    pass # Coupon might be invalid or deleted, but booking still succeeds
+    except Exception:
+        # No booking, so the seats are not taken
+        if batch_id:
+            release_seats(batch_id, persons)
+        raise
+
+    serializer = BookingCreateSerializer(booking)
 
-        serializer = BookingCreateSerializer(booking)
+    return Response(serializer.data, status=201)
 
-        return Response(serializer.data, status=201)
 
-    except Trip.DoesNotExist:
+@api_view(["GET"])
+@permission_classes([AllowAny])
+def trip_quote(request, pk):
+    """
+    Prices a booking of the trip: ?persons=&occupancy=&batch=&coupon=, all
+    optional. The booking page shows this quote, and create_booking charges
+    the same numbers.
+    """
+    try:
+        priced = quote(
+            pk,
+            request.query_params.get("persons", 1),
+            occupancy=request.query_params.get("occupancy", ""),
+            batch_id=request.query_params.get("batch"),
+            coupon_code=request.query_params.get("coupon", "").strip(),
+            user_id=request.user.id,
+        )
+    except LookupError:
         return Response({"error": "Trip not found"}, status=404)
-        
-    except Exception as e:
-        return Response({"error" : str(e)}, status=404)
+    except ValueError as e:
+        return Response({"error": str(e)}, status=400)
+    return Response(priced)
+
+
+@api_view(["POST"])
+@permission_classes([IsAuthenticated])
+def create_seat_hold(request):
+    """
+    Sets `persons` seats of a batch aside for HOLD_MINUTES while the user
+    checks out; create_booking takes them over when sent the hold's id.
+    """
+    try:
+        persons = int(request.data.get("persons", 1))
+        batch = TripBatch.objects.only("id", "capacity").get(pk=request.data.get("batch"), trip__is_active=True)
+    except (TypeError, ValueError, TripBatch.DoesNotExist):
+        return Response({"error": "Batch not found"}, status=404)
+    if persons <= 0:
+        return Response({"error": "Invalid Number of persons"}, status=400)
+
+    hold = place_hold(request.user, batch.pk, persons)
+    if hold is None:
+        batch.refresh_from_db(fields=["seats_booked"])
+        return Response(
+            {"error": "Not enough seats left on this batch", "seats_left": batch.seats_left}, status=409,
+        )
+    return Response(SeatHoldSerializer(hold).data, status=201)
 
 
+@api_view(["DELETE"])
+@permission_classes([IsAuthenticated])
+def release_seat_hold(request, pk):
+    hold = get_object_or_404(SeatHold, pk=pk, user=request.user)
+    release_hold(hold)
+    return Response(status=204)
 
 
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
 def user_bookings(request):
-    bookings = Booking.objects.filter(user=request.user).order_by("-created_at")
-
-    serializer = BookingListSerializer(bookings, many=True)
-    
-    return Response(serializer.data)
+    bookings = BookingListSerializer.setup_eager_loading(Booking.objects.filter(user=request.user))
+    return list_response(request, bookings, BookingListSerializer, ("-created_at", "-id"))
 
 
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
 def user_booking_detail(request, pk):
     try:
-        booking = Booking.objects.select_related("trip").get(pk=pk, user=request.user)
+        booking = BookingListSerializer.setup_eager_loading(Booking.objects).get(pk=pk, user=request.user)
         serializer = BookingListSerializer(booking)
         return Response(serializer.data)
     except Booking.DoesNotExist:
         return Response({"error": "Booking not found or unauthorized"}, status=404)
 
 
-
     
 
 @api_view(["GET"])
@@ -540,12 +676,8 @@ def admin_bookings(request):
     if request.user.profile.role != "ADMIN":
         return Response({"error": "Unauthorized"}, status=403)
 
-    bookings = Booking.objects.select_related("trip", "user").order_by("-created_at")
-    serializer = BookingListSerializer(bookings, many=True)
-    return Response(serializer.data)
-
-
-
+    bookings = BookingListSerializer.setup_eager_loading(Booking.objects.all())
+    return list_response(request, bookings, BookingListSerializer, ("-created_at", "-id"))
 
 
 @api_view(["PATCH"])
@@ -555,14 +687,16 @@ def update_booking_status(request, pk):
         return Response({"error": "Unauthorized"}, status=403)
 
     try:
-        booking = Booking.objects.get(pk=pk)
+        booking = BookingListSerializer.setup_eager_loading(Booking.objects).get(pk=pk)
 
         new_status = request.data.get("status")
 
         if new_status not in ["APPROVED", "DECLINED"]:
             return Response({"error": "Invalid status"}, status=400)
 
-        booking.status = new_status
+        # Declining gives the booking's seats back; reinstating takes them again
+        if not change_booking_status(booking, new_status):
+            return Response({"error": "Not enough seats left on this batch"}, status=409)
         booking.admin_note = request.data.get("admin_note", "")
         booking.save()
 
@@ -621,15 +755,14 @@ def update_booking_status(request, pk):
 # ─── Personalization ─────────────────────────────────────────────────────────
 
 @api_view(["POST"])
-@permission_classes([IsAuthenticated])
+@permission_classes([AllowAny])
 def record_trip_view(request, pk):
-    """Record that the authenticated user viewed a trip."""
-    trip = get_object_or_404(Trip, pk=pk, is_active=True)
-    TripView.objects.update_or_create(
-        user=request.user,
-        trip=trip,
-        defaults={},
-    )
+    """
+    Record a trip view (buffered, see view_buffer.py). Every view counts
+    towards trending; a logged-in user's also feeds their recommendations.
+    """
+    trip = get_object_or_404(Trip.objects.only("id"), pk=pk, is_active=True)
+    trip_view_buffer.record(request.user.id if request.user.is_authenticated else None, trip.id)
     return Response({"status": "recorded"}, status=200)
 
 
@@ -637,46 +770,54 @@ def record_trip_view(request, pk):
 def recommended_trips(request):
     """
     Return up to 6 recommended trips.
-    - Logged-in users: exclude already-viewed trips, prefer similar price range.
-    - Anonymous users: accept ?exclude=1,2,3 of client-tracked IDs via query param.
-    Returns full TripSerializer data.
+    - Logged-in users: their precomputed list (see recommendations.py), one
+      indexed lookup on TripRecommendation.
+    - Anonymous users, or users nothing was computed for yet: the trending
+      trips, then other active trips, minus ?exclude=1,2,3 of client-tracked IDs.
+    Returns TripCardSerializer data.
     """
-    active_trips = Trip.objects.filter(is_active=True)
-
-    # Collect IDs to exclude
-    exclude_ids = set()
+    active_trips = TripCardSerializer.setup_eager_loading(Trip.objects.filter(is_active=True))
 
     if request.user.is_authenticated:
-        viewed_ids = list(
-            TripView.objects.filter(user=request.user)
-            .values_list("trip_id", flat=True)
+        recommended = list(
+            active_trips.filter(recommendations__user=request.user).order_by("recommendations__rank")[:6]
         )
-        exclude_ids.update(viewed_ids)
-
-        # Price-similarity boost: average price of viewed trips
-        if viewed_ids:
-            viewed_trips = active_trips.filter(pk__in=viewed_ids)
-            avg_price = sum(t.price for t in viewed_trips) / len(viewed_trips)
-            # Prefer trips within 40% of average viewed price
-            lo, hi = avg_price * 0.6, avg_price * 1.4
-            candidates = active_trips.exclude(pk__in=exclude_ids).filter(
-                price__gte=lo, price__lte=hi
-            )[:6]
-            if candidates.count() < 3:
-                # fallback: any non-viewed trip
-                candidates = active_trips.exclude(pk__in=exclude_ids)[:6]
-        else:
-            candidates = active_trips[:6]
-    else:
-        # Anonymous: use exclude query param
-        raw = request.query_params.get("exclude", "")
-        try:
-            exclude_ids = {int(x) for x in raw.split(",") if x.strip().isdigit()}
-        except ValueError:
-            exclude_ids = set()
-        candidates = active_trips.exclude(pk__in=exclude_ids)[:6]
-
-    serializer = TripSerializer(candidates, many=True)
+        if recommended:
+            return Response(TripCardSerializer(recommended, many=True).data)
+
+    # Anonymous: use exclude query param
+    raw = request.query_params.get("exclude", "")
+    try:
+        exclude_ids = {int(x) for x in raw.split(",") if x.strip().isdigit()}
+    except ValueError:
+        exclude_ids = set()
+
+    trending = [trip_id for trip_id in trending_trip_ids() if trip_id not in exclude_ids][:6]
+    candidates = sorted(active_trips.filter(pk__in=trending), key=lambda trip: trending.index(trip.pk)) if trending else []
+    if len(candidates) < 6:
+        others = active_trips.exclude(pk__in=exclude_ids | set(trending)).order_by("id")
+        candidates += others[:6 - len(candidates)]
+
+    serializer = TripCardSerializer(candidates, many=True)
+    return Response(serializer.data)
+
+
+@api_view(["GET"])
+@permission_classes([AllowAny])
+@versioned_etag()
+@catalog_cached("similar:{pk}")
+def similar_trips(request, pk):
+    """
+    "People who viewed this also viewed": up to 6 active trips from the
+    precomputed TripSimilarity neighbours of a trip (see recommendations.py).
+    """
+    if not Trip.objects.filter(pk=pk, is_active=True).exists():
+        return Response({"detail": "Trip not found"}, status=404)
+
+    trips = TripCardSerializer.setup_eager_loading(
+        Trip.objects.filter(is_active=True, similar_to__trip_id=pk)
+    ).order_by("similar_to__rank")[:6]
+    serializer = TripCardSerializer(trips, many=True)
     return Response(serializer.data)
 
 
@@ -684,6 +825,7 @@ def recommended_trips(request):
 
 @api_view(["GET"])
 @permission_classes([AllowAny])
+@versioned_etag(SITE_STATS_VERSION_KEY)
 def site_stats(request):
     """Return all site stats for public display (animated counters, etc.)."""
     stats = SiteStat.objects.all()
@@ -711,174 +853,37 @@ def admin_site_stats(request, pk=None):
     return Response(serializer.data)
 
 
-# ─── International Trips ─────────────────────────────────────────────────────
-
-@api_view(["GET"])
-@permission_classes([AllowAny])
-def international_trips(request):
-    """Return active international trips for the scrolling showcase section."""
-    config = InternationalSectionConfig.load()
-    if not config.is_enabled:
-        return Response({"config": {"is_enabled": False}, "trips": []})
-
-    trips = Trip.objects.filter(
-        is_active=True,
-        is_international=True,
-        show_in_international_section=True,
-    ).order_by("display_order", "-id")
-
-    config_serializer = InternationalSectionConfigSerializer(config)
-    trip_serializer = InternationalTripSerializer(trips, many=True)
-
-    return Response({
-        "config": config_serializer.data,
-        "trips": trip_serializer.data,
-    })
-
-
-@api_view(["GET", "PATCH"])
-@permission_classes([IsAuthenticated])
-def admin_international_config(request):
-    """Admin: get or update the international section configuration."""
-    if not hasattr(request.user, "profile") or request.user.profile.role != "ADMIN":
-        return Response({"detail": "Not authorized"}, status=403)
-
-    config = InternationalSectionConfig.load()
-
-    if request.method == "GET":
-        serializer = InternationalSectionConfigSerializer(config)
-        return Response(serializer.data)
-
-    serializer = InternationalSectionConfigSerializer(config, data=request.data, partial=True)
-    serializer.is_valid(raise_exception=True)
-    serializer.save()
-    return Response(serializer.data)
-
-
-# ─── India Trips ──────────────────────────────────────────────────────────────
-
-@api_view(["GET"])
-@permission_classes([AllowAny])
-def india_trips(request):
-    """Return active India trips for the scrolling showcase section."""
-    config = IndiaSectionConfig.load()
-    if not config.is_enabled:
-        return Response({"config": {"is_enabled": False}, "trips": []})
-
-    trips = Trip.objects.filter(
-        is_active=True,
-        is_india_trip=True,
-        show_in_india_section=True,
-    ).order_by("-india_featured_priority", "india_display_order", "-id")
-
-    config_serializer = IndiaSectionConfigSerializer(config)
-    trip_serializer = IndiaTripSerializer(trips, many=True)
-
-    return Response({
-        "config": config_serializer.data,
-        "trips": trip_serializer.data,
-    })
-
-
-@api_view(["GET", "PATCH"])
-@permission_classes([IsAuthenticated])
-def admin_india_config(request):
-    """Admin: get or update the India section configuration."""
-    if not hasattr(request.user, "profile") or request.user.profile.role != "ADMIN":
-        return Response({"detail": "Not authorized"}, status=403)
-
-    config = IndiaSectionConfig.load()
-
-    if request.method == "GET":
-        serializer = IndiaSectionConfigSerializer(config)
-        return Response(serializer.data)
-
-    serializer = IndiaSectionConfigSerializer(config, data=request.data, partial=True)
-    serializer.is_valid(raise_exception=True)
-    serializer.save()
-    return Response(serializer.data)
-
-
-# ─── North India Trips ────────────────────────────────────────────────────────
-
-@api_view(["GET"])
-@permission_classes([AllowAny])
-def girls_trips(request):
-    """Return active All Girls Group trips for the scrolling showcase section."""
-    config = GirlsSectionConfig.load()
-    if not config.is_enabled:
-        return Response({"config": {"is_enabled": False}, "trips": []})
-
-    trips = Trip.objects.filter(
-        is_active=True,
-        is_girls_trip=True,
-        show_in_girls_section=True,
-    ).order_by("-girls_featured_priority", "girls_display_order", "-id")
-
-    config_serializer = GirlsSectionConfigSerializer(config)
-    trip_serializer = GirlsTripSerializer(trips, many=True)
-
-    return Response({
-        "config": config_serializer.data,
-        "trips": trip_serializer.data,
-    })
-
-
-@api_view(["GET", "PATCH"])
-@permission_classes([IsAuthenticated])
-def admin_girls_config(request):
-    """Admin: get or update the girls section configuration."""
-    if not hasattr(request.user, "profile") or request.user.profile.role != "ADMIN":
-        return Response({"detail": "Not authorized"}, status=403)
-
-    config = GirlsSectionConfig.load()
-
-    if request.method == "GET":
-        serializer = GirlsSectionConfigSerializer(config)
-        return Response(serializer.data)
-
-    serializer = GirlsSectionConfigSerializer(config, data=request.data, partial=True)
-    serializer.is_valid(raise_exception=True)
-    serializer.save()
-    return Response(serializer.data)
+# ─── Showcase Sections ───────────────────────────────────────────────────────
 
 @api_view(["GET"])
 @permission_classes([AllowAny])
-def north_india_trips(request):
-    """Return active North India trips for the scrolling showcase section."""
-    config = NorthIndiaSectionConfig.load()
-    if not config.is_enabled:
-        return Response({"config": {"is_enabled": False}, "trips": []})
-
-    trips = Trip.objects.filter(
-        is_active=True,
-        is_north_india_trip=True,
-        show_in_north_india_section=True,
-    ).order_by("-north_india_featured_priority", "north_india_display_order", "-id")
+@versioned_etag()
+@catalog_cached("section:{section}")
+def section_trips(request, section):
+    """Return a showcase section's config and its active trips (see sections.py)."""
+    spec = get_section(section)
+    if spec is None:
+        return Response({"detail": "Section not found"}, status=404)
 
-    config_serializer = NorthIndiaSectionConfigSerializer(config)
-    trip_serializer = NorthIndiaTripSerializer(trips, many=True)
-
-    return Response({
-        "config": config_serializer.data,
-        "trips": trip_serializer.data,
-    })
+    return Response(build_section_payload(spec))
 
 
 @api_view(["GET", "PATCH"])
 @permission_classes([IsAuthenticated])
-def admin_north_india_config(request):
-    """Admin: get or update the North India section configuration."""
+def admin_section_config(request, section):
+    """Admin: get or update a showcase section's configuration."""
     if not hasattr(request.user, "profile") or request.user.profile.role != "ADMIN":
         return Response({"detail": "Not authorized"}, status=403)
 
-    config = NorthIndiaSectionConfig.load()
+    spec = get_section(section)
+    if spec is None:
+        return Response({"detail": "Section not found"}, status=404)
 
     if request.method == "GET":
-        serializer = NorthIndiaSectionConfigSerializer(config)
+        serializer = SectionConfigSerializer(get_section_config(spec))
         return Response(serializer.data)
 
-    serializer = NorthIndiaSectionConfigSerializer(config, data=request.data, partial=True)
+    serializer = SectionConfigSerializer(SectionConfig.load(spec), data=request.data, partial=True)
     serializer.is_valid(raise_exception=True)
     serializer.save()
     return Response(serializer.data)
@@ -888,12 +893,14 @@ def admin_north_india_config(request):
 
 @api_view(["GET"])
 @permission_classes([AllowAny])
+@versioned_etag()
+@catalog_cached("journey_in_frames")
 def journey_in_frames_trips(request):
     """Return trips designated to appear in the Journey in Frames section."""
-    trips = Trip.objects.filter(
+    trips = TripSerializer.setup_eager_loading(Trip.objects.filter(
         is_active=True,
         show_in_journey_in_frames=True,
-    ).order_by("journey_in_frames_order", "-id")
+    )).order_by("journey_in_frames_order", "-id")
 
     serializer = TripSerializer(trips, many=True)
     return Response(serializer.data)
@@ -942,384 +949,34 @@ def delete_trip_gallery_image(request, pk):
     return Response({"detail": "Image deleted successfully"}, status=204)
 
 
-
-# ─── Himachal Trips ─────────────────────────────────────────────────────────
-
-@api_view(["GET"])
+@api_view(['GET'])
 @permission_classes([AllowAny])
-def himachal_trips(request):
-    """Return active Himachal trips for the scrolling showcase section."""
-    config = HimachalSectionConfig.load()
-    if not config.is_enabled:
-        return Response({"config": {"is_enabled": False}, "trips": []})
-
-    trips = Trip.objects.filter(
-        is_active=True,
-        is_himachal_trip=True,
-        show_in_himachal_section=True,
-    ).order_by("-himachal_featured_priority", "himachal_display_order", "-id")
-
-    config_serializer = HimachalSectionConfigSerializer(config)
-    trip_serializer = HimachalTripSerializer(trips, many=True)
-
-    return Response({
-        "config": config_serializer.data,
-        "trips": trip_serializer.data,
-    })
-
-
-@api_view(["GET", "PATCH"])
-@permission_classes([IsAuthenticated])
-def admin_himachal_config(request):
-    """Admin: get or update the Himachal section configuration."""
-    if not hasattr(request.user, "profile") or request.user.profile.role != "ADMIN":
-        return Response({"detail": "Not authorized"}, status=403)
-
-    config = HimachalSectionConfig.load()
-
-    if request.method == "GET":
-        serializer = HimachalSectionConfigSerializer(config)
-        return Response(serializer.data)
-
-    serializer = HimachalSectionConfigSerializer(config, data=request.data, partial=True)
-    serializer.is_valid(raise_exception=True)
-    serializer.save()
+@versioned_etag()
+@catalog_cached("good_friday")
+def good_friday_trips(request):
+    """Fetch trips that are explicitly selected for the Good Friday trips showcase."""
+    trips = TripSerializer.setup_eager_loading(Trip.objects.filter(is_active=True, show_in_good_friday_section=True)).order_by('good_friday_display_order')
+    serializer = TripSerializer(trips, many=True)
     return Response(serializer.data)
 
 
-# ─── Uttarakhand Trips ──────────────────────────────────────────────────────
-
-@api_view(["GET"])
+@api_view(['GET'])
 @permission_classes([AllowAny])
-def uttarakhand_trips(request):
-    """Return active Uttarakhand trips for the scrolling showcase section."""
-    config = UttarakhandSectionConfig.load()
-    if not config.is_enabled:
-        return Response({"config": {"is_enabled": False}, "trips": []})
+@versioned_etag()
+@catalog_cached("all_good_friday")
+def all_good_friday_trips(request):
+    """Fetch all trips labeled as Good Friday trips."""
+    trips = TripSerializer.setup_eager_loading(Trip.objects.filter(is_active=True, is_good_friday_trip=True)).order_by('id')
+    serializer = TripSerializer(trips, many=True)
+    return Response(serializer.data)
 
-    trips = Trip.objects.filter(
-        is_active=True,
-        is_uttarakhand_trip=True,
-        show_in_uttarakhand_section=True,
-    ).order_by("-uttarakhand_featured_priority", "uttarakhand_display_order", "-id")
 
-    config_serializer = UttarakhandSectionConfigSerializer(config)
-    trip_serializer = UttarakhandTripSerializer(trips, many=True)
-
-    return Response({
-        "config": config_serializer.data,
-        "trips": trip_serializer.data,
-    })
-
-
-@api_view(["GET", "PATCH"])
-@permission_classes([IsAuthenticated])
-def admin_uttarakhand_config(request):
-    """Admin: get or update the Uttarakhand section configuration."""
-    if not hasattr(request.user, "profile") or request.user.profile.role != "ADMIN":
-        return Response({"detail": "Not authorized"}, status=403)
-
-    config = UttarakhandSectionConfig.load()
-
-    if request.method == "GET":
-        serializer = UttarakhandSectionConfigSerializer(config)
-        return Response(serializer.data)
-
-    serializer = UttarakhandSectionConfigSerializer(config, data=request.data, partial=True)
-    serializer.is_valid(raise_exception=True)
-    serializer.save()
-    return Response(serializer.data)
-
-
-@api_view(["GET"])
-@permission_classes([AllowAny])
-def honeymoon_trips(request):
-    """Return active Honeymoon trips for the scrolling showcase section."""
-    config = HoneymoonSectionConfig.load()
-    if not config.is_enabled:
-        return Response({"config": {"is_enabled": False}, "trips": []})
-
-    trips = Trip.objects.filter(
-        is_active=True,
-        is_honeymoon=True,
-        show_in_honeymoon_section=True,
-    ).order_by("-honeymoon_featured_priority", "honeymoon_display_order", "-id")
-
-    config_serializer = HoneymoonSectionConfigSerializer(config)
-    trip_serializer = HoneymoonTripSerializer(trips, many=True)
-
-    return Response({
-        "config": config_serializer.data,
-        "trips": trip_serializer.data,
-    })
-
-
-@api_view(["GET", "PATCH"])
-@permission_classes([IsAuthenticated])
-def admin_honeymoon_config(request):
-    """Admin: get or update the Honeymoon section configuration."""
-    if not hasattr(request.user, "profile") or request.user.profile.role != "ADMIN":
-        return Response({"detail": "Not authorized"}, status=403)
-
-    config = HoneymoonSectionConfig.load()
-
-    if request.method == "GET":
-        serializer = HoneymoonSectionConfigSerializer(config)
-        return Response(serializer.data)
-
-    serializer = HoneymoonSectionConfigSerializer(config, data=request.data, partial=True)
-    serializer.is_valid(raise_exception=True)
-    serializer.save()
-    return Response(serializer.data)
-
-
-# ─── Himalayan Treks ──────────────────────────────────────────────────────────
-
-@api_view(["GET"])
-@permission_classes([AllowAny])
-def himalayan_trips(request):
-    """Return active Himalayan Trek trips for the scrolling showcase section."""
-    config = HimalayanSectionConfig.load()
-    if not config.is_enabled:
-        return Response({"config": {"is_enabled": False}, "trips": []})
-
-    trips = Trip.objects.filter(
-        is_active=True,
-        is_himalayan_trek=True,
-        show_in_himalayan_section=True,
-    ).order_by("himalayan_display_order", "-id")
-
-    config_serializer = HimalayanSectionConfigSerializer(config)
-    trip_serializer = HimalayanTripSerializer(trips, many=True)
-
-    return Response({
-        "config": config_serializer.data,
-        "trips": trip_serializer.data,
-    })
-
-
-@api_view(["GET", "PATCH"])
-@permission_classes([IsAuthenticated])
-def admin_himalayan_config(request):
-    """Admin: get or update the Himalayan section configuration."""
-    if not hasattr(request.user, "profile") or request.user.profile.role != "ADMIN":
-        return Response({"detail": "Not authorized"}, status=403)
-
-    config = HimalayanSectionConfig.load()
-
-    if request.method == "GET":
-        serializer = HimalayanSectionConfigSerializer(config)
-        return Response(serializer.data)
-
-    serializer = HimalayanSectionConfigSerializer(config, data=request.data, partial=True)
-    serializer.is_valid(raise_exception=True)
-    serializer.save()
-    return Response(serializer.data)
-
-
-# ─── Backpacking Trips ────────────────────────────────────────────────────────
-
-@api_view(["GET"])
-@permission_classes([AllowAny])
-def backpacking_trips(request):
-    """Return active Backpacking trips for the scrolling showcase section."""
-    config = BackpackingSectionConfig.load()
-    if not config.is_enabled:
-        return Response({"config": {"is_enabled": False}, "trips": []})
-
-    trips = Trip.objects.filter(
-        is_active=True,
-        is_backpacking_trip=True,
-        show_in_backpacking_section=True,
-    ).order_by("-backpacking_featured_priority", "backpacking_display_order", "-id")
-
-    config_serializer = BackpackingSectionConfigSerializer(config)
-    trip_serializer = BackpackingTripSerializer(trips, many=True)
-
-    return Response({
-        "config": config_serializer.data,
-        "trips": trip_serializer.data,
-    })
-@api_view(["GET", "PATCH"])
-@permission_classes([IsAuthenticated])
-def admin_backpacking_config(request):
-    """Admin: get or update the Backpacking section configuration."""
-    if not hasattr(request.user, "profile") or request.user.profile.role != "ADMIN":
-        return Response({"detail": "Not authorized"}, status=403)
-
-    config = BackpackingSectionConfig.load()
-
-    if request.method == "GET":
-        serializer = BackpackingSectionConfigSerializer(config)
-        return Response(serializer.data)
-
-    serializer = BackpackingSectionConfigSerializer(config, data=request.data, partial=True)
-    serializer.is_valid(raise_exception=True)
-    serializer.save()
-    return Response(serializer.data)
-
-
-
-
-# ─── Summer Treks ─────────────────────────────────────────────────────────────
-
-@api_view(["GET"])
-@permission_classes([AllowAny])
-def summer_trips(request):
-    """Return active Summer Trek trips for the scrolling showcase section."""
-    config = SummerSectionConfig.load()
-    if not config.is_enabled:
-        return Response({"config": {"is_enabled": False}, "trips": []})
-
-    trips = Trip.objects.filter(
-        is_active=True,
-        is_summer_trek=True,
-        show_in_summer_section=True,
-    ).order_by("-summer_featured_priority", "summer_display_order", "-id")
-
-    config_serializer = SummerSectionConfigSerializer(config)
-    trip_serializer = SummerTripSerializer(trips, many=True)
-
-    return Response({
-        "config": config_serializer.data,
-        "trips": trip_serializer.data,
-    })
-
-
-@api_view(["GET", "PATCH"])
-@permission_classes([IsAuthenticated])
-def admin_summer_config(request):
-    """Admin: get or update the Summer section configuration."""
-    if not hasattr(request.user, "profile") or request.user.profile.role != "ADMIN":
-        return Response({"detail": "Not authorized"}, status=403)
-
-    config = SummerSectionConfig.load()
-
-    if request.method == "GET":
-        serializer = SummerSectionConfigSerializer(config)
-        return Response(serializer.data)
-
-    serializer = SummerSectionConfigSerializer(config, data=request.data, partial=True)
-    serializer.is_valid(raise_exception=True)
-    serializer.save()
-    return Response(serializer.data)
-
-
-# ─── Monsoon Treks ────────────────────────────────────────────────────────────
-
-@api_view(["GET"])
-def monsoon_trips(request):
-    """Fetch the configuration and active trips for the Monsoon section."""
-    config = MonsoonSectionConfig.load()
-    trips = Trip.objects.filter(
-        is_active=True,
-        is_monsoon_trek=True,
-        show_in_monsoon_section=True,
-    ).order_by("-monsoon_featured_priority", "monsoon_display_order", "-id")
-
-    config_serializer = MonsoonSectionConfigSerializer(config)
-    trip_serializer = MonsoonTripSerializer(trips, many=True)
-
-    return Response({
-        "config": config_serializer.data,
-        "trips": trip_serializer.data,
-    })
-
-
-@api_view(["GET", "PATCH"])
-@permission_classes([IsAuthenticated])
-def admin_monsoon_config(request):
-    """Admin: get or update the Monsoon section configuration."""
-    if not hasattr(request.user, "profile") or request.user.profile.role != "ADMIN":
-        return Response({"detail": "Not authorized"}, status=403)
-
-    config = MonsoonSectionConfig.load()
-
-    if request.method == "GET":
-        serializer = MonsoonSectionConfigSerializer(config)
-        return Response(serializer.data)
-
-    serializer = MonsoonSectionConfigSerializer(config, data=request.data, partial=True)
-    serializer.is_valid(raise_exception=True)
-    serializer.save()
-    return Response(serializer.data)
-
-
-# ─── Community Trips ─────────────────────────────────────────────────────────
-
-@api_view(["GET"])
-@permission_classes([AllowAny])
-def community_trips(request):
-    """Return active Community trips for the scrolling showcase section."""
-    config = CommunitySectionConfig.load()
-    if not config.is_enabled:
-        return Response({"config": {"is_enabled": False}, "trips": []})
-
-    trips = Trip.objects.filter(
-        is_active=True,
-        is_community_trip=True,
-        show_in_community_section=True,
-    ).order_by("community_display_order", "-id")
-
-    config_serializer = CommunitySectionConfigSerializer(config)
-    trip_serializer = CommunityTripSerializer(trips, many=True)
-
-    return Response({
-        "config": config_serializer.data,
-        "trips": trip_serializer.data,
-    })
-
-
-@api_view(["GET", "PATCH"])
-@permission_classes([IsAuthenticated])
-def admin_community_config(request):
-    """Admin: get or update the Community section configuration."""
-    if not hasattr(request.user, "profile") or request.user.profile.role != "ADMIN":
-        return Response({"detail": "Not authorized"}, status=403)
-
-    config = CommunitySectionConfig.load()
-
-    if request.method == "GET":
-        serializer = CommunitySectionConfigSerializer(config)
-        return Response(serializer.data)
-
-    serializer = CommunitySectionConfigSerializer(config, data=request.data, partial=True)
-    serializer.is_valid(raise_exception=True)
-    serializer.save()
-    return Response(serializer.data)
-
-
-
-
-
-
-
-@api_view(['GET'])
-@permission_classes([AllowAny])
-def good_friday_trips(request):
-    """Fetch trips that are explicitly selected for the Good Friday trips showcase."""
-    trips = Trip.objects.filter(is_active=True, show_in_good_friday_section=True).order_by('good_friday_display_order')
-    serializer = TripSerializer(trips, many=True)
-    return Response(serializer.data)
-
-
-@api_view(['GET'])
-@permission_classes([AllowAny])
-def all_good_friday_trips(request):
-    """Fetch all trips labeled as Good Friday trips."""
-    trips = Trip.objects.filter(is_active=True, is_good_friday_trip=True).order_by('id')
-    serializer = TripSerializer(trips, many=True)
-    return Response(serializer.data)
-
-
-
-
-@api_view(["POST"])
-@permission_classes([AllowAny])
-def request_password_reset(request):
-    email = request.data.get("email")
-    if not email:
-        return Response({"error": "Email is required"}, status=400)
+@api_view(["POST"])
+@permission_classes([AllowAny])
+def request_password_reset(request):
+    email = request.data.get("email")
+    if not email:
+        return Response({"error": "Email is required"}, status=400)
 
     try:
         user = User.objects.get(email=email)
@@ -1415,161 +1072,6 @@ def reset_password(request):
     except (PasswordResetOTP.DoesNotExist, User.DoesNotExist):
         return Response({"error": "Invalid request"}, status=400)
 
-# ─── Festival Section ───────────────────────────────────────────────────────
-
-@api_view(["GET"])
-@permission_classes([AllowAny])
-def festival_trips(request):
-    """Public: return festival section config and its active trips."""
-    config = FestivalSectionConfig.load()
-    trips = Trip.objects.filter(
-        is_active=True,
-        is_festival_trip=True,
-        show_in_festival_section=True
-    ).order_by("-festival_featured_priority", "festival_display_order", "-id")
-    
-    return Response({
-        "config": FestivalSectionConfigSerializer(config).data,
-        "trips": FestivalTripSerializer(trips, many=True).data
-    })
-
-
-@api_view(["GET", "PATCH"])
-@permission_classes([IsAuthenticated])
-def admin_festival_config(request):
-    """Admin: get or update festival section configuration."""
-    if not hasattr(request.user, "profile") or request.user.profile.role != "ADMIN":
-        return Response({"detail": "Not authorized"}, status=403)
-        
-    config = FestivalSectionConfig.load()
-    if request.method == "GET":
-        return Response(FestivalSectionConfigSerializer(config).data)
-    
-    # PATCH
-    serializer = FestivalSectionConfigSerializer(config, data=request.data, partial=True)
-    serializer.is_valid(raise_exception=True)
-    serializer.save()
-    return Response(serializer.data)
-
-
-# ─── Adventure Section ───────────────────────────────────────────────────────
-
-@api_view(["GET"])
-@permission_classes([AllowAny])
-def adventure_trips(request):
-    """Public: return adventure section config and its active trips."""
-    config = AdventureSectionConfig.load()
-    trips = Trip.objects.filter(
-        is_active=True,
-        is_adventure_trip=True,
-        show_in_adventure_section=True
-    ).order_by("adventure_display_order")
-    
-    return Response({
-        "config": AdventureSectionConfigSerializer(config).data,
-        "trips": AdventureTripSerializer(trips, many=True).data
-    })
-
-
-@api_view(["GET", "PATCH"])
-@permission_classes([IsAuthenticated])
-def admin_adventure_config(request):
-    """Admin: get or update adventure section configuration."""
-    if not hasattr(request.user, "profile") or request.user.profile.role != "ADMIN":
-        return Response({"detail": "Not authorized"}, status=403)
-        
-    config = AdventureSectionConfig.load()
-    if request.method == "GET":
-        return Response(AdventureSectionConfigSerializer(config).data)
-    
-    # PATCH
-    serializer = AdventureSectionConfigSerializer(config, data=request.data, partial=True)
-    serializer.is_valid(raise_exception=True)
-    serializer.save()
-    return Response(serializer.data)
-
-
-# ─── Biking Section ───────────────────────────────────────────────────────────
-
-@api_view(["GET"])
-@permission_classes([AllowAny])
-def biking_trips(request):
-    """Public: return biking section config and its active trips."""
-    config = BikingSectionConfig.load()
-    trips = Trip.objects.filter(
-        is_active=True,
-        is_biking_trip=True,
-        show_in_biking_section=True
-    ).order_by("-biking_featured_priority", "biking_display_order", "-id")
-    
-    return Response({
-        "config": BikingSectionConfigSerializer(config).data,
-        "trips": BikingTripSerializer(trips, many=True).data
-    })
-
-
-@api_view(["GET", "PATCH"])
-@permission_classes([IsAuthenticated])
-def admin_biking_config(request):
-    """Admin: get or update biking section configuration."""
-    if not hasattr(request.user, "profile") or request.user.profile.role != "ADMIN":
-        return Response({"detail": "Not authorized"}, status=403)
-        
-    config = BikingSectionConfig.load()
-    if request.method == "GET":
-        return Response(BikingSectionConfigSerializer(config).data)
-    
-    # PATCH
-    serializer = BikingSectionConfigSerializer(config, data=request.data, partial=True)
-    serializer.is_valid(raise_exception=True)
-    serializer.save()
-    return Response(serializer.data)
-
-
-# ─── Long Weekend Section ───────────────────────────────────────────────────────────
-
-@api_view(["GET"])
-@permission_classes([AllowAny])
-def long_weekend_trips(request):
-    """Return active long weekend trips for the scrolling showcase section."""
-    config = LongWeekendSectionConfig.load()
-    if not config.is_enabled:
-        return Response({"config": {"is_enabled": False}, "trips": []})
-
-    trips = Trip.objects.filter(
-        is_active=True,
-        is_long_weekend_trip=True,
-        show_in_long_weekend_section=True,
-    ).order_by("-long_weekend_featured_priority", "long_weekend_display_order", "-id")
-
-    config_serializer = LongWeekendSectionConfigSerializer(config)
-    trip_serializer = LongWeekendTripSerializer(trips, many=True)
-
-    return Response({
-        "config": config_serializer.data,
-        "trips": trip_serializer.data,
-    })
-
-
-@api_view(["GET", "PATCH"])
-@permission_classes([IsAuthenticated])
-def admin_long_weekend_config(request):
-    """Admin: get or update the Long Weekend section configuration."""
-    if not hasattr(request.user, "profile") or request.user.profile.role != "ADMIN":
-        return Response({"detail": "Not authorized"}, status=403)
-
-    config = LongWeekendSectionConfig.load()
-
-    if request.method == "GET":
-        serializer = LongWeekendSectionConfigSerializer(config)
-        return Response(serializer.data)
-
-    serializer = LongWeekendSectionConfigSerializer(config, data=request.data, partial=True)
-    serializer.is_valid(raise_exception=True)
-    serializer.save()
-    return Response(serializer.data)
-
-
 # ─── Coupons ──────────────────────────────────────────────────────────────────
 
 @api_view(["POST"])
@@ -1616,6 +1118,43 @@ def admin_coupons(request):
     serializer.save()
     return Response(serializer.data, status=201)
 
+@api_view(["POST"])
+@permission_classes([IsAuthenticated])
+def admin_coupons_generate(request):
+    """
+    Admin: create a batch of coupons with new random codes — `count` of them,
+    or one for each of `user_ids` — and return the codes.
+    """
+    if not hasattr(request.user, "profile") or request.user.profile.role != "ADMIN":
+        return Response({"detail": "Not authorized"}, status=403)
+
+    serializer = CouponBulkCreateSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+    try:
+        codes = generate_coupons(**serializer.validated_data)
+    except ValueError as e:
+        return Response({"detail": str(e)}, status=400)
+    except IntegrityError:
+        return Response({"detail": "Coupons with the same codes were created meanwhile. Please try again."}, status=409)
+    return Response({"created": len(codes), "codes": codes}, status=201)
+
+@api_view(["POST"])
+@permission_classes([IsAuthenticated])
+def admin_coupons_import(request):
+    """Admin: create the coupons of an uploaded CSV (multipart field `file`, columns in coupon_bulk.IMPORT_COLUMNS)."""
+    if not hasattr(request.user, "profile") or request.user.profile.role != "ADMIN":
+        return Response({"detail": "Not authorized"}, status=403)
+
+    upload = request.FILES.get("file")
+    if upload is None:
+        return Response({"detail": "A CSV file is required."}, status=400)
+    try:
+        # Decoded as it is read, so a large upload is never all in memory
+        created = import_coupons_csv(io.TextIOWrapper(upload.file, encoding="utf-8-sig", newline=""))
+    except ValueError as e:  # Including UnicodeDecodeError
+        return Response({"detail": str(e)}, status=400)
+    return Response({"created": created}, status=201)
+
 @api_view(["GET", "PUT", "DELETE"])
 @permission_classes([IsAuthenticated])
 def admin_coupon_detail(request, pk):
@@ -4,11 +4,12 @@ import django
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
 django.setup()
 
-from core.models import Trip, FestivalSectionConfig
+from core.models import Trip, TripSection, SectionConfig
+from core.sections import get_section
 
 def seed_festival_data():
     # 1. Ensure Config exists
-    config = FestivalSectionConfig.load()
+    config = SectionConfig.load(get_section("festival"))
     config.is_enabled = True
     config.title = "Sparkling Festival Getaways"
     config.subtitle = "Exclusive festive packages for a magical season of celebration."
@@ -21,10 +22,10 @@ def seed_festival_data():
     for i, title in enumerate(trip_titles):
         try:
             trip = Trip.objects.get(title=title)
-            trip.is_festival_trip = True
-            trip.show_in_festival_section = True
-            trip.festival_display_order = i + 1
-            trip.save()
+            TripSection.objects.update_or_create(
+                trip=trip, section="festival",
+                defaults={"visible": True, "display_order": i + 1},
+            )
             print(f"Updated trip: {title}")
         except Trip.DoesNotExist:
             print(f"Trip not found: {title}")
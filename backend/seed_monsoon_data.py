@@ -7,11 +7,12 @@ sys.path.append(os.getcwd())
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "backend.settings")
 django.setup()
 
-from core.models import Trip, MonsoonSectionConfig
+from core.models import Trip, TripSection, SectionConfig
+from core.sections import get_section
 
 def seed_monsoon_data():
     # Setup Monsoon Config
-    config = MonsoonSectionConfig.load()
+    config = SectionConfig.load(get_section("monsoon"))
     config.is_enabled = True
     config.title = "Emerald Monsoon Escapes"
     config.subtitle = "Witness nature's rebirth in the misty mountains"
@@ -29,18 +30,17 @@ def seed_monsoon_data():
             "description": "Experience the world-renowned Valley of Flowers in full bloom during the peak monsoon. A UNESCO World Heritage site known for its diverse alpine flora and breathtaking mist-covered meadows.",
             "short_description": "A botanical paradise in the heart of the Himalayas.",
             "image": "https://images.unsplash.com/photo-1589131602758-df598b046830?q=80&w=1200",
-            "is_monsoon_trek": True,
-            "show_in_monsoon_section": True,
-            "monsoon_display_order": 1,
             "is_active": True
         }
     )
     if not created:
-        trip.is_monsoon_trek = True
-        trip.show_in_monsoon_section = True
         trip.is_active = True
         trip.save()
-    
+
+    membership, _ = TripSection.objects.get_or_create(trip=trip, section="monsoon", defaults={"display_order": 1})
+    membership.visible = True
+    membership.save()
+
     print(f"Monsoon Trip '{trip.title}' Seeded.")
 
 if __name__ == "__main__":
@@ -1,8 +1,9 @@
-from core.models import Trip, MonsoonSectionConfig, Category
+from core.models import Trip, TripSection, SectionConfig, Category
+from core.sections import get_section
 
 def seed():
     # Setup Monsoon Config
-    config, _ = MonsoonSectionConfig.objects.get_or_create(pk=1)
+    config = SectionConfig.load(get_section("monsoon"))
     config.is_enabled = True
     config.title = "Emerald Monsoon Escapes"
     config.subtitle = "Witness nature's rebirth in the misty mountains"
@@ -36,22 +37,21 @@ def seed():
             "short_description": "A botanical paradise in the heart of the Himalayas.",
             "image": "https://images.unsplash.com/photo-1589131602758-df598b046830?q=80&w=1200",
             "category": category,
-            "is_monsoon_trek": True,
-            "show_in_monsoon_section": True,
-            "monsoon_display_order": 1,
             "is_active": True
         }
     )
     if not created:
         trip.category = category
-        trip.is_monsoon_trek = True
-        trip.show_in_monsoon_section = True
         trip.is_active = True
         trip.save()
         print(f"Monsoon Trip '{trip.title}' updated.")
     else:
         print(f"Monsoon Trip '{trip.title}' created.")
 
+    membership, _ = TripSection.objects.get_or_create(trip=trip, section="monsoon", defaults={"display_order": 1})
+    membership.visible = True
+    membership.save()
+
     print("Seeding completed successfully.")
 
 seed()
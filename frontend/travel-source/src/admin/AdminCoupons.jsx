@@ -1,5 +1,5 @@
-import { useState, useEffect } from "react";
-import { fetchAdminCoupons, createAdminCoupon, updateAdminCoupon, deleteAdminCoupon } from "../services/api";
+import { useState, useEffect, useRef } from "react";
+import { fetchAdminCoupons, createAdminCoupon, updateAdminCoupon, deleteAdminCoupon, importAdminCouponsCsv } from "../services/api";
 import styles from "./AdminCoupons.module.css";
 
 const AdminCoupons = () => {
@@ -9,6 +9,8 @@ const AdminCoupons = () => {
   
   const [isModalOpen, setIsModalOpen] = useState(false);
   const [editingCoupon, setEditingCoupon] = useState(null);
+  const [importing, setImporting] = useState(false);
+  const importInput = useRef(null);
   
   const [formData, setFormData] = useState({
     code: "",
@@ -114,6 +116,22 @@ const AdminCoupons = () => {
     }
   };
 
+  const handleImport = async (e) => {
+    const file = e.target.files[0];
+    e.target.value = "";
+    if (!file) return;
+    try {
+      setImporting(true);
+      const { created } = await importAdminCouponsCsv(file);
+      alert(`Imported ${created} coupons.`);
+      loadCoupons();
+    } catch (err) {
+      alert(err.message || "Import failed.");
+    } finally {
+      setImporting(false);
+    }
+  };
+
   if (loading) return <div className={styles.loading}>Loading Coupons...</div>;
   if (error) return <div className={styles.error}>{error}</div>;
 
@@ -121,9 +139,15 @@ const AdminCoupons = () => {
     <div className={styles.container}>
       <div className={styles.header}>
         <h1 className={styles.title}>Coupons Management</h1>
-        <button onClick={() => handleOpenModal()} className={styles.createBtn}>
-          + Create New Coupon
-        </button>
+        <div className={styles.headerActions}>
+          <input ref={importInput} type="file" accept=".csv,text/csv" onChange={handleImport} hidden />
+          <button onClick={() => importInput.current.click()} className={styles.importBtn} disabled={importing}>
+            {importing ? "Importing..." : "Import CSV"}
+          </button>
+          <button onClick={() => handleOpenModal()} className={styles.createBtn}>
+            + Create New Coupon
+          </button>
+        </div>
       </div>
 
       <div className={styles.tableWrapper}>
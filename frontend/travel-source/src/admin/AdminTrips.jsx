@@ -2561,11 +2561,11 @@ const AdminTrips = () => {
                 </h3>
                 <div className={styles.inputGroup}>
                   <p style={{ fontSize: "0.85rem", color: "#64748b", marginBottom: "12px" }}>
-                    Add trip batches indicating start/end dates and availability status. Will show up dynamically below the pricing section on detailed pages.
+                    Add trip batches indicating start/end dates, availability status and seats on offer (leave empty for no limit). Will show up dynamically below the pricing section on detailed pages.
                   </p>
                   <div className={styles.dynamicListSimple}>
                     {batches.map((batch, idx) => (
-                      <div key={idx} style={{ marginBottom: "12px", padding: "12px", background: "#f8fafc", borderRadius: "10px", border: "1px solid #e2e8f0", display: "grid", gridTemplateColumns: "1fr 1fr 1fr auto", gap: "10px", alignItems: "center" }}>
+                      <div key={idx} style={{ marginBottom: "12px", padding: "12px", background: "#f8fafc", borderRadius: "10px", border: "1px solid #e2e8f0", display: "grid", gridTemplateColumns: "1fr 1fr 1fr 1fr auto", gap: "10px", alignItems: "center" }}>
                         <div>
                           <label style={{ fontSize: "0.75rem", color: "#64748b", display: "block", marginBottom: "4px" }}>Start Date</label>
                           <input
@@ -2608,6 +2608,23 @@ const AdminTrips = () => {
                             <option value="Full">Full</option>
                           </select>
                         </div>
+                        <div>
+                          <label style={{ fontSize: "0.75rem", color: "#64748b", display: "block", marginBottom: "4px" }}>
+                            Seats{batch.seatsBooked ? ` (${batch.seatsBooked} booked)` : ""}
+                          </label>
+                          <input
+                            type="number"
+                            min="0"
+                            placeholder="Unlimited"
+                            className={styles.input}
+                            value={batch.capacity ?? ""}
+                            onChange={(e) => {
+                              const updated = [...batches];
+                              updated[idx] = { ...updated[idx], capacity: e.target.value === "" ? null : Number(e.target.value) };
+                              setBatches(updated);
+                            }}
+                          />
+                        </div>
                         <button
                           type="button"
                           className={styles.removeButtonSmall}
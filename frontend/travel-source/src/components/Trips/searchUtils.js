@@ -80,39 +80,30 @@ export const getTokenVariants = (token) => {
   return Array.from(variants).filter(Boolean);
 };
 
+// Search tags per showcase section key (see trip.sections in the catalog API)
+const SECTION_SEARCH_TAGS = {
+  international: ["international", "abroad", "global"],
+  india: ["india", "domestic", "indian"],
+  honeymoon: ["honeymoon", "romantic", "couple"],
+  himalayan: ["himalayan", "trek", "mountain"],
+  backpacking: ["backpacking", "backpacker", "budget"],
+  summer: ["summer", "summer trek"],
+  monsoon: ["monsoon", "rain", "rainy"],
+  community: ["community", "group", "social"],
+  festival: ["festival", "festive", "celebration"],
+  adventure: ["adventure", "thrilling", "action"],
+};
+
+const inSection = (trip, section) => (trip.sections || []).includes(section);
+
 export const buildTripSearchBlob = (trip) => {
   const tags = [];
 
-  if (trip.is_international || trip.show_in_international_section) {
-    tags.push("international", "abroad", "global");
-  }
-  if (trip.is_india_trip || trip.show_in_india_section) {
-    tags.push("india", "domestic", "indian");
-  }
-  if (trip.is_honeymoon || trip.show_in_honeymoon_section) {
-    tags.push("honeymoon", "romantic", "couple");
-  }
-  if (trip.is_himalayan_trek || trip.show_in_himalayan_section) {
-    tags.push("himalayan", "trek", "mountain");
-  }
-  if (trip.is_backpacking_trip || trip.show_in_backpacking_section) {
-    tags.push("backpacking", "backpacker", "budget");
-  }
-  if (trip.is_summer_trek || trip.show_in_summer_section) {
-    tags.push("summer", "summer trek");
-  }
-  if (trip.is_monsoon_trek || trip.show_in_monsoon_section) {
-    tags.push("monsoon", "rain", "rainy");
-  }
-  if (trip.is_community_trip || trip.show_in_community_section) {
-    tags.push("community", "group", "social");
-  }
-  if (trip.is_festival_trip || trip.show_in_festival_section) {
-    tags.push("festival", "festive", "celebration");
-  }
-  if (trip.is_adventure_trip || trip.show_in_adventure_section) {
-    tags.push("adventure", "thrilling", "action");
-  }
+  Object.entries(SECTION_SEARCH_TAGS).forEach(([section, sectionTags]) => {
+    if (inSection(trip, section)) {
+      tags.push(...sectionTags);
+    }
+  });
 
   return normalizeSearchText(
     [
@@ -132,28 +123,8 @@ export const buildTripSearchBlob = (trip) => {
 };
 
 export const tripMatchesType = (trip, typeFilter, searchBlob) => {
-  switch (typeFilter) {
-    case "international":
-      return trip.is_international || trip.show_in_international_section;
-    case "india":
-      return trip.is_india_trip || trip.show_in_india_section;
-    case "honeymoon":
-      return trip.is_honeymoon || trip.show_in_honeymoon_section;
-    case "himalayan":
-      return trip.is_himalayan_trek || trip.show_in_himalayan_section;
-    case "backpacking":
-      return trip.is_backpacking_trip || trip.show_in_backpacking_section;
-    case "summer":
-      return trip.is_summer_trek || trip.show_in_summer_section;
-    case "monsoon":
-      return trip.is_monsoon_trek || trip.show_in_monsoon_section;
-    case "community":
-      return trip.is_community_trip || trip.show_in_community_section;
-    case "festival":
-      return trip.is_festival_trip || trip.show_in_festival_section;
-    case "adventure":
-      return trip.is_adventure_trip || trip.show_in_adventure_section;
-    default:
-      return searchBlob.includes(typeFilter);
+  if (Object.hasOwn(SECTION_SEARCH_TAGS, typeFilter)) {
+    return inSection(trip, typeFilter);
   }
+  return searchBlob.includes(typeFilter);
 };
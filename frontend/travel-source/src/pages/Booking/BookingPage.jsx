@@ -1,6 +1,14 @@
 import { useEffect, useState, useMemo } from "react";
 import { useParams, useNavigate } from "react-router-dom";
-import { fetchTripDetail, createBooking, validateCoupon, fetchApplicableCoupons } from "../../services/api";
+import {
+  fetchTripDetail,
+  createBooking,
+  createSeatHold,
+  releaseSeatHold,
+  fetchTripQuote,
+  validateCoupon,
+  fetchApplicableCoupons,
+} from "../../services/api";
 import { getAuthData } from "../../utils/auth";
 import styles from "./BookingPage.module.css";
 
@@ -52,6 +60,10 @@ const BookingPage = () => {
   const [bestCoupon, setBestCoupon] = useState(null);
   const [showCouponList, setShowCouponList] = useState(false);
 
+  // Seats of the selected batch held while the form is filled in
+  const [hold, setHold] = useState(null);
+  const [holdError, setHoldError] = useState("");
+
   useEffect(() => {
     const auth = getAuthData();
     if (!auth) {
@@ -114,6 +126,39 @@ const BookingPage = () => {
     return processedBatches.filter((b) => b.startMonth === selectedMonth);
   }, [processedBatches, selectedMonth]);
 
+  // Hold seats on the selected batch, again whenever the batch or the
+  // number of persons changes; the booking takes the hold over.
+  const selectedBatchId = processedBatches[selectedBatchIdx]?.id;
+
+  useEffect(() => {
+    if (!selectedBatchId) return;
+    let cancelled = false;
+    let placed = null;
+
+    const timer = setTimeout(async () => {
+      try {
+        placed = await createSeatHold(selectedBatchId, formData.persons);
+        if (cancelled) {
+          releaseSeatHold(placed.id);
+          return;
+        }
+        setHold(placed);
+        setHoldError("");
+      } catch (err) {
+        if (!cancelled) {
+          setHold(null);
+          setHoldError(err.message);
+        }
+      }
+    }, 500);
+
+    return () => {
+      cancelled = true;
+      clearTimeout(timer);
+      if (placed) releaseSeatHold(placed.id);
+    };
+  }, [selectedBatchId, formData.persons]);
+
   // Pricing Options Processing
   const priceOptions = useMemo(() => {
     if (!trip) return [];
@@ -124,15 +169,31 @@ const BookingPage = () => {
 
   const currentOption = priceOptions[selectedOccupancyIndex] || priceOptions[0];
 
-  // Calculations
-  const basePrice = currentOption?.price || 0;
-  const amount = basePrice * formData.persons;
-  const gst = amount * 0.05; // 5% GST
-  let grandTotal = amount + gst;
-  
-  // Apply coupon discount if any
-  const discountAmount = couponResult?.discount_amount || 0;
-  grandTotal = Math.max(0, grandTotal - discountAmount);
+  // Priced by the server: the quote is what the booking will be charged
+  const [quote, setQuote] = useState(null);
+  const appliedCoupon = couponResult?.valid ? couponCode.trim() : "";
+
+  useEffect(() => {
+    if (!trip) return;
+    let cancelled = false;
+    fetchTripQuote(trip.id, {
+      persons: formData.persons,
+      occupancy: currentOption?.occupancy || "",
+      coupon: appliedCoupon,
+    })
+      .then((data) => {
+        if (!cancelled) setQuote(data);
+      })
+      .catch(() => {});
+    return () => {
+      cancelled = true;
+    };
+  }, [trip, formData.persons, currentOption?.occupancy, appliedCoupon]);
+
+  const amount = quote?.amount || 0;
+  const gst = quote?.gst || 0;
+  const discountAmount = quote?.discount_amount || 0;
+  const grandTotal = quote?.total_amount || 0;
 
   const formatPrice = (price) => {
     return new Intl.NumberFormat("en-IN", {
@@ -226,21 +287,21 @@ const BookingPage = () => {
         email: formData.email,
         phone: formData.phone,
         persons: formData.persons,
-        total_amount: grandTotal,
         itinerary: itineraryLabel,
+        batch: selectedBatchId || null,
+        hold: hold?.id || null,
         batch_details: processedBatches[selectedBatchIdx]
           ? processedBatches[selectedBatchIdx].displayDate
           : "",
         occupancy_details: currentOption.occupancy || "Base Price",
         coupon_code: couponResult?.valid ? couponCode.trim() : "",
-        discount_amount: couponResult?.discount_amount || 0,
       };
 
       await createBooking(bookingPayload);
       alert("Booking created successfully! Redirecting to your bookings...");
       navigate("/my-bookings");
-    } catch {
-      alert("Failed to create booking. Please try again.");
+    } catch (err) {
+      alert(err.message || "Failed to create booking. Please try again.");
     } finally {
       setSubmitting(false);
     }
@@ -339,7 +400,7 @@ const BookingPage = () => {
 
                 <div className={styles.batchesGrid}>
                   {filteredBatches.map((batch) => {
-                    const status = batch.status || "Available";
+                    const status = batch.seatsLeft === 0 ? "Full" : batch.status || "Available";
                     const isFull = status === "Full";
                     const isFillingFast = status === "Filling Fast";
                     const isActive = selectedBatchIdx === batch.originalIndex;
@@ -376,6 +437,13 @@ const BookingPage = () => {
                     );
                   })}
                 </div>
+                {hold && (
+                  <span className={styles.occupancySubtext}>
+                    {hold.seats} seat{hold.seats > 1 ? "s" : ""} held for you until{" "}
+                    {new Date(hold.expires_at).toLocaleTimeString("en-IN", { hour: "2-digit", minute: "2-digit" })}
+                  </span>
+                )}
+                {holdError && <p className={styles.couponErrorMsg}>{holdError}</p>}
               </div>
             )}
 
@@ -634,7 +702,7 @@ const BookingPage = () => {
                 {couponResult?.valid && (
                   <div className={`${styles.costRow} ${styles.discountRow}`}>
                     <span>Coupon Discount</span>
-                    <span>-{formatPrice(couponResult.discount_amount)}</span>
+                    <span>-{formatPrice(discountAmount)}</span>
                   </div>
                 )}
 
@@ -14,6 +14,51 @@ export const fetchTrips = async (categorySlug = null) => {
   return response.json();
 };
 
+/**
+ * Full-text trip search (title, location, highlights, itinerary, ...).
+ * Every word matches as a prefix; results are best match first.
+ */
+export const searchTrips = async (query, limit = 20) => {
+  const params = new URLSearchParams({ q: query, limit: String(limit) });
+  const response = await fetch(`${API_BASE_URL}/v1/trips/search/?${params}`);
+
+  if (!response.ok) {
+    throw new Error("Failed to search trips");
+  }
+
+  return response.json();
+};
+
+/**
+ * Typeahead for the search box: popular places and trip titles matching
+ * what has been typed so far ([{ label, kind, trip_id }]).
+ */
+export const fetchSearchSuggestions = async (query, limit = 8) => {
+  const params = new URLSearchParams({ q: query, limit: String(limit) });
+  const response = await fetch(`${API_BASE_URL}/v1/trips/suggest/?${params}`);
+
+  if (!response.ok) {
+    throw new Error("Failed to fetch suggestions");
+  }
+
+  return response.json();
+};
+
+/**
+ * Facet counts for the filter sidebar. `filters` uses the same keys as the
+ * trip list, e.g. { price: "under-10k,10k-25k", month: "2026-12", is_himalayan_trek: "true" }.
+ */
+export const fetchTripFacets = async (filters = {}) => {
+  const params = new URLSearchParams(filters);
+  const response = await fetch(`${API_BASE_URL}/v1/trips/facets/?${params}`);
+
+  if (!response.ok) {
+    throw new Error("Failed to fetch trip facets");
+  }
+
+  return response.json();
+};
+
 export const fetchCategories = async () => {
   const response = await fetch(`${API_BASE_URL}/v1/categories/`);
   if (!response.ok) {
@@ -244,7 +289,9 @@ export const updateTrip = async (id, data) => {
   });
 
   if (!response.ok) {
-    throw new Error("Failed to update trip");
+    const errorData = await response.json().catch(() => ({}));
+    // e.g. a removed batch that still has bookings
+    throw new Error(errorData.batches?.[0] || "Failed to update trip");
   }
 
   return response.json();
@@ -421,12 +468,52 @@ export const createBooking = async (data) => {
   );
 
   if (!res.ok) {
-    throw new Error("Failed to create booking");
+    const body = await res.json().catch(() => ({}));
+    throw new Error(body.error || "Failed to create booking");
   }
 
   return res.json();
 };
 
+/**
+ * Set seats of a batch aside while the user checks out. Resolves to
+ * { id, batch, seats, expires_at }; rejects with the server's message
+ * (e.g. not enough seats left).
+ */
+export const createSeatHold = async (batchId, persons) => {
+  const token = localStorage.getItem("accessToken");
+
+  const res = await fetch(
+    `${import.meta.env.VITE_API_BASE_URL}/v1/bookings/holds/`,
+    {
+      method: "POST",
+      headers: {
+        "Content-Type": "application/json",
+        Authorization: `Bearer ${token}`,
+      },
+      body: JSON.stringify({ batch: batchId, persons }),
+    },
+  );
+
+  const body = await res.json().catch(() => ({}));
+  if (!res.ok) {
+    throw new Error(body.error || "Failed to hold seats");
+  }
+  return body;
+};
+
+export const releaseSeatHold = async (holdId) => {
+  const token = localStorage.getItem("accessToken");
+  try {
+    await fetch(`${import.meta.env.VITE_API_BASE_URL}/v1/bookings/holds/${holdId}/`, {
+      method: "DELETE",
+      headers: { Authorization: `Bearer ${token}` },
+    });
+  } catch {
+    // the hold expires on its own
+  }
+};
+
 export const fetchMyBookings = async () => {
   const token = localStorage.getItem("accessToken");
 
@@ -509,16 +596,17 @@ export const updateBookingStatus = async (id, status) => {
 // ─── Personalization ────────────────────────────────────────────────────────
 
 /**
- * Record that the current user viewed a trip (fire-and-forget, no throw).
- * Only sends if the user is logged in (access_token in localStorage).
+ * Record a trip view (fire-and-forget, no throw). Anonymous views count
+ * towards trending; logged-in ones also feed the user's recommendations.
  */
 export const recordTripView = async (tripId) => {
   const token = localStorage.getItem("access_token");
-  if (!token) return;
+  const headers = {};
+  if (token) headers.Authorization = `Bearer ${token}`;
   try {
     await fetch(`${API_BASE_URL}/v1/trips/${tripId}/view/`, {
       method: "POST",
-      headers: { Authorization: `Bearer ${token}` },
+      headers,
     });
   } catch {
     // silently ignore — non-critical telemetry
@@ -1299,6 +1387,28 @@ export const createAdminCoupon = async (data) => {
   return res.json();
 };
 
+/**
+ * Creates the coupons of a CSV file (header: code, discount_value and any of
+ * discount_type, max_discount, min_booking_amount, is_active, expiry_date,
+ * usage_limit, user, trip). All rows or none; resolves to { created }.
+ */
+export const importAdminCouponsCsv = async (file) => {
+  const token = localStorage.getItem("accessToken");
+  const body = new FormData();
+  body.append("file", file);
+  const res = await fetch(`${API_BASE_URL}/v1/admin/coupons/import/`, {
+    method: "POST",
+    headers: { Authorization: `Bearer ${token}` },
+    body,
+  });
+
+  if (!res.ok) {
+    const errorData = await res.json().catch(() => ({}));
+    throw new Error(errorData.detail || "Failed to import coupons");
+  }
+  return res.json();
+};
+
 export const updateAdminCoupon = async (id, data) => {
   const token = localStorage.getItem("accessToken");
   const res = await fetch(`${API_BASE_URL}/v1/admin/coupons/${id}/`, {
@@ -1328,6 +1438,25 @@ export const deleteAdminCoupon = async (id) => {
   return true;
 };
 
+/**
+ * Server-side price of a booking: { unit_price, amount, gst, subtotal,
+ * discount_amount, total_amount, coupon, seats_left, ... }.
+ * params: { persons, occupancy, batch, coupon }, all optional.
+ */
+export const fetchTripQuote = async (tripId, params = {}) => {
+  const token = localStorage.getItem("accessToken");
+  const query = new URLSearchParams(
+    Object.entries(params).filter(([, value]) => value !== undefined && value !== null && value !== "")
+  );
+  const headers = {};
+  if (token) headers.Authorization = `Bearer ${token}`;
+
+  const res = await fetch(`${API_BASE_URL}/v1/trips/${tripId}/quote/?${query}`, { headers });
+  const body = await res.json().catch(() => ({}));
+  if (!res.ok) throw new Error(body.error || "Failed to price booking");
+  return body;
+};
+
 export const fetchApplicableCoupons = async (tripId, bookingAmount) => {
   const token = localStorage.getItem("accessToken");
   const res = await fetch(